@@ -23,9 +23,7 @@ from ansible_collections.cisco.dnac.plugins.plugin_utils.dnac import (
     dnac_argument_spec,
     dnac_compare_equality,
     get_dict_result,
-)
-from ansible_collections.cisco.dnac.plugins.plugin_utils.exceptions import (
-    InconsistentParameters,
+    resolve_existing_object,
 )
 
 # Get common arguments specification
@@ -97,29 +95,7 @@ class Areas(object):
         return result
 
     def exists(self):
-        id_exists = False
-        name_exists = False
-        prev_obj = None
-        o_id = self.new_object.get("id")
-        name = self.new_object.get("name")
-        if o_id:
-            prev_obj = self.get_object_by_id(o_id)
-            id_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        if not id_exists and name:
-            prev_obj = self.get_object_by_name(name)
-            name_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        if name_exists:
-            _id = prev_obj.get("id")
-            if id_exists and name_exists and o_id != _id:
-                raise InconsistentParameters(
-                    "The 'id' and 'name' params don't refer to the same object"
-                )
-            if _id:
-                self.new_object.update(dict(id=_id))
-            if _id:
-                prev_obj = self.get_object_by_id(_id)
-        it_exists = prev_obj is not None and isinstance(prev_obj, dict)
-        return (it_exists, prev_obj)
+        return resolve_existing_object(self)
 
     def requires_update(self, current_obj):
         requested_obj = self.new_object
@@ -32,6 +32,7 @@ argument_spec.update(
         listOfUsers=dict(type="list"),
         certFilePath=dict(type="str"),
         pkFilePath=dict(type="str"),
+        fileChecksums=dict(type="list", elements="str", choices=["md5", "sha256"]),
     )
 )
 
@@ -92,6 +93,7 @@ class ActionModule(ActionBase):
             function="import_certificate",
             op_modifies=True,
             params=self.get_object(self._task.args),
+            checksums=self._task.args.get("fileChecksums"),
             file_paths=[
                 ("cert_file_path", "certFileUpload"),
                 ("pk_file_path", "pkFileUpload"),
@@ -32,6 +32,7 @@ argument_spec.update(
         pkPassword=dict(type="str", no_log=True),
         listOfUsers=dict(type="list"),
         p12FilePath=dict(type="str"),
+        fileChecksums=dict(type="list", elements="str", choices=["md5", "sha256"]),
     )
 )
 
@@ -92,6 +93,7 @@ class ActionModule(ActionBase):
             function="import_certificate_p12",
             op_modifies=True,
             params=self.get_object(self._task.args),
+            checksums=self._task.args.get("fileChecksums"),
             file_paths=[("p12_file_path", "p12FileUpload")],
         )
         self._result.update(dict(dnac_response=response))
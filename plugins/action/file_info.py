@@ -7,6 +7,8 @@
 from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
+import base64
+
 from ansible.plugins.action import ActionBase
 
 try:
@@ -33,6 +35,8 @@ argument_spec.update(
         saveFile=dict(type="bool"),
         filename=dict(type="str"),
         headers=dict(type="dict"),
+        dest=dict(type="path"),
+        checksum=dict(type="str", choices=["md5", "sha1", "sha256"]),
     )
 )
 
@@ -41,6 +45,8 @@ required_one_of = []
 mutually_exclusive = []
 required_together = []
 
+FILE_DOWNLOAD_PATH = "/dna/intent/api/v1/file/{fileId}"
+
 
 class ActionModule(ActionBase):
     def __init__(self, *args, **kwargs):
@@ -92,6 +98,19 @@ class ActionModule(ActionBase):
         dnac = DNACSDK(params=self._task.args)
 
         id = self._task.args.get("fileId")
+        dest = self._task.args.get("dest")
+        if id and dest:
+            # Stream the file to dest and only return its metadata
+            response = dnac.download_file(
+                FILE_DOWNLOAD_PATH.format(fileId=id),
+                dest,
+                filename=self._task.args.get("filename"),
+                checksum=self._task.args.get("checksum"),
+                headers=self._task.args.get("headers"),
+            )
+            self._result.update(dict(dnac_response=response))
+            self._result.update(dnac.exit_json())
+            return self._result
         if id:
             download_response = dnac.exec(
                 family="file",
@@ -99,11 +118,16 @@ class ActionModule(ActionBase):
                 params=self.get_object(self._task.args),
             )
             response = dict(
-                data=download_response.data.decode(encoding="utf-8"),
                 filename=download_response.filename,
                 dirpath=download_response.dirpath,
                 path=download_response.path,
             )
+            try:
+                response["data"] = download_response.data.decode(encoding="utf-8")
+            except UnicodeDecodeError:
+                # Binary files are returned base64 encoded
+                response["data"] = base64.b64encode(download_response.data).decode("ascii")
+                response["encoding"] = "base64"
             self._result.update(dict(dnac_response=response))
             self._result.update(dnac.exit_json())
             return self._result
@@ -33,6 +33,7 @@ argument_spec.update(
         thirdPartyImageFamily=dict(type="str"),
         thirdPartyApplicationType=dict(type="str"),
         filePath=dict(type="str"),
+        fileChecksums=dict(type="list", elements="str", choices=["md5", "sha256"]),
     )
 )
 
@@ -94,6 +95,7 @@ class ActionModule(ActionBase):
             function="import_local_software_image",
             op_modifies=True,
             params=self.get_object(self._task.args),
+            checksums=self._task.args.get("fileChecksums"),
             file_paths=[("file_path", "file")],
         )
         self._result.update(dict(dnac_response=response))
@@ -104,6 +104,67 @@ options:
       description: Specifies the interval in seconds between successive calls to the API to retrieve task details.
       type: int
       default: 2
+    dnac_task_poll_initial_delay:
+      description:
+        - Delay in seconds before the second poll of a task. Later delays grow by I(dnac_task_poll_backoff_factor).
+        - When not set, the C(DNAC_TASK_POLL_INITIAL_DELAY) environment variable is used, then the polling
+          profile of the task.
+        - Invalid or negative values are ignored.
+      type: float
+    dnac_task_poll_backoff_factor:
+      description:
+        - Factor applied to the delay between two polls of a task after every poll.
+        - When not set, the C(DNAC_TASK_POLL_BACKOFF_FACTOR) environment variable is used, then the polling
+          profile of the task.
+      type: float
+    dnac_task_poll_max_delay:
+      description:
+        - Upper bound in seconds of the delay between two polls of a task.
+        - When not set, the C(DNAC_TASK_POLL_MAX_DELAY) environment variable is used, then
+          I(dnac_task_poll_interval) or the polling profile of the task.
+      type: float
+    dnac_task_poll_jitter:
+      description:
+        - Random variation, as a fraction of the delay, applied between two polls of a task so concurrent
+          runs do not poll in lock-step.
+        - When not set, the C(DNAC_TASK_POLL_JITTER) environment variable is used, then the default of 0.1.
+      type: float
+    dnac_max_workers:
+      description:
+        - Number of concurrent API calls allowed when several Cisco Catalyst Center requests or tasks are handled
+          together, for example when several tasks are polled at once.
+        - When not set, the C(DNAC_MAX_WORKERS) environment variable is used, then the default of 1, one call at
+          a time.
+      type: int
+    dnac_rate_limit:
+      description:
+        - Maximum number of Cisco Catalyst Center API calls per second sent to the controller.
+        - The budget is shared by every task, fork and host of the run that targets the same
+          I(dnac_host) and I(dnac_port), through a lock file in C(~/.ansible/dnac_rate_limit)
+          or C(DNAC_RATE_LIMIT_DIR).
+        - When not set, the C(DNAC_RATE_LIMIT) environment variable is used. Calls are not throttled
+          when neither is set.
+      type: float
+    dnac_rate_limit_burst:
+      description:
+        - Number of calls that may be sent at once before I(dnac_rate_limit) applies.
+        - When not set, the C(DNAC_RATE_LIMIT_BURST) environment variable is used, then I(dnac_rate_limit)
+          rounded up.
+      type: int
+    dnac_rate_limit_retries:
+      description:
+        - Number of times a call answered with HTTP 429 or 503 is retried, after the delay given in its
+          C(Retry-After) header.
+        - When not set, the C(DNAC_RATE_LIMIT_RETRIES) environment variable is used, then the default of 3.
+      type: int
+    dnac_lookup_cache:
+      description:
+        - Cache the site, device, tag and software image name to ID lookups for the duration of the module run.
+        - C(DNAC_LOOKUP_CACHE_TTL) (default 300 seconds) and C(DNAC_LOOKUP_CACHE_SIZE) (default 1024) bound the age
+          and number of entries. Entries are dropped when the module creates, updates or deletes sites, devices, tags
+          or images, and the hit and miss counts are returned in C(lookup_cache).
+        - When not set, the C(DNAC_LOOKUP_CACHE) environment variable is used, then the default of false.
+      type: bool
     validate_response_schema:
         description:
           - Flag for Cisco DNA Center SDK to enable the validation of request bodies against a JSON schema.
@@ -54,6 +54,55 @@ options:
           - Flag for Cisco DNA Center SDK to enable the validation of request bodies against a JSON schema.
         type: bool
         default: true
+    dnac_session_cache:
+        description:
+          - Flag to reuse the Cisco DNA Center authentication token across tasks and hosts of a run.
+          - The token and its expiry are stored in a per-controller file readable only by its owner,
+            keyed on I(dnac_host), I(dnac_port), I(dnac_username) and I(dnac_version).
+          - An expired or rejected token is refreshed automatically.
+        type: bool
+        default: false
+    dnac_session_cache_dir:
+        description:
+          - Directory holding the I(dnac_session_cache) files.
+          - Defaults to C(~/.ansible/dnac_session_cache).
+        type: str
+    dnac_rate_limit:
+        description:
+          - Maximum number of Cisco DNA Center API calls per second sent to the controller.
+          - The budget is shared by every task, fork and host of the run that targets the same
+            I(dnac_host) and I(dnac_port), through a lock file in C(~/.ansible/dnac_rate_limit)
+            or C(DNAC_RATE_LIMIT_DIR).
+          - Calls are not throttled when unset.
+        type: float
+    dnac_rate_limit_burst:
+        description:
+          - Number of calls that may be sent at once before I(dnac_rate_limit) applies.
+          - Defaults to I(dnac_rate_limit) rounded up.
+        type: int
+    dnac_rate_limit_retries:
+        description:
+          - Number of times a call answered with HTTP 429 or 503 is retried, after the delay
+            given in its C(Retry-After) header.
+        type: int
+        default: 3
+    dnac_paginate:
+        description:
+          - Flag to fetch every page of the read APIs that support offset or cursor pagination.
+          - The items of all the pages are returned in a single I(dnac_response).
+          - Pages are requested until an empty page is returned.
+        type: bool
+        default: false
+    dnac_page_size:
+        description:
+          - Number of items requested per page when I(dnac_paginate=true), sent as the I(limit) of
+            APIs that accept one.
+          - Defaults to I(limit) when set. Otherwise no limit is sent and the API uses its own page size.
+        type: int
+    dnac_max_items:
+        description:
+          - Maximum number of items returned when I(dnac_paginate=true). All the items are returned when not set.
+        type: int
 notes:
     - "Supports C(check_mode)"
     - "The plugin runs on the control node and does not use any ansible connection plugins, but instead the embedded connection manager from Cisco DNAC SDK"
@@ -21,6 +21,21 @@ except ImportError:
     yaml = None
 from collections import OrderedDict
 
+# Count APIs used to prefetch the pages of unfiltered paginated GET requests concurrently
+PAGINATION_COUNT_FUNCTIONS = {
+    ("site_design", "get_sites"): "get_sites_count",
+    ("devices", "get_device_list"): "get_device_count",
+    ("sda", "get_fabric_sites"): "get_fabric_site_count",
+    ("sda", "get_fabric_zones"): "get_fabric_zone_count",
+    ("sda", "get_transit_networks"): "get_transit_networks_count",
+    ("sda", "get_layer3_virtual_networks"): "get_layer3_virtual_networks_count",
+}
+
+# Border line of the header written before every generated YAML block
+YAML_HEADER_BORDER = "# " + ("=" * 77)
+# Bytes read from the end of an append mode file at a time to find its last block
+YAML_TAIL_READ_SIZE = 64 * 1024
+
 if HAS_YAML:
 
     class OrderedDumper(yaml.Dumper):
@@ -1748,7 +1763,7 @@ class BrownFieldHelper:
         catalyst_center_ip = self.params.get("dnac_host", "Unknown")
         catalyst_center_version = self.params.get("dnac_version", "Unknown")
 
-        eq_border = "# " + ("=" * 77)
+        eq_border = YAML_HEADER_BORDER
         header_lines = [
             eq_border,
             "#           {0}".format(title_text),
@@ -1959,6 +1974,10 @@ class BrownFieldHelper:
         where new config blocks are appended without ---
         separators.
 
+        Only the block after the last generated header is read,
+        from the end of the file, so the cost does not grow with
+        the number of blocks appended before it.
+
         Note: For files containing multiple YAML documents
         (separated with ---), yaml.safe_load may fail because it
         expects a single document. In that case, this function
@@ -1985,11 +2004,10 @@ class BrownFieldHelper:
                 )
                 return None
 
-            with open(file_path, "r") as yaml_file:
-                content = yaml_file.read()
+            content = self._read_last_yaml_block(file_path)
 
             self.log(
-                "Successfully read file '{0}', content length: {1} characters".format(
+                "Successfully read the last block of file '{0}', content length: {1} characters".format(
                     file_path, len(content)
                 ),
                 "DEBUG",
@@ -2051,6 +2069,46 @@ class BrownFieldHelper:
             )
             return None
 
+    def _read_last_yaml_block(self, file_path):
+        """
+        Read the content following the last generated header of a YAML file.
+
+        The file is read backwards, YAML_TAIL_READ_SIZE bytes at first and
+        twice as many on every retry, until the closing border of a header is
+        found, so only the last appended block is loaded in memory.
+
+        Args:
+            file_path (str): Path to the YAML file.
+
+        Returns:
+            str: The text after the last header border, or the whole file
+                 content when it has no generated header.
+        """
+        marker = YAML_HEADER_BORDER.encode("utf-8")
+        with open(file_path, "rb") as yaml_file:
+            yaml_file.seek(0, os.SEEK_END)
+            file_size = yaml_file.tell()
+            read_size = YAML_TAIL_READ_SIZE
+            while True:
+                offset = max(file_size - read_size, 0)
+                yaml_file.seek(offset)
+                tail = yaml_file.read()
+                position = tail.rfind(marker)
+                if position != -1 or offset == 0:
+                    break
+                read_size *= 2
+
+        if position != -1:
+            line_end = tail.find(b"\n", position)
+            tail = tail[line_end + 1:] if line_end != -1 else b""
+
+        self.log(
+            "Read {0} of {1} bytes from the end of '{2}' to get its last "
+            "YAML block.".format(len(tail), file_size, file_path),
+            "DEBUG",
+        )
+        return tail.decode("utf-8")
+
     def strip_comment_lines(self, content):
         """
         Return content lines with all comment lines removed.
@@ -2698,6 +2756,8 @@ class BrownFieldHelper:
         offset=1,
         limit=500,
         use_strings=False,
+        count_function=None,
+        count_params=None,
     ):
         """
         Executes a paginated GET request using the specified API family, function, and parameters.
@@ -2708,8 +2768,15 @@ class BrownFieldHelper:
             offset (int, optional): Starting offset for pagination. Defaults to 1.
             limit (int, optional): Maximum number of records to retrieve per page. Defaults to 500.
             use_strings (bool, optional): Whether to use string values for offset and limit. Defaults to False.
+            count_function (str, optional): '*_count' API of the same family giving the total number of records.
+                Defaults to the PAGINATION_COUNT_FUNCTIONS entry when 'params' has no filters.
+            count_params (dict, optional): Filters passed to 'count_function'.
         Returns:
             list: A list of dictionaries containing the retrieved data based on the filtering parameters.
+        Description:
+            When more than one worker is allowed ('dnac_max_workers' or DNAC_MAX_WORKERS) and the first page
+            is full, the total is read from the count API and the remaining pages are fetched concurrently,
+            preserving their order. Without a count API the pages are fetched one after another.
         """
         self.log(
             "Starting paginated API execution for family '{0}', function '{1}'".format(
@@ -2730,6 +2797,33 @@ class BrownFieldHelper:
             )
             return updated_params
 
+        def fetch_page(page_offset):
+            """Fetch the records of a single page."""
+            try:
+                response = self.dnac._exec(
+                    family=api_family,
+                    function=api_function,
+                    op_modifies=False,
+                    params=update_params(page_offset, current_limit),
+                )
+            except Exception as e:
+                self.msg = (
+                    "An error occurred while retrieving data using family '{0}', function '{1}'. "
+                    "Error: {2}".format(api_family, api_function, str(e))
+                )
+                self.fail_and_exit(self.msg)
+
+            self.log("Response received for family '%s', function '%s' at offset %s: %s",
+                     "DEBUG", api_family, api_function, page_offset, response)
+            page_data = response.get("response") if isinstance(response, dict) else None
+            if isinstance(page_data, dict):
+                return [page_data]
+
+            return page_data or []
+
+        if count_function is None and not params:
+            count_function = PAGINATION_COUNT_FUNCTIONS.get((api_family, api_function))
+
         try:
             # Initialize results list and keep offset/limit as integers for arithmetic
             if not params:
@@ -2823,6 +2917,18 @@ class BrownFieldHelper:
                     )
                     break
 
+                if count_function and self.get_max_workers() > 1:
+                    total = self.get_api_count(api_family, count_function, count_params)
+                    if total is not None:
+                        results.extend(
+                            self.fetch_pages_concurrently(
+                                fetch_page, int(current_offset), int(current_limit), total
+                            )
+                        )
+                        break
+
+                    count_function = None
+
                 # Increment the offset for the next iteration (always use integer arithmetic)
                 current_offset = int(current_offset) + int(current_limit)
 
@@ -3035,13 +3141,16 @@ class BrownFieldHelper:
         """
 
         self.log("Retrieving site name hierarchy for all sites.", "DEBUG")
-        self.log("Executing 'get_sites' API call to retrieve all sites.", "DEBUG")
-        site_id_name_mapping = {}
-
-        api_family, api_function, params = "site_design", "get_sites", {}
-        site_details = self.execute_get_with_pagination(
-            api_family, api_function, params
-        )
+        found, site_id_name_mapping = self.get_cached_lookup("site", "site_id_name_mapping")
+        site_details = []
+        if not found:
+            self.log("Executing 'get_sites' API call to retrieve all sites.", "DEBUG")
+            site_id_name_mapping = {}
+
+            api_family, api_function, params = "site_design", "get_sites", {}
+            site_details = self.execute_get_with_pagination(
+                api_family, api_function, params
+            )
 
         ccc_version = self.get_ccc_version()
         for site in site_details:
@@ -3064,6 +3173,9 @@ class BrownFieldHelper:
                     )
                     site_id_name_mapping[site_id] = site.get("nameHierarchy")
 
+        if not found:
+            self.cache_lookup("site", "site_id_name_mapping", site_id_name_mapping)
+
         if site_id_list:
             filtered_mapping = {
                 site_id: site_id_name_mapping[site_id]
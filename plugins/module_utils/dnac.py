@@ -19,6 +19,20 @@ else:
     DNAC_SDK_IS_INSTALLED = True
 from ansible.module_utils.common.text.converters import to_native
 from ansible.module_utils.common import validation
+from ansible_collections.cisco.dnac.plugins.module_utils.validation import (
+    COMPILED_SPECS_MAX,
+    compile_choices_check,
+    freeze_spec,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac_client import (
+    DNAC_RATE_LIMIT_RETRIES,
+    RATE_LIMIT_RETRY_AFTER,
+    MultipartUpload,
+    call_with_rate_limit,
+    create_dnac_api,
+    create_rate_limiter,
+    get_cached_dnac_api,
+)
 from abc import ABCMeta, abstractmethod
 try:
     import logging
@@ -27,13 +41,24 @@ except ImportError:
     LOGGING_IN_STANDARD = False
 else:
     LOGGING_IN_STANDARD = True
+try:
+    import yaml
+except ImportError:
+    yaml = None
 import os.path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 import copy
+import functools
 import json
 # import datetime
 import inspect
+import math
+import random
 import re
 import socket
+import sys
+import threading
 import time
 import traceback
 
@@ -119,12 +144,11 @@ class DnacBase():
             self.logger = logging.getLogger('empty_logger')
             self.logger.addHandler(logging.NullHandler())
 
-        masked_config = copy.deepcopy(dnac_params)
-        masked_config = self.get_safe_log_config(masked_config)
-
-        self.log('Cisco Catalyst Center parameters: {0}'.format(masked_config), "DEBUG")
+        self.log(lambda: 'Cisco Catalyst Center parameters: {0}'.format(
+            self.get_safe_log_config(copy.deepcopy(dnac_params))), "DEBUG")
         self.supported_states = ["merged", "queried", "deleted", "replaced", "overridden", "gathered", "rendered", "parsed"]
         self.result = {"changed": False, "diff": [], "response": [], "warnings": []}
+        self.lookup_cache = self.create_lookup_cache()
 
     def compare_dnac_versions(self, version1, version2):
         """
@@ -307,25 +331,36 @@ class DnacBase():
         if not os.path.exists(log_directory):
             raise FileNotFoundError("The directory for log file '{0}' does not exist.".format(dnac_log_file_path))
 
-    def log(self, message, level="WARNING", frameIncrement=0):
+    def log(self, message, level="WARNING", *args, frameIncrement=0):
         """Logs formatted messages with specified log level and incrementing the call stack frame
         Args:
             self (obj, required): An instance of the DnacBase Class.
-            message (str, required): The log message to be recorded.
+            message (str or callable, required): The log message to be recorded, or a callable returning it.
             level (str, optional): The log level, default is "info".
                                    The log level can be one of 'DEBUG', 'INFO', 'WARNING', 'ERROR', or 'CRITICAL'.
+            *args: Optional '%' style arguments merged into the message.
+            frameIncrement (int, optional): Number of extra frames to skip when reporting the caller.
+        Description:
+            Nothing is formatted when 'dnac_log' is disabled or the level is below 'dnac_log_level',
+            so large API payloads should be passed as '%' arguments or through a callable
+            rather than formatted by the caller.
         """
 
-        if self.dnac_log:
-            # of.write("---- %s ---- %s@%s ---- %s \n" % (d, info.lineno, info.function, msg))
-            # message = "Module: " + self.__class__.__name__ + ", " + message
-            class_name = self.__class__.__name__
-            callerframerecord = inspect.stack()[1 + frameIncrement]
-            frame = callerframerecord[0]
-            info = inspect.getframeinfo(frame)
-            log_message = " %s: %s: %s: %s \n" % (class_name, info.function, info.lineno, message)
-            log_method = getattr(self.logger, level.lower())
-            log_method(log_message)
+        if not self.dnac_log:
+            return
+
+        log_level = getattr(logging, level.upper(), logging.WARNING)
+        if not self.logger.isEnabledFor(log_level):
+            return
+
+        if callable(message):
+            message = message()
+        if args:
+            message = message % args
+
+        frame = sys._getframe(1 + frameIncrement)
+        log_message = " %s: %s: %s: %s \n" % (self.__class__.__name__, frame.f_code.co_name, frame.f_lineno, message)
+        self.logger.log(log_level, log_message)
 
     def check_return_status(self):
         """API to check the return status value and exit/fail the module"""
@@ -337,6 +372,10 @@ class DnacBase():
             "Line No: {line_no} status: {status}, msg: {msg}"
             .format(line_no=line_no, status=self.status, msg=self.msg), "DEBUG"
         )
+        if getattr(WORKER_CONTEXT, "active", False) and ("failed" in self.status or "invalid" in self.status):
+            # Leave the exit to the main thread, see run_concurrently
+            raise WorkerFailure(self.msg, self.result.get('response', []))
+
         if "failed" in self.status:
             self.module.fail_json(msg=self.msg, response=self.result.get('response', []))
         elif "exited" in self.status:
@@ -402,10 +441,292 @@ class DnacBase():
                        "dnac_log": params.get("dnac_log"),
                        "dnac_log_level": params.get("dnac_log_level"),
                        "dnac_log_file_path": params.get("dnac_log_file_path"),
-                       "dnac_log_append": params.get("dnac_log_append")
+                       "dnac_log_append": params.get("dnac_log_append"),
+                       "dnac_session_cache": params.get("dnac_session_cache"),
+                       "dnac_session_cache_dir": params.get("dnac_session_cache_dir"),
+                       "dnac_rate_limit": params.get("dnac_rate_limit"),
+                       "dnac_rate_limit_burst": params.get("dnac_rate_limit_burst"),
+                       "dnac_rate_limit_retries": params.get("dnac_rate_limit_retries")
                        }
         return dnac_params
 
+    def get_task_poller(self, task_name=None):
+        """
+        Create the poller used to wait between successive task status checks.
+        Args:
+            task_name (str): The task or API name, used to pick the polling profile.
+        Returns:
+            TaskPoller: A poller capped by 'dnac_task_poll_interval' and 'dnac_api_task_timeout'.
+        Description:
+            The strategy can be tuned with the optional 'dnac_task_poll_initial_delay',
+            'dnac_task_poll_backoff_factor', 'dnac_task_poll_max_delay' and 'dnac_task_poll_jitter'
+            parameters, or their DNAC_TASK_POLL_* environment variable counterparts. Values that are
+            not non-negative numbers are logged and ignored, keeping the profile default.
+        """
+        overrides = {}
+        for setting in ("initial_delay", "backoff_factor", "max_delay", "jitter"):
+            value = self.params.get("dnac_task_poll_" + setting)
+            if value is None:
+                value = os.environ.get("DNAC_TASK_POLL_" + setting.upper())
+            if value is None:
+                continue
+
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                number = None
+
+            if number is None or number < 0 or math.isnan(number):
+                self.log("Ignoring the invalid task poll setting '{0}': '{1}', the default is used instead."
+                         .format(setting, value), "WARNING")
+                continue
+
+            overrides[setting] = number
+
+        return TaskPoller.for_task(task_name, self.params.get("dnac_task_poll_interval"),
+                                   self.max_timeout, overrides)
+
+    def get_max_workers(self):
+        """
+        Number of worker threads allowed for concurrent Catalyst Center calls.
+        Returns:
+            int: The 'dnac_max_workers' parameter or the DNAC_MAX_WORKERS environment variable,
+            1 (no concurrency) when neither is set.
+        """
+        value = self.params.get("dnac_max_workers")
+        if value is None:
+            value = os.environ.get("DNAC_MAX_WORKERS")
+        try:
+            return max(int(value), 1)
+        except (TypeError, ValueError):
+            return 1
+
+    def get_upload_checksums(self):
+        """
+        Checksums computed while files are uploaded to Catalyst Center.
+        Returns:
+            list: The algorithms ('md5', 'sha256') listed, comma separated, in the
+            DNAC_UPLOAD_CHECKSUMS environment variable; empty when it is not set.
+        """
+        checksums = os.environ.get("DNAC_UPLOAD_CHECKSUMS") or ""
+        return [algorithm.strip().lower() for algorithm in checksums.split(",") if algorithm.strip()]
+
+    def watch_tasks(self, task_ids, task_name=None, **kwargs):
+        """
+        Create a TaskWatcher that waits on several task IDs with a single polling loop.
+        Args:
+            task_ids (list): The task IDs to wait on.
+            task_name (str): The task name, used for logging and to pick the polling profile.
+            **kwargs: Extra TaskWatcher options ('timeout', 'legacy_api', 'progress_validation',
+                      'require_end_time').
+        Returns:
+            TaskWatcher: The watcher, iterate over watch() to get completions as they arrive.
+        """
+        kwargs.setdefault("max_workers", self.get_max_workers())
+        return TaskWatcher(self, task_ids, task_name, **kwargs)
+
+    def schedule_rollout(self, items, start, task_name=None, **kwargs):
+        """
+        Create a RolloutScheduler that runs 'start' on every item within a sliding window of tasks.
+        Args:
+            items (list): The items to roll the operation out to, for example device UUIDs.
+            start (callable): Triggers the operation on one item and returns its task ID.
+            task_name (str): The task name, used for logging and to pick the polling profile.
+            **kwargs: Extra RolloutScheduler options ('max_concurrent', 'failure_budget',
+                      'task_timeout', 'state_file', 'run_id', 'item_key') and TaskWatcher options.
+        Returns:
+            RolloutScheduler: The scheduler, call run() to execute the rollout.
+        """
+        return RolloutScheduler(self, items, start, task_name=task_name, **kwargs)
+
+    def create_lookup_cache(self):
+        """
+        Create the run-scoped cache of the site, device and tag name to ID lookups.
+        Returns:
+            LookupCache or None: The cache when enabled with the 'dnac_lookup_cache' parameter or the
+            DNAC_LOOKUP_CACHE environment variable, None otherwise.
+        Description:
+            Entries expire after DNAC_LOOKUP_CACHE_TTL seconds (default 300) and at most
+            DNAC_LOOKUP_CACHE_SIZE entries (default 1024) are kept, least recently used first out.
+            Any create, update or delete call on the sites, devices or tags APIs clears the matching
+            entries, and the hit/miss counters are reported under 'lookup_cache' in the module result.
+        """
+        enabled = self.params.get("dnac_lookup_cache")
+        if enabled is None:
+            enabled = os.environ.get("DNAC_LOOKUP_CACHE", False)
+        try:
+            enabled = validation.check_type_bool(enabled)
+        except TypeError:
+            enabled = False
+        if not enabled:
+            return None
+
+        lookup_cache = LookupCache(
+            ttl=float(os.environ.get("DNAC_LOOKUP_CACHE_TTL", DEFAULT_LOOKUP_CACHE_TTL)),
+            max_size=int(os.environ.get("DNAC_LOOKUP_CACHE_SIZE", DEFAULT_LOOKUP_CACHE_SIZE)),
+        )
+        self.dnac.mutation_listener = lookup_cache.invalidate_for_api
+        self.result["lookup_cache"] = lookup_cache.stats
+        return lookup_cache
+
+    def get_cached_lookup(self, namespace, key):
+        """
+        Look up a previously resolved value.
+        Args:
+            namespace (str): The kind of lookup, 'site', 'device', 'tag' or 'image'.
+            key (hashable): The lookup key within the namespace.
+        Returns:
+            tuple: (found, value), found is False when the cache is disabled or has no live entry.
+        """
+        if self.lookup_cache is None:
+            return False, None
+
+        found, value = self.lookup_cache.get(namespace, key)
+        if found:
+            self.log("Lookup cache hit for {0} '{1}'.".format(namespace, key), "DEBUG")
+        return found, value
+
+    def cache_lookup(self, namespace, key, value):
+        """Remember a resolved value, lookups that found nothing are not cached."""
+        if self.lookup_cache is not None and value is not None:
+            self.lookup_cache.put(namespace, key, value)
+
+    def invalidate_lookup_cache(self, namespace=None):
+        """Drop the cached lookups of one namespace, or all of them."""
+        if self.lookup_cache is not None:
+            self.lookup_cache.invalidate(namespace)
+
+    def run_concurrently(self, func, items, max_workers=None):
+        """
+        Call 'func' for every item on a bounded thread pool.
+        Args:
+            func (callable): Function called with one item.
+            items (list): The items to process.
+            max_workers (int): Size of the pool, 'get_max_workers()' when not given.
+        Returns:
+            list: The results, in the order of 'items'.
+        Description:
+            The calls run one after another when a single worker is allowed, so the API
+            call order is the same as a plain loop.
+            On the pool, a worker that fails the module through 'check_return_status' or
+            'fail_and_exit' raises a WorkerFailure instead of exiting from its thread. Once every
+            worker has finished, the first failure, in the order of 'items', fails the module from
+            the calling thread, and any other exception is raised again there.
+        """
+        items = list(items)
+        max_workers = min(max_workers or self.get_max_workers(), len(items))
+        if max_workers <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.run_as_worker, func, item) for item in items]
+            wait(futures)
+
+        return [self.get_worker_result(future) for future in futures]
+
+    def run_as_worker(self, func, *args, **kwargs):
+        """
+        Call 'func' on a pool thread, where a module failure raises a WorkerFailure instead of exiting.
+        Args:
+            func (callable): The function to call.
+            *args, **kwargs: Its arguments.
+        Returns:
+            The value returned by 'func'.
+        Description:
+            Submit 'self.run_as_worker' with the function to any thread pool, then read the futures
+            with 'get_worker_result' once the pool has finished.
+        """
+        was_active = getattr(WORKER_CONTEXT, "active", False)
+        WORKER_CONTEXT.active = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            WORKER_CONTEXT.active = was_active
+
+    def get_worker_result(self, future):
+        """
+        Return the result of a completed 'run_as_worker' future, failing the module from the
+        calling thread when the worker failed it. Any other exception is raised again.
+        """
+        try:
+            return future.result()
+        except WorkerFailure as error:
+            return self.fail_for_worker_failure(error)
+
+    def fail_for_worker_failure(self, error):
+        """Fail the module with the WorkerFailure raised by a worker, unless still inside a worker."""
+        if getattr(WORKER_CONTEXT, "active", False):
+            # Nested in another worker, the failure is reported by its pool
+            raise error
+
+        self.msg = error.msg
+        self.set_operation_result("failed", False, error.msg, "ERROR", error.response).check_return_status()
+
+    def get_api_count(self, api_family, count_function, params=None):
+        """
+        Retrieve the total number of records from a '*_count' API.
+        Args:
+            api_family (str): The API family of the count function.
+            count_function (str): The count function, for example 'get_device_count'.
+            params (dict): Filters passed to the count function.
+        Returns:
+            int or None: The count, None when the API is not available or returned no count.
+        """
+        try:
+            response = self.dnac._exec(
+                family=api_family,
+                function=count_function,
+                op_modifies=False,
+                params=params or {},
+            )
+        except Exception as e:
+            self.log("Unable to get the count from '{0}': {1}".format(count_function, str(e)), "WARNING")
+            return None
+
+        count = response.get("response") if isinstance(response, dict) else None
+        if isinstance(count, dict):
+            count = count.get("count")
+        if isinstance(count, bool) or not isinstance(count, int):
+            return None
+
+        self.log("Count returned by '{0}': {1}".format(count_function, count), "DEBUG")
+        return count
+
+    def fetch_pages_concurrently(self, fetch_page, offset, limit, total, first_index=1):
+        """
+        Fetch the pages that follow a full page once the total number of records is known.
+        Args:
+            fetch_page (callable): Called with a page offset, returns the list of records of that page.
+            offset (int): Offset of the page already fetched.
+            limit (int): Page size.
+            total (int): Total number of records, usually from a '*_count' API.
+            first_index (int): Offset of the first record, 1 for most Catalyst Center APIs.
+        Returns:
+            list: The records of the following pages, in order.
+        Description:
+            All the remaining offsets are computed up front and fetched with 'run_concurrently'.
+            If the last page is still full, because records were added after the count was read,
+            the next pages are fetched one at a time until a short page is returned.
+        """
+        offsets = list(range(offset + limit, first_index + total, limit))
+        self.log("Fetching {0} page(s) of {1} record(s) concurrently for a total of {2} record(s).".format(
+            len(offsets), limit, total), "DEBUG")
+
+        records = []
+        last_page_full = True
+        for page in self.run_concurrently(fetch_page, offsets):
+            records.extend(page)
+            last_page_full = len(page) >= limit
+
+        next_offset = (offsets[-1] if offsets else offset) + limit
+        while last_page_full:
+            page = fetch_page(next_offset)
+            records.extend(page)
+            last_page_full = len(page) >= limit
+            next_offset += limit
+
+        return records
+
     def get_task_details(self, task_id):
         """
         Get the details of a specific task in Cisco Catalyst Center.
@@ -426,8 +747,8 @@ class DnacBase():
                 params={"task_id": task_id},
                 op_modifies=True,
             )
-            self.log("Retrieving task details by the API 'get_task_by_id' using task ID: {0}, Response: {1}"
-                     .format(task_id, response), "DEBUG")
+            self.log("Retrieving task details by the API 'get_task_by_id' using task ID: %s, Response: %s",
+                     "DEBUG", task_id, response)
 
             if not isinstance(response, dict):
                 self.log("Failed to retrieve task details for task ID: {}".format(task_id), "ERROR")
@@ -497,10 +818,9 @@ class DnacBase():
             return self
 
         task_id = response.get("taskId")
-        start_time = time.time()
+        poller = self.get_task_poller(api_name)
         while True:
-            end_time = time.time()
-            if (end_time - start_time) >= self.max_timeout:
+            if poller.is_timed_out():
                 self.msg = "Max timeout of {max_timeout} sec has reached for the task id '{task_id}'. " \
                            .format(max_timeout=self.max_timeout, task_id=task_id) + \
                            "Exiting the loop due to unexpected API '{api_name}' status.".format(api_name=api_name)
@@ -509,7 +829,7 @@ class DnacBase():
                 break
 
             task_details = self.get_task_details(task_id)
-            self.log('Getting task details from task ID {0}: {1}'.format(task_id, task_details), "DEBUG")
+            self.log('Getting task details from task ID %s: %s', "DEBUG", task_id, task_details)
 
             if task_details.get("isError") is True:
                 if task_details.get("failureReason"):
@@ -521,6 +841,7 @@ class DnacBase():
                 else:
                     self.msg = str(task_details.get("progress"))
                 self.status = "failed"
+                poller.done()
                 break
 
             if validation_string in task_details.get("progress").lower():
@@ -528,9 +849,11 @@ class DnacBase():
                 if data is True:
                     self.msg = task_details.get("data")
                 self.status = "success"
+                poller.done()
                 break
 
-            self.log("Progress is {0} for task ID: {1}".format(task_details.get('progress'), task_id), "DEBUG")
+            self.log("Progress is %s for task ID: %s", "DEBUG", task_details.get('progress'), task_id)
+            poller.wait()
 
         return self
 
@@ -555,8 +878,8 @@ class DnacBase():
                 function='get_business_api_execution_details',
                 params={"execution_id": exec_id}
             )
-            self.log("Successfully retrieved execution details by the API 'get_business_api_execution_details' for execution ID: {0}, Response: {1}"
-                     .format(exec_id, response), "DEBUG")
+            self.log("Successfully retrieved execution details by the API 'get_business_api_execution_details' for execution ID: %s, Response: %s",
+                     "DEBUG", exec_id, response)
         except Exception as e:
             # Log an error message and fail if an exception occurs
             self.log_traceback()
@@ -593,10 +916,9 @@ class DnacBase():
             return self
 
         execution_id = response.get("executionId")
-        start_time = time.time()
+        poller = self.get_task_poller(api_name)
         while True:
-            end_time = time.time()
-            if (end_time - start_time) >= self.max_timeout:
+            if poller.is_timed_out():
                 self.msg = "Max timeout of {max_timeout} sec has reached for the execution id '{execution_id}'. "\
                            .format(max_timeout=self.max_timeout, execution_id=execution_id) + \
                            "Exiting the loop due to unexpected API '{api_name}' status.".format(api_name=api_name)
@@ -609,13 +931,17 @@ class DnacBase():
                 self.result['changed'] = True
                 self.msg = "Successfully executed"
                 self.status = "success"
+                poller.done()
                 break
 
             if execution_details.get("bapiError"):
                 self.msg = execution_details.get("bapiError")
                 self.status = "failed"
+                poller.done()
                 break
 
+            poller.wait()
+
         return self
 
     def check_string_dictionary(self, task_details_data):
@@ -658,7 +984,7 @@ class DnacBase():
                     if item["nameSpace"] == "Location":
                         site_type = item.get("attributes").get("type")
             else:
-                self.log("Received API response from 'get_sites': {0}".format(str(response)), "DEBUG")
+                self.log("Received API response from 'get_sites': %s", "DEBUG", response)
                 site = response.get("response")
                 site_type = site[0].get("type")
 
@@ -798,7 +1124,7 @@ class DnacBase():
 
         # Retrieve the list of device details from the specified site
         device_details_list = self.get_device_details_from_site(site_name, site_id)
-        self.log("Device details retrieved for site ID: '{0}': {1}".format(site_id, device_details_list), "DEBUG")
+        self.log("Device details retrieved for site ID: '%s': %s", "DEBUG", site_id, device_details_list)
 
         # Iterate through each device's details
         for device_info in device_details_list:
@@ -849,6 +1175,10 @@ class DnacBase():
         """
         self.log("Initiating retrieval of site details for site name: '{0}'.".
                  format(site_name), "DEBUG")
+        found, site_response = self.get_cached_lookup("site", (site_name, limit))
+        if found:
+            return site_response
+
         response_all = []
         offset = 1
         api_family, api_function, param_key = None, None, None
@@ -883,6 +1213,16 @@ class DnacBase():
                          format(limit), "DEBUG")
                 break
 
+            if api_function == "get_sites" and self.get_max_workers() > 1:
+                total = self.get_api_count(api_family, "get_sites_count")
+                if total is not None:
+                    def fetch_page(page_offset):
+                        page = self.execute_get_request(api_family, api_function, dict(request_params, offset=page_offset))
+                        return (page or {}).get("response") or []
+
+                    response_all.extend(self.fetch_pages_concurrently(fetch_page, offset, limit, total))
+                    break
+
             offset += limit
             request_params["offset"] = offset  # Increment offset for pagination
             self.log("Incrementing offset to {0} for next API request.".format(
@@ -896,6 +1236,7 @@ class DnacBase():
         else:
             self.log("No site details found for site name: '{0}'.".format(site_name), "WARNING")
 
+        self.cache_lookup("site", (site_name, limit), site_response)
         return site_response
 
     def get_site_id(self, site_name):
@@ -923,7 +1264,7 @@ class DnacBase():
                 )
                 self.fail_and_exit(self.msg)
 
-            self.log("Site details retrieved for site '{0}'': {1}".format(site_name, str(response)), "DEBUG")
+            self.log("Site details retrieved for site '%s'': %s", "DEBUG", site_name, response)
             site = response.get("response")
             site_id = site[0].get("id")
             site_exists = True
@@ -994,7 +1335,7 @@ class DnacBase():
                         "payload": param
                     },
                 )
-                self.log("Received API response: {0}".format(response), "DEBUG")
+                self.log("Received API response: %s", "DEBUG", response)
 
                 self.check_execution_response_status(response, "assign_devices_to_site")
                 if self.status == "success":
@@ -1153,6 +1494,84 @@ class DnacBase():
 
         return new_config
 
+    def resolve_devices(self, attribute, values):
+        """
+        Resolve devices from one identity attribute with batched 'get_device_list' queries.
+        Args:
+            attribute (str): The device attribute of the values, one of 'hostname', 'managementIpAddress',
+                             'macAddress', 'serialNumber' or 'id'.
+            values (list): The attribute values to resolve.
+        Returns:
+            dict: Maps each value to the identity of the device ('id', 'hostname', 'managementIpAddress',
+                  'macAddress' and 'serialNumber'), or None when no device was found.
+        Description:
+            The values are sent DEVICE_LOOKUP_BATCH_SIZE at a time as multi-value filters of 'get_device_list'.
+            Every device returned is indexed on all its identity attributes, so resolving the same device
+            by another attribute later in the run is served from the lookup cache when it is enabled.
+        """
+        resolved = {}
+        pending = []
+        for value in values:
+            if value in resolved or value in pending:
+                continue
+
+            found, device = self.get_cached_lookup("device", (attribute, str(value).lower()))
+            if found:
+                resolved[value] = device
+            else:
+                pending.append(value)
+
+        for index in range(0, len(pending), DEVICE_LOOKUP_BATCH_SIZE):
+            batch = pending[index:index + DEVICE_LOOKUP_BATCH_SIZE]
+            if attribute == "id" or len(batch) == 1:
+                filter_value = ",".join(str(value) for value in batch)
+            else:
+                filter_value = batch
+
+            try:
+                response = self.dnac._exec(
+                    family="devices",
+                    function="get_device_list",
+                    op_modifies=False,
+                    params={DEVICE_IDENTITY_ATTRIBUTES[attribute]: filter_value}
+                )
+                self.log("Received API response from 'get_device_list' for %s %s: %s", "DEBUG", attribute, batch, response)
+            except Exception as e:
+                self.log("Exception occurred while fetching the devices for {0} {1}: {2}".format(attribute, batch, str(e)), "ERROR")
+                response = None
+
+            devices = response.get("response") if isinstance(response, dict) else None
+            if not isinstance(devices, list):
+                devices = None
+            device_index = self.index_device_identities(devices or [])
+            for value in batch:
+                device = device_index.get((attribute, str(value).lower()))
+                if device is None and len(batch) == 1 and devices:
+                    # A single value query returns the matching device(s) only
+                    device = dict((key, devices[0].get(key)) for key in DEVICE_IDENTITY_ATTRIBUTES)
+                resolved[value] = device
+
+        return resolved
+
+    def index_device_identities(self, devices):
+        """
+        Index device records on each of their identity attributes.
+        Args:
+            devices (list): Device records returned by 'get_device_list'.
+        Returns:
+            dict: Maps (attribute, lowercase value) to the identity of the device.
+        """
+        device_index = {}
+        for device in devices:
+            identity = dict((attribute, device.get(attribute)) for attribute in DEVICE_IDENTITY_ATTRIBUTES)
+            for attribute, value in identity.items():
+                if value:
+                    key = (attribute, str(value).lower())
+                    device_index[key] = identity
+                    self.cache_lookup("device", key, identity)
+
+        return device_index
+
     def get_device_ips_from_hostnames(self, hostnames):
         """
         Get the list of unique device IPs for list of specified hostnames of devices in Cisco Catalyst Center.
@@ -1166,39 +1585,17 @@ class DnacBase():
             list of hostnames. If a device is not found in Cisco Catalyst Center, an error log message is printed.
         """
 
-        self.log("Entering 'get_device_ips_from_hostnames' with hostname_list: {0}".format(str(hostnames)), "INFO")
+        self.log("Entering 'get_device_ips_from_hostnames' with hostnames: {0}".format(str(hostnames)), "INFO")
+        devices = self.resolve_devices("hostname", hostnames)
         device_ip_mapping = {}
 
         for hostname in hostnames:
-            try:
-                response = self.dnac._exec(
-                    family="devices",
-                    function='get_device_list',
-                    op_modifies=True,
-                    params={"hostname": hostname}
-                )
-                if response:
-                    self.log("Received API response for hostname '{0}': {1}".format(hostname, str(response)), "DEBUG")
-                    response = response.get("response")
-                    if response:
-                        device_ip = response[0]["managementIpAddress"]
-                        if device_ip:
-                            device_ip_mapping[hostname] = device_ip
-                            self.log("Added device IP '{0}' for hostname '{1}'.".format(device_ip, hostname), "INFO")
-                        else:
-                            device_ip_mapping[hostname] = None
-                            self.log("No management IP found for hostname '{0}'.".format(hostname), "WARNING")
-                    else:
-                        device_ip_mapping[hostname] = None
-                        self.log("No response received for hostname '{0}'.".format(hostname), "WARNING")
-                else:
-                    device_ip_mapping[hostname] = None
-                    self.log("No response received from 'get_device_list' for hostname '{0}'.".format(hostname), "ERROR")
-
-            except Exception as e:
-                error_message = "Exception occurred while fetching device IP for hostname '{0}': {1}".format(hostname, str(e))
-                self.log(error_message, "ERROR")
-                device_ip_mapping[hostname] = None
+            device_ip = (devices.get(hostname) or {}).get("managementIpAddress")
+            device_ip_mapping[hostname] = device_ip or None
+            if device_ip:
+                self.log("Added device IP '{0}' for hostname '{1}'.".format(device_ip, hostname), "INFO")
+            else:
+                self.log("No device IP found for hostname '{0}'.".format(hostname), "WARNING")
 
         self.log("Exiting 'get_device_ips_from_hostnames' with device IP mapping: {0}".format(device_ip_mapping), "INFO")
         return device_ip_mapping
@@ -1217,39 +1614,16 @@ class DnacBase():
         """
 
         self.log("Entering 'get_device_ips_from_serial_numbers' with serial_numbers: {0}".format(str(serial_numbers)), "INFO")
+        devices = self.resolve_devices("serialNumber", serial_numbers)
         device_ip_mapping = {}
 
         for serial_number in serial_numbers:
-            try:
-                self.log("Fetching device info for serial number: {0}".format(serial_number), "INFO")
-                response = self.dnac._exec(
-                    family="devices",
-                    function='get_device_list',
-                    op_modifies=True,
-                    params={"serialNumber": serial_number}
-                )
-                if response:
-                    self.log("Received API response for serial number '{0}': {1}".format(serial_number, str(response)), "DEBUG")
-                    response = response.get("response")
-                    if response:
-                        device_ip = response[0]["managementIpAddress"]
-                        if device_ip:
-                            device_ip_mapping[serial_number] = device_ip
-                            self.log("Added device IP '{0}' for serial number '{1}'.".format(device_ip, serial_number), "INFO")
-                        else:
-                            device_ip_mapping[serial_number] = None
-                            self.log("No management IP found for serial number '{0}'.".format(serial_number), "WARNING")
-                    else:
-                        device_ip_mapping[serial_number] = None
-                        self.log("No response received for serial number '{0}'.".format(serial_number), "WARNING")
-                else:
-                    device_ip_mapping[serial_number] = None
-                    self.log("No response received from 'get_device_list' for serial number '{0}'.".format(serial_number), "ERROR")
-
-            except Exception as e:
-                error_message = "Exception occurred while fetching device IP for serial number '{0}': {1}".format(serial_number, str(e))
-                self.log(error_message, "ERROR")
-                device_ip_mapping[serial_number] = None
+            device_ip = (devices.get(serial_number) or {}).get("managementIpAddress")
+            device_ip_mapping[serial_number] = device_ip or None
+            if device_ip:
+                self.log("Added device IP '{0}' for serial number '{1}'.".format(device_ip, serial_number), "INFO")
+            else:
+                self.log("No device IP found for serial number '{0}'.".format(serial_number), "WARNING")
 
         self.log("Exiting 'get_device_ips_from_serial_numbers' with device IP mapping: {0}".format(device_ip_mapping), "INFO")
         return device_ip_mapping
@@ -1268,39 +1642,16 @@ class DnacBase():
         """
 
         self.log("Entering 'get_device_ips_from_mac_addresses' with mac_addresses: {0}".format(str(mac_addresses)), "INFO")
+        devices = self.resolve_devices("macAddress", mac_addresses)
         device_ip_mapping = {}
 
         for mac_address in mac_addresses:
-            try:
-                self.log("Fetching device info for mac_address: {0}".format(mac_address), "INFO")
-                response = self.dnac._exec(
-                    family="devices",
-                    function='get_device_list',
-                    op_modifies=True,
-                    params={"macAddress": mac_address}
-                )
-                if response:
-                    self.log("Received API response for mac address '{0}': {1}".format(mac_address, str(response)), "DEBUG")
-                    response = response.get("response")
-                    if response:
-                        device_ip = response[0]["managementIpAddress"]
-                        if device_ip:
-                            device_ip_mapping[mac_address] = device_ip
-                            self.log("Added device IP '{0}' for mac address '{1}'.".format(device_ip, mac_address), "INFO")
-                        else:
-                            device_ip_mapping[mac_address] = None
-                            self.log("No management IP found for mac address '{0}'.".format(mac_address), "WARNING")
-                    else:
-                        device_ip_mapping[mac_address] = None
-                        self.log("No response received for mac address '{0}'.".format(mac_address), "WARNING")
-                else:
-                    device_ip_mapping[mac_address] = None
-                    self.log("No response received from 'get_device_list' for mac address '{0}'.".format(mac_address), "ERROR")
-
-            except Exception as e:
-                error_message = "Exception occurred while fetching device IP for mac address '{0}': {1}".format(mac_address, str(e))
-                self.log(error_message, "ERROR")
-                device_ip_mapping[mac_address] = None
+            device_ip = (devices.get(mac_address) or {}).get("managementIpAddress")
+            device_ip_mapping[mac_address] = device_ip or None
+            if device_ip:
+                self.log("Added device IP '{0}' for mac address '{1}'.".format(device_ip, mac_address), "INFO")
+            else:
+                self.log("No device IP found for mac address '{0}'.".format(mac_address), "WARNING")
 
         self.log("Exiting 'get_device_ips_from_mac_addresses' with device IP mapping: {0}".format(device_ip_mapping), "INFO")
         return device_ip_mapping
@@ -1318,40 +1669,17 @@ class DnacBase():
             list of hostnames. If a device is not found in Cisco Catalyst Center, an error log message is printed.
         """
 
-        self.log("Entering 'get_device_ids_from_device_ips' with device ips: {0}".format(str(device_ips)), "INFO")
+        self.log("Entering 'get_device_ids_from_device_ips' with device_ips: {0}".format(str(device_ips)), "INFO")
+        devices = self.resolve_devices("managementIpAddress", device_ips)
         device_id_mapping = {}
 
         for device_ip in device_ips:
-            try:
-                self.log("Fetching device id for device ip: {0}".format(device_ip), "INFO")
-                response = self.dnac._exec(
-                    family="devices",
-                    function='get_device_list',
-                    op_modifies=False,
-                    params={"management_ip_address": device_ip}
-                )
-                if response:
-                    self.log("Received API response for device ip  '{0}': {1}".format(device_ip, str(response)), "DEBUG")
-                    response = response.get("response")
-                    if response:
-                        device_id = response[0]["id"]
-                        if device_id:
-                            device_id_mapping[device_ip] = device_id
-                            self.log("Added device ID '{0}' for device ip  '{1}'.".format(device_id, device_ip), "INFO")
-                        else:
-                            device_id_mapping[device_ip] = None
-                            self.log("No device ID found for device ip  '{0}'.".format(device_ip), "WARNING")
-                    else:
-                        device_id_mapping[device_ip] = None
-                        self.log("No response received for device ip  '{0}'.".format(device_ip), "WARNING")
-                else:
-                    device_id_mapping[device_ip] = None
-                    self.log("No response received from 'get_device_list' for device ip  '{0}'.".format(device_ip), "ERROR")
-
-            except Exception as e:
-                error_message = "Exception occurred while fetching device ID for device ip  '{0}': {1}".format(device_ip, str(e))
-                self.log(error_message, "ERROR")
-                device_id_mapping[device_ip] = None
+            device_id = (devices.get(device_ip) or {}).get("id")
+            device_id_mapping[device_ip] = device_id or None
+            if device_id:
+                self.log("Added device ID '{0}' for device ip '{1}'.".format(device_id, device_ip), "INFO")
+            else:
+                self.log("No device ID found for device ip '{0}'.".format(device_ip), "WARNING")
 
         self.log("Exiting 'get_device_ids_from_device_ips' with unique device ID mapping: {0}".format(device_id_mapping), "INFO")
         return device_id_mapping
@@ -1370,42 +1698,19 @@ class DnacBase():
             or an exception occurs, it logs the error or warning and continues to the next device ID.
         """
 
-        self.log("Entering 'get_device_ips_from_device_ids' with device ips: {0}".format(str(device_ids)), "INFO")
+        self.log("Entering 'get_device_ips_from_device_ids' with device_ids: {0}".format(str(device_ids)), "INFO")
+        devices = self.resolve_devices("id", device_ids)
         device_ip_mapping = {}
 
         for device_id in device_ids:
-            try:
-                self.log("Fetching device ip for device id: {0}".format(device_id), "INFO")
-                response = self.dnac._exec(
-                    family="devices",
-                    function='get_device_list',
-                    op_modifies=False,
-                    params={"id": device_id}
-                )
-                if response:
-                    self.log("Received API response for device id  '{0}': {1}".format(device_id, str(response)), "DEBUG")
-                    response = response.get("response")
-                    if response:
-                        device_ip = response[0]["managementIpAddress"]
-                        if device_ip:
-                            device_ip_mapping[device_id] = device_ip
-                            self.log("Added device IP '{0}' for device id  '{1}'.".format(device_ip, device_id), "INFO")
-                        else:
-                            device_ip_mapping[device_id] = None
-                            self.log("No device ID found for device id  '{0}'.".format(device_id), "WARNING")
-                    else:
-                        device_ip_mapping[device_id] = None
-                        self.log("No response received for device id  '{0}'.".format(device_id), "WARNING")
-                else:
-                    device_ip_mapping[device_id] = None
-                    self.log("No response received from 'get_device_list' for device id  '{0}'.".format(device_id), "ERROR")
-
-            except Exception as e:
-                error_message = "Exception occurred while fetching device ip for device id '{0}': {1}".format(device_id, str(e))
-                self.log(error_message, "ERROR")
-                device_ip_mapping[device_id] = None
+            device_ip = (devices.get(device_id) or {}).get("managementIpAddress")
+            device_ip_mapping[device_id] = device_ip or None
+            if device_ip:
+                self.log("Added device IP '{0}' for device id '{1}'.".format(device_ip, device_id), "INFO")
+            else:
+                self.log("No device IP found for device id '{0}'.".format(device_id), "WARNING")
 
-        self.log("Exiting 'get_device_ips_from_device_ids' with device IP mapping: '{0}'".format(device_ip_mapping), "INFO")
+        self.log("Exiting 'get_device_ips_from_device_ids' with device IP mapping: {0}".format(device_ip_mapping), "INFO")
         return device_ip_mapping
 
     def get_network_device_tag_id(self, tag_name):
@@ -1425,6 +1730,10 @@ class DnacBase():
         """
 
         self.log("Entering 'get_network_device_tag_id' with tag_name: '{0}'".format(tag_name), "INFO")
+        found, device_tag_id = self.get_cached_lookup("tag", tag_name)
+        if found:
+            return device_tag_id
+
         device_tag_id = None
 
         try:
@@ -1443,9 +1752,10 @@ class DnacBase():
                 self.log("Unable to fetch the tag details for the tag '{0}'.".format(tag_name), "WARNING")
                 return device_tag_id
 
-            self.log("Received API response from 'get_tag': {0}".format(str(response_data)), "DEBUG")
+            self.log("Received API response from 'get_tag': %s", "DEBUG", response_data)
             device_tag_id = response_data[0]["id"]
             if device_tag_id:
+                self.cache_lookup("tag", tag_name, device_tag_id)
                 self.log("Received the tag ID '{0}' for the tag: {1}".format(device_tag_id, tag_name), "INFO")
             else:
                 self.log("Tag ID not found in the response for tag '{0}'.".format(tag_name), "WARNING")
@@ -1640,18 +1950,17 @@ class DnacBase():
                         or None if the maximum timeout is reached.
         Description:
             This method repeatedly checks the status of an API event in Cisco Catalyst Center using the provided
-            execution ID. The status is checked at intervals specified by the 'dnac_task_poll_interval' parameter
+            execution ID. The status is checked at backing-off intervals capped by the 'dnac_task_poll_interval' parameter
             until the status is no longer "IN_PROGRESS" or the maximum timeout ('dnac_api_task_timeout') is reached.
             If the status becomes anything other than "IN_PROGRESS" before the timeout, the method returns the
             response from the API. If the timeout is reached first, the method logs a warning and returns None.
         """
 
         events_response = None
-        start_time = time.time()
+        poller = self.get_task_poller("get_status_api_for_events")
 
         while True:
-            end_time = time.time()
-            if (end_time - start_time) >= self.max_timeout:
+            if poller.is_timed_out():
                 self.log("""Max timeout of {0} sec has reached for the execution id '{1}' for the event and unexpected
                         api status so moving out of the loop.""".format(self.max_timeout, status_execution_id), "WARNING")
                 break
@@ -1662,11 +1971,12 @@ class DnacBase():
                 op_modifies=True,
                 params={"execution_id": status_execution_id}
             )
-            self.log("Received API response from 'get_status_api_for_events': {0}".format(str(response)), "DEBUG")
+            self.log("Received API response from 'get_status_api_for_events': %s", "DEBUG", response)
             if response['apiStatus'] != "IN_PROGRESS":
                 events_response = response
+                poller.done()
                 break
-            time.sleep(self.params.get('dnac_task_poll_interval'))
+            poller.wait()
 
         return events_response
 
@@ -1804,7 +2114,7 @@ class DnacBase():
                 return task_details
 
             task_details = response.get("response")
-            self.log("Task Details: {task_details}".format(task_details=task_details), "DEBUG")
+            self.log("Task Details: %s", "DEBUG", task_details)
         except Exception as e:
             # Log an error message and fail if an exception occurs
             self.log_traceback()
@@ -1836,9 +2146,9 @@ class DnacBase():
                 function="get_tasks_by_id",
                 params={"id": task_id}
             )
-            self.log('Task Details: {0}'.format(response), 'DEBUG')
-            self.log("Retrieving task details by the API 'get_tasks_by_id' using task ID: {0}, Response: {1}"
-                     .format(task_id, response), "DEBUG")
+            self.log('Task Details: %s', "DEBUG", response)
+            self.log("Retrieving task details by the API 'get_tasks_by_id' using task ID: %s, Response: %s",
+                     "DEBUG", task_id, response)
 
             if not isinstance(response, dict):
                 self.log("Failed to retrieve task details for task ID: {}".format(task_id), "ERROR")
@@ -1888,10 +2198,9 @@ class DnacBase():
             return self
 
         task_id = task_info.get("taskId")
-        start_time = time.time()
+        poller = self.get_task_poller(api_name)
         while True:
-            elapsed_time = time.time() - start_time
-            if elapsed_time >= self.max_timeout:
+            if poller.is_timed_out():
                 self.msg = "Max timeout of {0} sec has reached for the task id '{1}'. " \
                            .format(self.max_timeout, task_id) + \
                            "Exiting the loop due to unexpected API '{0}' status.".format(api_name)
@@ -1908,16 +2217,19 @@ class DnacBase():
                 details = self.get_task_details_by_id(task_id)
                 self.msg = details.get("failureReason")
                 self.status = "failed"
+                poller.done()
                 break
 
             elif task_status == "SUCCESS":
                 self.result["changed"] = True
                 self.log("The task with task ID '{0}' is executed successfully."
                          .format(task_id), "INFO")
+                poller.done()
                 break
 
             self.log("Progress is {0} for task ID: {1}"
                      .format(task_status, task_id), "DEBUG")
+            poller.wait()
 
         return self
 
@@ -2233,6 +2545,7 @@ class DnacBase():
             self: The instance of the class with updated status and message.
         """
         loop_start_time = time.time()
+        poller = self.get_task_poller(task_name)
         self.log("Starting task monitoring for '{0}' with task ID '{1}'.".format(task_name, task_id), "DEBUG")
 
         while True:
@@ -2244,7 +2557,7 @@ class DnacBase():
                 self.set_operation_result("failed", False, self.msg, "ERROR")
                 break
 
-            self.log("Successfully retrieved task details: {0}".format(response), "INFO")
+            self.log("Successfully retrieved task details: %s", "INFO", response)
 
             status = response.get("status")
             end_time = response.get("endTime")
@@ -2278,16 +2591,17 @@ class DnacBase():
                                 "Failed to execute the task {0} with Task ID: {1}.".format(task_name, task_id)
                             ).format(task_name, task_id)
                     self.set_operation_result("failed", False, self.msg, "ERROR")
+                    poller.done()
                     break
                 elif status == "SUCCESS":
                     self.msg = success_msg
                     self.set_operation_result("success", True, self.msg, "INFO")
+                    poller.done()
                     break
 
-            # Wait for the specified poll interval before the next check
-            poll_interval = self.params.get("dnac_task_poll_interval")
-            self.log("Waiting for the next poll interval of {0} seconds before checking task status again.".format(poll_interval), "DEBUG")
-            time.sleep(poll_interval)
+            # Wait for the next poll, backing off while the task is still running
+            poll_interval = poller.wait()
+            self.log("Waited {0:.2f} seconds before checking task status again.".format(poll_interval), "DEBUG")
 
         total_elapsed_time = time.time() - loop_start_time
         self.log("Completed monitoring task '{0}' with task ID '{1}' after {2:.2f} seconds.".format(task_name, task_id, total_elapsed_time), "DEBUG")
@@ -2307,6 +2621,7 @@ class DnacBase():
             self: The instance of the class.
         """
         loop_start_time = time.time()
+        poller = self.get_task_poller(task_name)
         self.log("Starting task monitoring for '{0}' with task ID '{1}'.".format(task_name, task_id), "DEBUG")
 
         while True:
@@ -2328,7 +2643,7 @@ class DnacBase():
                 self.set_operation_result("failed", False, self.msg, "ERROR")
                 break
 
-            self.log("Successfully retrieved task details: {0}".format(response), "INFO")
+            self.log("Successfully retrieved task details: %s", "INFO", response)
 
             # Check if the elapsed time exceeds the timeout
             elapsed_time = time.time() - loop_start_time
@@ -2353,18 +2668,19 @@ class DnacBase():
                     self.msg = success_msg
                     self.set_operation_result("success", True, self.msg, "INFO")
                     self.log(self.msg, "INFO")
+                    poller.done()
                     break
 
                 if progress_validation and progress_validation in progress:
                     self.msg = success_msg
                     self.set_operation_result("success", True, self.msg, "INFO")
                     self.log(self.msg, "INFO")
+                    poller.done()
                     break
 
-            # Wait for the specified poll interval before the next check
-            poll_interval = self.params.get("dnac_task_poll_interval")
-            self.log("Waiting for the next poll interval of {0} seconds before checking task status again.".format(poll_interval), "DEBUG")
-            time.sleep(poll_interval)
+            # Wait for the next poll, backing off while the task is still running
+            poll_interval = poller.wait()
+            self.log("Waited {0:.2f} seconds before checking task status again.".format(poll_interval), "DEBUG")
 
         total_elapsed_time = time.time() - loop_start_time
         self.log("Completed monitoring task '{0}' with task ID '{1}' after {2:.2f} seconds.".format(task_name, task_id, total_elapsed_time), "DEBUG")
@@ -2493,8 +2809,9 @@ class DnacBase():
             bool: True if both lists contain the same dictionaries (order-independent), False otherwise.
 
         Description:
-            This function normalizes each dictionary by converting it to a JSON string with sorted keys,
-            then sorts both lists of these strings and compares them to determine equality.
+            This function reduces both lists to canonical fingerprints (see canonical_fingerprint),
+            in which dict key order and list order are ignored at every level, and compares them
+            as multisets.
         """
         self.log("Starting comparison of two unordered lists of dictionaries", "INFO")
 
@@ -2514,12 +2831,9 @@ class DnacBase():
         self.log(f"Length of first list: {len(list1)}", "DEBUG")
         self.log(f"Length of second list: {len(list2)}", "DEBUG")
 
-        # Convert dicts to JSON strings with sorted keys for consistent comparison
-        def normalize(d):
-            return json.dumps(d, sort_keys=True)
-
-        normalized1 = sorted(normalize(d) for d in list1)
-        normalized2 = sorted(normalize(d) for d in list2)
+        # Fingerprint each dict once; nested dicts and lists are order-insensitive
+        normalized1 = canonical_fingerprint(list1)
+        normalized2 = canonical_fingerprint(list2)
         result = normalized1 == normalized2
         if not result:
             self.log("Lists are not equal. Differences detected.", "DEBUG")
@@ -2629,12 +2943,29 @@ class DnacBase():
         return None
 
 
-def is_list_complex(x):
-    return isinstance(x[0], dict) or isinstance(x[0], list)
-
+def canonical_fingerprint(value):
+    """
+    Build a hashable, order-insensitive fingerprint of a nested value.
 
-def has_diff_elem(ls1, ls2):
-    return any((elem not in ls1 for elem in ls2))
+    Dicts become sorted tuples of (key, fingerprint) pairs and lists become
+    sorted tuples of element fingerprints, so two values produce the same
+    fingerprint when they only differ in dict key order or list order.
+    Scalars are tagged by kind so mixed-type lists can still be sorted.
+    """
+    if isinstance(value, dict):
+        return ("d", tuple(sorted(
+            (canonical_fingerprint(k), canonical_fingerprint(v))
+            for k, v in value.items()
+        )))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ("l", tuple(sorted(canonical_fingerprint(item) for item in value)))
+    if value is None:
+        return ("z", 0)
+    if isinstance(value, (bool, int, float)):
+        return ("n", value)
+    if isinstance(value, str):
+        return ("s", value)
+    return ("o", repr(value))
 
 
 def compare_list(list1, list2):
@@ -2646,21 +2977,11 @@ def compare_list(list1, list2):
     if len_list1 == 0:
         return True
 
-    attempt_std_cmp = list1 == list2
-    if attempt_std_cmp:
+    if list1 == list2:
         return True
 
-    if not is_list_complex(list1) and not is_list_complex(list2):
-        return set(list1) == set(list2)
-
-    # Compare normally if it exceeds expected size * 2 (len_list1==len_list2)
-    MAX_SIZE_CMP = 100
-    # Fail fast if elem not in list, thanks to any and generators
-    if len_list1 > MAX_SIZE_CMP:
-        return attempt_std_cmp
-    else:
-        # not changes 'has diff elem' to list1 != list2 ':lists are not equal'
-        return not (has_diff_elem(list1, list2)) or not (has_diff_elem(list2, list1))
+    # Multiset equality on canonical fingerprints, O(n log n) at any size
+    return canonical_fingerprint(list1) == canonical_fingerprint(list2)
 
 
 def fn_comp_key(k, dict1, dict2):
@@ -2742,6 +3063,11 @@ def dnac_argument_spec():
         dnac_version=dict(type="str", default="2.2.3.3"),
         dnac_debug=dict(type="bool", default=False),
         validate_response_schema=dict(type="bool", default=True),
+        dnac_session_cache=dict(type="bool", default=False),
+        dnac_session_cache_dir=dict(type="str"),
+        dnac_rate_limit=dict(type="float"),
+        dnac_rate_limit_burst=dict(type="int"),
+        dnac_rate_limit_retries=dict(type="int", default=DNAC_RATE_LIMIT_RETRIES),
     )
     return argument_spec
 
@@ -2907,6 +3233,120 @@ def validate_dict(item, param_spec, param_name, invalid_params):
     return validation.check_type_dict(item)
 
 
+# Compiled specs of 'validate_list_of_dicts' keyed on their frozen content. They are kept apart
+# from the validation.py cache since the validators of this module report errors differently.
+COMPILED_SPECS = {}
+
+
+def compile_entry(spec):
+    """
+    This function compiles the spec of a dictionary entry for `validate_list_of_dicts`. The
+    validator, default, required flag, choices and `no_log` flag of every parameter are resolved
+    once, and the entry is then validated exactly as the plain loop does.
+
+    Args:
+        spec (dict): An argument spec dict, as accepted by `validate_list_of_dicts`.
+
+    Returns:
+        callable: Function called with the entry, the list collecting the error messages and the
+        Ansible module object, returning the normalized entry.
+    """
+    switch = {
+        "str": validate_str,
+        "int": validate_integer_within_range,
+        "bool": validate_bool,
+        "list": validate_list,
+        "dict": validate_dict,
+    }
+    params = []
+    for param, param_spec in spec.items():
+        default = param_spec.get("default")
+        choice = param_spec.get("choices")
+        params.append(
+            (
+                param,
+                param_spec,
+                param_spec.get("required"),
+                default,
+                isinstance(default, (list, dict, set)),
+                param_spec.get("type"),
+                switch.get(param_spec.get("type")),
+                compile_choices_check(choice, "{0} : Invalid choice provided") if choice else None,
+                param_spec.get("no_log"),
+            )
+        )
+
+    def validate_entry(list_entry, invalid_params, module):
+        valid_params_dict = {}
+        for param, param_spec, required, default, copy_default, data_type, validator, check_choice, no_log in params:
+            item = list_entry.get(param)
+            if item is None:
+                if required:
+                    invalid_params.append(
+                        "{0} : Required parameter not found".format(param)
+                    )
+                else:
+                    # Mutable defaults are copied since the compiled spec outlives this call
+                    valid_params_dict[param] = copy.deepcopy(default) if copy_default else default
+                    continue
+
+            if validator:
+                item = validator(item, param_spec, param, invalid_params)
+            else:
+                invalid_params.append(
+                    "{0}:{1} : Unsupported data type {2}.".format(param, item, data_type)
+                )
+
+            if check_choice is not None:
+                check_choice(item, invalid_params)
+
+            if no_log:
+                if module is not None:
+                    module.no_log_values.add(item)
+                else:
+                    msg = "\n\n'{0}' is a no_log parameter".format(param)
+                    msg += "\nAnsible module object must be passed to this "
+                    msg += "\nfunction to ensure it is not logged\n\n"
+                    raise Exception(msg)
+
+            valid_params_dict[param] = item
+
+        return valid_params_dict
+
+    return validate_entry
+
+
+def compile_spec(spec):
+    """
+    This function compiles an argument spec for `validate_list_of_dicts` and caches it, so the
+    spec is walked once instead of once for every entry of the playbook list, and later calls
+    with the same spec reuse it.
+
+    Args:
+        spec (dict): An argument spec dict, as accepted by `validate_list_of_dicts`.
+
+    Returns:
+        callable: The compiled entry validator.
+    """
+    try:
+        cache_key = freeze_spec(spec)
+    except TypeError:
+        cache_key = None
+
+    if cache_key is not None and cache_key in COMPILED_SPECS:
+        return COMPILED_SPECS[cache_key]
+
+    # Compile from a copy so later changes to the caller's spec do not leak into the cache
+    compiled = compile_entry(copy.deepcopy(spec))
+
+    if cache_key is not None:
+        if len(COMPILED_SPECS) >= COMPILED_SPECS_MAX:
+            COMPILED_SPECS.clear()
+        COMPILED_SPECS[cache_key] = compiled
+
+    return compiled
+
+
 def validate_list_of_dicts(param_list, spec, module=None):
     """Validate/Normalize playbook params. Will raise when invalid parameters found.
     param_list: a playbook parameter list of dicts
@@ -2914,6 +3354,38 @@ def validate_list_of_dicts(param_list, spec, module=None):
           e.g. spec = dict(ip=dict(required=True, type='bool'),
                            foo=dict(type='str', default='bar'))
     return: list of normalized input data
+    The spec is compiled once with `compile_spec` and the compiled validator is applied to
+    every entry; specs it cannot compile are validated with the plain loop.
+    """
+
+    if not spec or not isinstance(spec, dict) or not all(
+        isinstance(param_spec, dict) for param_spec in spec.values()
+    ):
+        return validate_list_of_dicts_plain(param_list, spec, module)
+
+    validate_entry = compile_spec(spec)
+    invalid_params = []
+    normalized = [
+        validate_entry(list_entry, invalid_params, module)
+        for list_entry in param_list
+    ]
+
+    return normalized, invalid_params
+
+
+def validate_list_of_dicts_plain(param_list, spec, module=None):
+    """
+    This function validates the playbook list against the spec one parameter at a time,
+    without compiling the spec. It is used for empty specs and for specs that `compile_spec`
+    does not handle.
+
+    Args:
+        param_list (list): A playbook parameter list of dicts.
+        spec (dict): An argument spec dict.
+        module (object, optional): Ansible module object, required if any parameter has `no_log` enabled.
+
+    Returns:
+        tuple: The list of normalized entries and the list of error messages.
     """
 
     v = validation
@@ -2977,31 +3449,591 @@ def validate_list_of_dicts(param_list, spec, module=None):
     return normalized, invalid_params
 
 
+# Set on the threads running 'run_concurrently' workers, whose failures are raised instead of exiting
+WORKER_CONTEXT = threading.local()
+
+
+class WorkerFailure(BaseException):
+    """
+    Failure of a 'run_concurrently' worker.
+
+    'fail_json' exits the process and must only run on the main thread, so a worker that fails
+    raises this exception instead; the module is failed once every worker has finished. Like the
+    SystemExit raised by 'fail_json', it is not caught by 'except Exception' blocks.
+    """
+
+    def __init__(self, msg, response=None):
+        super(WorkerFailure, self).__init__(msg)
+        self.msg = msg
+        self.response = response
+
+
+# Polling profiles matched on the task/API name, in order. Long running SWIM and
+# provisioning tasks start slower and back off further than short CRUD tasks.
+TASK_POLL_PROFILES = (
+    ("swim", ("import", "distribut", "activat", "swim", "golden"),
+     {"initial_delay": 2.0, "backoff_factor": 1.5, "max_delay": 15.0}),
+    ("provision", ("provision",),
+     {"initial_delay": 1.0, "backoff_factor": 1.5, "max_delay": 10.0}),
+    ("discovery", ("discovery",),
+     {"initial_delay": 1.0, "backoff_factor": 1.5, "max_delay": 10.0}),
+    ("compliance", ("compliance",),
+     {"initial_delay": 1.0, "backoff_factor": 1.5, "max_delay": 10.0}),
+)
+DEFAULT_TASK_POLL_PROFILE = {"initial_delay": 0.05, "backoff_factor": 2.0, "max_delay": None, "jitter": 0.1}
+DEFAULT_TASK_POLL_INTERVAL = 2
+
+
+class TaskPoller(object):
+    """
+    Paces the polling of a long running Catalyst Center task.
+
+    The first poll happens right away; every call to wait() then sleeps for a delay that
+    starts at 'initial_delay' and grows by 'backoff_factor' up to 'max_delay', with
+    +/- 'jitter' applied so concurrent runs do not poll in lock-step. The duration of
+    completed tasks is remembered per profile so that the next task of the same kind
+    starts polling closer to its expected completion time.
+    """
+
+    observed_durations = {}
+
+    def __init__(self, profile, initial_delay, backoff_factor, max_delay, jitter=0.0, timeout=None):
+        self.profile = profile
+        self.backoff_factor = max(backoff_factor, 1.0)
+        self.max_delay = max(max_delay, initial_delay)
+        self.jitter = jitter
+        self.timeout = timeout
+        self.next_delay = initial_delay
+        self.attempts = 0
+        self.start_time = time.time()
+
+    @classmethod
+    def for_task(cls, task_name, poll_interval=None, timeout=None, overrides=None):
+        """
+        Build a poller for the given task or API name.
+        Args:
+            task_name (str): Task or API name used to select the polling profile.
+            poll_interval (int): The 'dnac_task_poll_interval' value, used as the default cap.
+            timeout (int): Overall deadline in seconds, the last delay never overshoots it.
+            overrides (dict): Explicit 'initial_delay', 'backoff_factor', 'max_delay' or 'jitter'.
+        Returns:
+            TaskPoller: A poller ready to use.
+        """
+        poll_interval = poll_interval or DEFAULT_TASK_POLL_INTERVAL
+        profile = "default"
+        settings = dict(DEFAULT_TASK_POLL_PROFILE, max_delay=poll_interval)
+        lowered_name = (task_name or "").lower()
+        for profile_name, keywords, profile_settings in TASK_POLL_PROFILES:
+            if any(keyword in lowered_name for keyword in keywords):
+                profile = profile_name
+                settings.update(profile_settings)
+                settings["max_delay"] = max(settings["max_delay"], poll_interval)
+                break
+
+        observed = cls.observed_durations.get(profile)
+        if observed:
+            settings["initial_delay"] = max(settings["initial_delay"], min(observed / 4.0, settings["max_delay"]))
+
+        settings.update(overrides or {})
+        return cls(profile, timeout=timeout, **settings)
+
+    def elapsed(self):
+        return time.time() - self.start_time
+
+    def is_timed_out(self):
+        return self.timeout is not None and self.elapsed() >= self.timeout
+
+    def wait(self):
+        """Sleep until the next poll is due and return the delay that was applied."""
+        delay = self.next_delay
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        if self.timeout is not None:
+            remaining = self.timeout - self.elapsed()
+            # Past the deadline the regular delay applies, so callers that keep polling never spin
+            if remaining > 0:
+                delay = min(delay, remaining)
+
+        time.sleep(delay)
+        self.attempts += 1
+        self.next_delay = min(self.next_delay * self.backoff_factor, self.max_delay)
+        return delay
+
+    def done(self):
+        """Record how long the task took so the next poller of this profile adapts."""
+        TaskPoller.observed_durations[self.profile] = self.elapsed()
+
+
+class TaskWatcher(object):
+    """
+    Waits on many Catalyst Center tasks with one polling loop.
+
+    Every round polls the tasks that are still running, on a thread pool when 'max_workers'
+    is greater than one, yields the ones that reached a terminal state and then sleeps once
+    using the backoff of a TaskPoller. A single deadline covers the whole set, so the total
+    wait is driven by the slowest task rather than the sum of all of them.
+    """
+
+    def __init__(self, dnac_base, task_ids, task_name=None, timeout=None, max_workers=1,
+                 legacy_api=False, progress_validation=None, require_end_time=True):
+        self.dnac_base = dnac_base
+        self.task_ids = []
+        for task_id in task_ids:
+            if task_id and task_id not in self.task_ids:
+                self.task_ids.append(task_id)
+
+        self.task_name = task_name or "task"
+        self.max_workers = max(int(max_workers or 1), 1)
+        self.legacy_api = legacy_api
+        self.progress_validation = progress_validation
+        self.require_end_time = require_end_time
+        self.poller = dnac_base.get_task_poller(task_name)
+        if timeout is not None:
+            self.poller.timeout = timeout
+
+        self.results = {}
+
+    def fetch(self, task_id):
+        """Return the current details of one task, from 'get_task_by_id' for the legacy API."""
+        if self.legacy_api:
+            return self.dnac_base.get_task_details(task_id)
+
+        return self.dnac_base.get_tasks_by_id(task_id)
+
+    def poll(self, task_ids):
+        """Fetch the details of all the given tasks, preserving their order."""
+        return list(zip(task_ids, self.dnac_base.run_concurrently(self.fetch, task_ids, self.max_workers)))
+
+    def get_completion_status(self, task_details):
+        """
+        Map the task details to 'SUCCESS' or 'FAILURE', or None while the task is still running.
+        """
+        if not task_details:
+            return "FAILURE"
+
+        if self.require_end_time and not task_details.get("endTime"):
+            if not (self.legacy_api and task_details.get("isError")):
+                return None
+
+        if self.legacy_api:
+            if task_details.get("isError"):
+                return "FAILURE"
+
+            progress = task_details.get("progress") or ""
+            if self.progress_validation and self.progress_validation not in progress:
+                return None
+
+            return "SUCCESS"
+
+        status = task_details.get("status")
+        if status in ("SUCCESS", "FAILURE"):
+            return status
+
+        return None
+
+    def watch(self):
+        """
+        Poll the tasks until all of them completed or the deadline is reached.
+        Yields:
+            tuple: (task_id, status, task_details) as each task completes, where status is
+            'SUCCESS', 'FAILURE' or 'TIMEOUT'. Failed tasks of the current API carry the
+            'failureReason' from 'get_task_details_by_id'.
+        """
+        pending = list(self.task_ids)
+        self.dnac_base.log("Watching {0} '{1}' task(s): {2}".format(
+            len(pending), self.task_name, pending), "DEBUG")
+
+        while pending:
+            still_running = []
+            for task_id, task_details in self.poll(pending):
+                status = self.get_completion_status(task_details)
+                if status is None:
+                    still_running.append(task_id)
+                    continue
+
+                if status == "FAILURE" and task_details and not self.legacy_api:
+                    failure_details = self.dnac_base.get_task_details_by_id(task_id) or {}
+                    task_details = dict(task_details, failureReason=failure_details.get("failureReason"))
+
+                self.results[task_id] = (status, task_details)
+                self.dnac_base.log("Task '{0}' with task ID '{1}' completed with status '{2}' after {3:.2f} seconds."
+                                   .format(self.task_name, task_id, status, self.poller.elapsed()), "DEBUG")
+                yield task_id, status, task_details
+
+            pending = still_running
+            if not pending:
+                self.poller.done()
+                break
+
+            if self.poller.is_timed_out():
+                self.dnac_base.log("Timeout of {0} seconds reached while waiting on '{1}' task(s): {2}"
+                                   .format(self.poller.timeout, self.task_name, pending), "WARNING")
+                for task_id in pending:
+                    self.results[task_id] = ("TIMEOUT", None)
+                    yield task_id, "TIMEOUT", None
+                break
+
+            poll_interval = self.poller.wait()
+            self.dnac_base.log("Waited {0:.2f} seconds before polling {1} running '{2}' task(s) again."
+                               .format(poll_interval, len(pending), self.task_name), "DEBUG")
+
+    def wait_all(self):
+        """
+        Wait for all the tasks and return their outcome.
+        Returns:
+            dict: Task ID to a (status, task_details) tuple.
+        """
+        for _task in self.watch():
+            pass
+
+        return self.results
+
+
+class RolloutScheduler(object):
+    """
+    Rolls an operation out over many items with a sliding window of running tasks.
+
+    'start(item)' triggers the operation on one item and returns its task ID. At most
+    'max_concurrent' tasks run at the same time and the next item is started as soon as one
+    of them completes, instead of waiting for a whole batch. Every task must complete within
+    'task_timeout' seconds of its own start or it is counted as a TIMEOUT. Once more than
+    'failure_budget' percent of the items failed or timed out, no new item is started and
+    the remaining ones are reported as SKIPPED.
+
+    With 'state_file', the status and task ID of every item are saved after each change.
+    A run with the same 'run_id' skips the items that already succeeded and resumes watching
+    the tasks that were still running instead of triggering them again.
+    """
+
+    def __init__(self, dnac_base, items, start, item_key=str, task_name=None, max_concurrent=1,
+                 failure_budget=None, task_timeout=None, state_file=None, run_id=None, **watch_kwargs):
+        self.dnac_base = dnac_base
+        self.items = list(items)
+        self.start = start
+        self.item_key = item_key
+        self.task_name = task_name or "rollout"
+        self.max_concurrent = max(int(max_concurrent or 1), 1)
+        self.failure_budget = failure_budget
+        self.state_file = os.path.expanduser(state_file) if state_file else None
+        self.run_id = run_id
+        watch_kwargs.setdefault("max_workers", dnac_base.get_max_workers())
+        self.watcher = TaskWatcher(dnac_base, [], task_name, **watch_kwargs)
+        self.task_timeout = task_timeout or self.watcher.poller.timeout
+        self.results = OrderedDict()
+        self.halted = False
+
+    def load_state(self):
+        """Return the item states saved by an earlier run with the same run_id."""
+        if not self.state_file:
+            return {}
+        try:
+            with open(self.state_file, "r") as state_file:
+                state = json.load(state_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+        if not isinstance(state, dict) or state.get("run_id") != self.run_id:
+            self.dnac_base.log("Ignoring rollout state file '{0}' of another run.".format(self.state_file), "INFO")
+            return {}
+        return state.get("items") or {}
+
+    def save_state(self):
+        """Atomically write the state of every item to the state file."""
+        if not self.state_file:
+            return
+        state = dict(run_id=self.run_id, task_name=self.task_name, updated_at=time.time(), items=self.results)
+        tmp_path = "{0}.{1}.tmp".format(self.state_file, os.getpid())
+        try:
+            with open(tmp_path, "w") as state_file:
+                json.dump(state, state_file, indent=2)
+            os.replace(tmp_path, self.state_file)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            self.dnac_base.log("Unable to save the rollout state to '{0}': {1}".format(self.state_file, e), "WARNING")
+
+    def set_result(self, key, status, task_id=None, details=None):
+        self.results[key] = dict(status=status, task_id=task_id, details=details)
+        self.save_state()
+
+    def budget_exceeded(self):
+        """Whether the failed and timed out items exceed the failure budget."""
+        if self.failure_budget is None or not self.items:
+            return False
+        failed = sum(1 for result in self.results.values() if result["status"] in ("FAILURE", "TIMEOUT"))
+        return failed * 100.0 > self.failure_budget * len(self.items)
+
+    def run(self):
+        """
+        Roll the operation out over all the items.
+        Returns:
+            OrderedDict: Item key to a dict with the 'status' ('SUCCESS', 'FAILURE', 'TIMEOUT' or
+            'SKIPPED'), the 'task_id' and the task 'details'.
+        """
+        saved_state = self.load_state()
+        pending = []
+        running = OrderedDict()
+        for item in self.items:
+            key = self.item_key(item)
+            saved = saved_state.get(key) or {}
+            if saved.get("status") == "SUCCESS":
+                self.results[key] = saved
+            elif saved.get("status") == "RUNNING" and saved.get("task_id"):
+                self.results[key] = saved
+                running[saved["task_id"]] = (key, time.time())
+            else:
+                pending.append(item)
+
+        self.dnac_base.log("Rolling '{0}' out to {1} item(s), {2} resumed, {3} already done, window of {4}."
+                           .format(self.task_name, len(self.items), len(running),
+                                   len(self.items) - len(pending) - len(running), self.max_concurrent), "INFO")
+        poller = self.dnac_base.get_task_poller(self.task_name)
+        while pending or running:
+            if pending and self.budget_exceeded():
+                self.halted = True
+                self.dnac_base.log("Failure budget of {0}% exceeded, stopping the '{1}' rollout."
+                                   .format(self.failure_budget, self.task_name), "WARNING")
+                for item in pending:
+                    self.set_result(self.item_key(item), "SKIPPED")
+                pending = []
+
+            while pending and len(running) < self.max_concurrent and not self.budget_exceeded():
+                item = pending.pop(0)
+                key = self.item_key(item)
+                task_id = self.start(item)
+                if not task_id:
+                    self.set_result(key, "FAILURE", details="The operation did not return a task ID.")
+                    continue
+                running[task_id] = (key, time.time())
+                self.set_result(key, "RUNNING", task_id)
+
+            if not running:
+                break
+
+            completed = False
+            for task_id, task_details in self.watcher.poll(list(running)):
+                key, started_at = running[task_id]
+                status = self.watcher.get_completion_status(task_details)
+                if status is None:
+                    if time.time() - started_at < self.task_timeout:
+                        continue
+                    status = "TIMEOUT"
+                elif status == "FAILURE" and task_details and not self.watcher.legacy_api:
+                    failure_details = self.dnac_base.get_task_details_by_id(task_id) or {}
+                    task_details = dict(task_details, failureReason=failure_details.get("failureReason"))
+
+                del running[task_id]
+                completed = True
+                self.set_result(key, status, task_id, task_details)
+                self.dnac_base.log("'{0}' task '{1}' of '{2}' completed with status '{3}'."
+                                   .format(self.task_name, task_id, key, status), "DEBUG")
+
+            if completed:
+                poller = self.dnac_base.get_task_poller(self.task_name)
+            elif running:
+                poller.wait()
+
+        if self.state_file and os.path.exists(self.state_file) and \
+                all(result["status"] == "SUCCESS" for result in self.results.values()):
+            os.remove(self.state_file)
+        return self.results
+
+
+# Identity attributes of a device record and the matching 'get_device_list' filters
+DEVICE_IDENTITY_ATTRIBUTES = {
+    "hostname": "hostname",
+    "managementIpAddress": "management_ip_address",
+    "macAddress": "mac_address",
+    "serialNumber": "serial_number",
+    "id": "id",
+}
+DEVICE_LOOKUP_BATCH_SIZE = 50
+
+DEFAULT_LOOKUP_CACHE_TTL = 300
+DEFAULT_LOOKUP_CACHE_SIZE = 1024
+
+# Lookup cache namespaces cleared when an API of the family modifies objects
+LOOKUP_CACHE_FAMILIES = {
+    "site_design": ("site",),
+    "sites": ("site",),
+    "devices": ("device", "site"),
+    "tag": ("tag",),
+    "software_image_management_swim": ("image",),
+}
+READ_ONLY_FUNCTION_PREFIXES = ("get", "retrieve", "read", "query", "count", "search", "return")
+
+
+class LookupCache(object):
+    """
+    Size-bounded LRU cache with a time to live, for name to ID lookups made during a module run.
+
+    Values are copied on the way in and out so callers can modify what they get back. The
+    entries are shared by the 'run_concurrently' workers, every access holds the cache lock.
+    """
+
+    def __init__(self, ttl=DEFAULT_LOOKUP_CACHE_TTL, max_size=DEFAULT_LOOKUP_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_size = max(max_size, 1)
+        self.entries = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        self.lock = threading.Lock()
+
+    def get(self, namespace, key):
+        with self.lock:
+            entry = self.entries.get((namespace, key))
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    del self.entries[(namespace, key)]
+                self.stats["misses"] += 1
+                return False, None
+
+            self.entries.move_to_end((namespace, key))
+            self.stats["hits"] += 1
+
+        # Stored values are private copies that are never modified, they can be copied unlocked
+        return True, copy.deepcopy(entry[1])
+
+    def put(self, namespace, key, value):
+        entry = (time.time() + self.ttl, copy.deepcopy(value))
+        with self.lock:
+            self.entries[(namespace, key)] = entry
+            self.entries.move_to_end((namespace, key))
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, namespace=None):
+        with self.lock:
+            stale_keys = [key for key in self.entries if namespace is None or key[0] == namespace]
+            for key in stale_keys:
+                del self.entries[key]
+            if stale_keys:
+                self.stats["invalidations"] += 1
+
+    def invalidate_for_api(self, family, function):
+        """Clear the namespaces affected by an API call that modifies objects."""
+        if function.startswith(READ_ONLY_FUNCTION_PREFIXES):
+            return
+        for namespace in LOOKUP_CACHE_FAMILIES.get(family, ()):
+            self.invalidate(namespace)
+
+
 RATE_LIMIT_MESSAGE = "Rate Limit exceeded"
-RATE_LIMIT_RETRY_AFTER = 15
+RECORD_FILE_FORMATS = ("jsonl", "yaml")
+
+
+def write_records(file_path, records, file_format="jsonl", append=True):
+    """
+    Write records to an append-only file without reading its previous content.
+    Args:
+        file_path (str): The output file.
+        records (list): The records to write, each one JSON serializable.
+        file_format (str): 'jsonl' writes one JSON document per line, 'yaml' writes one YAML
+                           document per record, each starting with a '---' separator.
+        append (bool): Add the records at the end of the file instead of replacing it.
+    Returns:
+        int: The number of records written.
+    """
+    if file_format not in RECORD_FILE_FORMATS:
+        raise ValueError("Unsupported record file format '{0}', use one of {1}".format(file_format, RECORD_FILE_FORMATS))
+    if file_format == "yaml" and yaml is None:
+        raise ImportError("PyYAML is required to write YAML records")
+
+    count = 0
+    with open(file_path, "a" if append else "w") as record_file:
+        for record in records:
+            if file_format == "jsonl":
+                record_file.write(json.dumps(record, default=str, separators=(",", ":")) + "\n")
+            else:
+                record_file.write("---\n" + yaml.safe_dump(record, default_flow_style=False))
+            count += 1
+    return count
 
 
 class DNACSDK(object):
     def __init__(self, params):
         self.result = dict(changed=False, result="")
         self.validate_response_schema = params.get("validate_response_schema")
+        self.mutation_listener = None
         self.logger = logging.getLogger('dnacentersdk')
+        self.rate_limiter = self.create_rate_limiter(params)
+        self.rate_limit_retries = self.get_rate_limit_setting(
+            params, "dnac_rate_limit_retries", "DNAC_RATE_LIMIT_RETRIES", int, DNAC_RATE_LIMIT_RETRIES
+        )
         if DNAC_SDK_IS_INSTALLED:
-            self.api = api.DNACenterAPI(
-                username=params.get("dnac_username"),
-                password=params.get("dnac_password"),
-                base_url="https://{dnac_host}:{dnac_port}".format(
-                    dnac_host=params.get("dnac_host"), dnac_port=params.get("dnac_port")
-                ),
-                version=params.get("dnac_version"),
-                verify=params.get("dnac_verify"),
-                debug=params.get("dnac_debug"),
-            )
+            if self.is_session_cache_enabled(params):
+                self.api = self.get_cached_api(params)
+            else:
+                self.api = self.create_api(params)
             if params.get("dnac_debug") and LOGGING_IN_STANDARD:
                 self.logger.addHandler(logging.StreamHandler())
         else:
             self.fail_json(msg="DNA Center Python SDK is not installed. Execute 'pip install dnacentersdk'")
 
+    def is_session_cache_enabled(self, params):
+        """
+        The session cache is opt-in through the 'dnac_session_cache' parameter or,
+        for modules that do not expose it, the DNAC_SESSION_CACHE environment variable.
+        """
+        session_cache = params.get("dnac_session_cache")
+        if session_cache is None:
+            session_cache = os.environ.get("DNAC_SESSION_CACHE", False)
+        try:
+            return validation.check_type_bool(session_cache)
+        except TypeError:
+            return False
+
+    def get_rate_limit_setting(self, params, name, env_name, value_type, default=None):
+        """
+        Read a rate limit setting from the module parameters or, when it is not set there,
+        from its environment variable.
+        """
+        value = params.get(name)
+        if value is None:
+            value = os.environ.get(env_name)
+        try:
+            return value_type(value) if value is not None else default
+        except (TypeError, ValueError):
+            return default
+
+    def create_rate_limiter(self, params):
+        """Return the shared token bucket of the controller, or None when no rate is configured."""
+        return create_rate_limiter(
+            params.get("dnac_host"),
+            params.get("dnac_port"),
+            self.get_rate_limit_setting(params, "dnac_rate_limit", "DNAC_RATE_LIMIT", float),
+            self.get_rate_limit_setting(params, "dnac_rate_limit_burst", "DNAC_RATE_LIMIT_BURST", int),
+        )
+
+    def create_api(self, params):
+        return create_dnac_api(params)
+
+    def call_with_rate_limit(self, func, *args, **kwargs):
+        """Call an SDK function through the controller rate limiter, retrying HTTP 429 and 503 responses."""
+        def log_retry(status_code, retry_after, attempt, max_retries):
+            self.logger.warning(
+                "HTTP %s received, retrying in %s seconds (attempt %s of %s)",
+                status_code, retry_after, attempt, max_retries
+            )
+
+        return call_with_rate_limit(
+            func, args, kwargs,
+            rate_limiter=getattr(self, "rate_limiter", None),
+            max_retries=getattr(self, "rate_limit_retries", DNAC_RATE_LIMIT_RETRIES),
+            log_retry=log_retry,
+        )
+
+    def rate_limited(self, func):
+        """Wrap an SDK function so every call goes through call_with_rate_limit."""
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            return self.call_with_rate_limit(func, *args, **kwargs)
+        return call
+
+    def get_cached_api(self, params):
+        """Return a DNACenterAPI that reuses the session and token of earlier tasks."""
+        return get_cached_dnac_api(
+            params, params.get("dnac_session_cache_dir") or os.environ.get("DNAC_SESSION_CACHE_DIR")
+        )
+
     def changed(self):
         self.result["changed"] = True
 
@@ -3041,31 +4073,44 @@ class DNACSDK(object):
     def _exec(self, family, function, params=None, op_modifies=False, **kwargs):
         family_name = family
         function_name = function
+        rate_limit_attempt = kwargs.pop("rate_limit_attempt", 0)
+        mutation_listener = getattr(self, "mutation_listener", None)
+        if mutation_listener is not None:
+            mutation_listener(family_name, function_name)
         try:
             family = getattr(self.api, family)
-            func = getattr(family, function)
+            sdk_func = getattr(family, function)
+            func = self.rate_limited(sdk_func)
         except Exception as e:
             self.fail_json(msg=e)
 
         try:
             if params:
                 file_paths_params = kwargs.get('file_paths', [])
-                # This substitution is for the import file operation
-                if file_paths_params and isinstance(file_paths_params, list):
-                    multipart_fields = {}
-                    for (key, value) in file_paths_params:
-                        if isinstance(params.get(key), str) and self.is_file(params[key]):
-                            file_name = self.extract_file_name(params[key])
-                            file_path = params[key]
-                            multipart_fields[value] = (file_name, open(file_path, 'rb'))
+                # This substitution is for the import file operation, the files are streamed
+                # by the SDK multipart encoder and closed once the call returns. The fields are
+                # set on a copy, a rate limit retry of this call opens the files again.
+                call_params = dict(params)
+                with MultipartUpload(kwargs.get("checksums"), self.logger.debug) as upload:
+                    if file_paths_params and isinstance(file_paths_params, list):
+                        multipart_fields = {}
+                        for (key, value) in file_paths_params:
+                            if isinstance(params.get(key), str) and self.is_file(params[key]):
+                                multipart_fields[value] = upload.open(value, params[key])
+
+                        call_params.setdefault("multipart_fields", multipart_fields)
+                        call_params.setdefault("multipart_monitor_callback", upload.monitor_callback)
 
-                    params.setdefault("multipart_fields", multipart_fields)
-                    params.setdefault("multipart_monitor_callback", None)
+                    if upload.files:
+                        func = self.rate_limited(upload.rewinding(sdk_func))
 
-                if not self.validate_response_schema and op_modifies:
-                    params["active_validation"] = False
+                    if not self.validate_response_schema and op_modifies:
+                        call_params["active_validation"] = False
 
-                response = func(**params)
+                    response = func(**call_params)
+
+                if upload.files:
+                    self.result["uploaded_files"] = upload.summary()
 
             else:
                 response = func()
@@ -3073,9 +4118,9 @@ class DNACSDK(object):
             if response and isinstance(response, dict) and response.get("executionId"):
                 execution_id = response.get("executionId")
                 exec_details_params = {"execution_id": execution_id}
-                exec_details_func = getattr(
+                exec_details_func = self.rate_limited(getattr(
                     getattr(self.api, "task"), "get_business_api_execution_details"
-                )
+                ))
 
                 while True:
                     execution_details = exec_details_func(**exec_details_params)
@@ -3084,11 +4129,17 @@ class DNACSDK(object):
 
                     bapi_error = execution_details.get("bapiError")
                     if bapi_error:
-                        if RATE_LIMIT_MESSAGE in bapi_error:
+                        max_retries = getattr(self, "rate_limit_retries", DNAC_RATE_LIMIT_RETRIES)
+                        if RATE_LIMIT_MESSAGE in bapi_error and rate_limit_attempt < max_retries:
                             self.logger.warning("!!!!! %s !!!!!", RATE_LIMIT_MESSAGE)
-                            time.sleep(RATE_LIMIT_RETRY_AFTER)
+                            rate_limiter = getattr(self, "rate_limiter", None)
+                            if rate_limiter is not None:
+                                rate_limiter.penalize(RATE_LIMIT_RETRY_AFTER)
+                            else:
+                                time.sleep(RATE_LIMIT_RETRY_AFTER)
                             return self._exec(
-                                family_name, function_name, params, op_modifies, **kwargs
+                                family_name, function_name, params, op_modifies,
+                                rate_limit_attempt=rate_limit_attempt + 1, **kwargs
                             )
 
                         self.logger.debug(bapi_error)
@@ -3191,7 +4242,7 @@ class DNACSDK(object):
                 else:
                     call_api_kwargs["params"] = request_params
 
-            response = call_api(**call_api_kwargs)
+            response = self.call_with_rate_limit(call_api, **call_api_kwargs)
 
             if isinstance(response, dict):
                 logger.debug(
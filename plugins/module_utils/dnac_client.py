@@ -0,0 +1,435 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Connection helpers shared by the modules (module_utils/dnac.py) and the action plugins
+(plugin_utils/dnac.py): the persistent session cache, the controller rate limiter with its
+Retry-After handling and the multipart upload of files.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+try:
+    from dnacentersdk import api, exceptions
+except ImportError:
+    DNAC_SDK_IS_INSTALLED = False
+else:
+    DNAC_SDK_IS_INSTALLED = True
+import base64
+import functools
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+RATE_LIMIT_RETRY_AFTER = 15
+RATE_LIMIT_STATUS_CODES = (429, 503)
+DNAC_RATE_LIMIT_DIR = os.path.join("~", ".ansible", "dnac_rate_limit")
+DNAC_RATE_LIMIT_RETRIES = 3
+DNAC_RATE_LIMIT_MAX_WAIT = 300
+
+UPLOAD_CHECKSUM_ALGORITHMS = ("md5", "sha256")
+UPLOAD_PROGRESS_STEP = 10
+
+DNAC_SESSION_CACHE_DIR = os.path.join("~", ".ansible", "dnac_session_cache")
+DNAC_TOKEN_DEFAULT_TTL = 3600
+DNAC_TOKEN_EXPIRY_MARGIN = 60
+
+# DNACenterAPI objects already built by this process, keyed on the controller identity,
+# so consecutive tasks reuse the same HTTPS session
+_dnac_api_cache = {}
+
+
+def get_token_expiry(token):
+    """Return the epoch expiry of a Catalyst Center token, read from its JWT 'exp' claim when present."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload.encode("utf-8")))
+        return float(claims["exp"])
+    except Exception:
+        return time.time() + DNAC_TOKEN_DEFAULT_TTL
+
+
+class DNACSessionCache(object):
+    """Persists the Catalyst Center auth token of one controller/user pair on disk.
+
+    The cache file is keyed on host, port, username and version and is only readable
+    by its owner (0600). The password is never written; a salted digest of it is kept so
+    a token is not handed out to a task that authenticates with different credentials.
+    """
+
+    def __init__(self, host, port, username, password, version, cache_dir=None):
+        identity = "{0}|{1}|{2}|{3}".format(host, port, username, version)
+        self.key = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+        self.auth_digest = hashlib.sha256("{0}|{1}".format(self.key, password).encode("utf-8")).hexdigest()
+        self.cache_dir = os.path.expanduser(cache_dir or DNAC_SESSION_CACHE_DIR)
+        self.path = os.path.join(self.cache_dir, "{0}.json".format(self.key))
+
+    def load(self):
+        """Return the cached token, or None when it is missing, expired or unreadable."""
+        try:
+            with open(self.path, "r") as cache_file:
+                entry = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("auth") != self.auth_digest:
+            return None
+        if entry.get("expires_at", 0) - DNAC_TOKEN_EXPIRY_MARGIN <= time.time():
+            return None
+        return entry.get("token")
+
+    def store(self, token):
+        """Atomically write the token and its expiry with owner-only permissions."""
+        entry = dict(token=token, expires_at=get_token_expiry(token), auth=self.auth_digest)
+        tmp_path = "{0}.{1}.tmp".format(self.path, os.getpid())
+        try:
+            os.makedirs(self.cache_dir, 0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump(entry, cache_file)
+            os.replace(tmp_path, self.path)
+        except (IOError, OSError):
+            # The cache is an optimization only, never fail the task because of it
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def invalidate(self):
+        """Drop the cached token."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def attach(self, dnac_api):
+        """Seed a DNACenterAPI session with the cached token and persist refreshed tokens.
+
+        The SDK calls the session's token getter lazily and again on a 401 response,
+        so wrapping it is enough to get both the cache hit and the automatic refresh.
+        """
+        rest_session = getattr(dnac_api, "_session", None)
+        authenticate = getattr(rest_session, "_get_access_token", None)
+        if authenticate is None:
+            return
+
+        def get_access_token():
+            token = authenticate()
+            self.store(token)
+            return token
+
+        rest_session._get_access_token = get_access_token
+        token = self.load()
+        if token:
+            rest_session._access_token = token
+            rest_session.update_headers({"X-Auth-Token": token})
+            rest_session._authenticated = True
+
+
+class DNACRateLimiter(object):
+    """Token bucket limiting the API calls sent to one Catalyst Center controller.
+
+    The bucket state (available tokens, last refill and a Retry-After embargo) lives in a
+    per-controller file locked with flock, so every fork and thread of a run, on the same
+    control node, draws from the same budget of 'rate' calls per second with bursts of up
+    to 'burst' calls. Without fcntl the bucket is only shared inside the process.
+    """
+
+    def __init__(self, host, port, rate, burst=None, state_dir=None):
+        identity = "{0}|{1}".format(host, port)
+        self.key = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+        self.rate = float(rate)
+        self.burst = max(1, int(burst or math.ceil(self.rate)))
+        self.state_dir = os.path.expanduser(state_dir or DNAC_RATE_LIMIT_DIR)
+        self.path = os.path.join(self.state_dir, "{0}.json".format(self.key))
+        self.lock = threading.Lock()
+
+    def _update(self, update_state):
+        """Run update_state(state, now) on the bucket state under the process and file locks."""
+        with self.lock:
+            try:
+                os.makedirs(self.state_dir, 0o700, exist_ok=True)
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            except (IOError, OSError):
+                fd = None
+            try:
+                if fd is not None and fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                state = self._read(fd)
+                now = time.time()
+                elapsed = max(0.0, now - state.get("updated_at", now))
+                state["tokens"] = min(self.burst, state.get("tokens", self.burst) + elapsed * self.rate)
+                state["updated_at"] = now
+                result = update_state(state, now)
+                self._write(fd, state)
+                return result
+            finally:
+                if fd is not None:
+                    os.close(fd)
+
+    def _read(self, fd):
+        if fd is None:
+            return getattr(self, "_state", {})
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            state = json.loads(os.read(fd, 4096).decode("utf-8") or "{}")
+        except (IOError, OSError, ValueError):
+            state = {}
+        return state if isinstance(state, dict) else {}
+
+    def _write(self, fd, state):
+        if fd is None:
+            self._state = state
+            return
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, json.dumps(state).encode("utf-8"))
+        except (IOError, OSError):
+            self._state = state
+
+    def acquire(self):
+        """Block until a call may be sent, then consume one token."""
+        def take_token(state, now):
+            blocked_until = state.get("blocked_until", 0)
+            if blocked_until > now:
+                return blocked_until - now
+            if state["tokens"] >= 1:
+                state["tokens"] -= 1
+                return 0
+            return (1 - state["tokens"]) / self.rate
+
+        while True:
+            wait = self._update(take_token)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def penalize(self, retry_after):
+        """Hold back every caller of this controller for retry_after seconds and drain the bucket."""
+        def block(state, now):
+            state["blocked_until"] = max(state.get("blocked_until", 0), now + retry_after)
+            state["tokens"] = 0
+
+        self._update(block)
+
+
+def get_retry_after(error, default=RATE_LIMIT_RETRY_AFTER):
+    """Return the seconds to wait before retrying a rate limited call, from its Retry-After header."""
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is None:
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        value = headers.get("Retry-After")
+        try:
+            retry_after = float(value)
+        except (TypeError, ValueError):
+            try:
+                retry_after = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError, IndexError):
+                retry_after = default
+    return min(max(1, retry_after), DNAC_RATE_LIMIT_MAX_WAIT)
+
+
+def create_dnac_api(params):
+    """Return a new DNACenterAPI for the connection parameters of a module or action plugin."""
+    # Rate limited calls are retried by call_with_rate_limit, with a retry cap
+    return api.DNACenterAPI(
+        username=params.get("dnac_username"),
+        password=params.get("dnac_password"),
+        base_url="https://{dnac_host}:{dnac_port}".format(
+            dnac_host=params.get("dnac_host"), dnac_port=params.get("dnac_port")
+        ),
+        version=params.get("dnac_version"),
+        verify=params.get("dnac_verify"),
+        debug=params.get("dnac_debug"),
+        wait_on_rate_limit=False,
+    )
+
+
+def get_cached_dnac_api(params, cache_dir=None):
+    """Return a DNACenterAPI that reuses the session and token of earlier tasks."""
+    session_cache = DNACSessionCache(
+        host=params.get("dnac_host"),
+        port=params.get("dnac_port"),
+        username=params.get("dnac_username"),
+        password=params.get("dnac_password"),
+        version=params.get("dnac_version"),
+        cache_dir=cache_dir,
+    )
+    cache_key = (session_cache.key, session_cache.auth_digest, params.get("dnac_verify"), params.get("dnac_debug"))
+    dnac_api = _dnac_api_cache.get(cache_key)
+    if dnac_api is None:
+        dnac_api = create_dnac_api(params)
+        session_cache.attach(dnac_api)
+        _dnac_api_cache[cache_key] = dnac_api
+    return dnac_api
+
+
+def create_rate_limiter(host, port, rate, burst=None):
+    """Return the shared token bucket of the controller, or None when no rate is configured."""
+    if not rate or rate <= 0:
+        return None
+    return DNACRateLimiter(
+        host=host,
+        port=port,
+        rate=rate,
+        burst=burst,
+        state_dir=os.environ.get("DNAC_RATE_LIMIT_DIR"),
+    )
+
+
+def call_with_rate_limit(func, args=(), kwargs=None, rate_limiter=None, max_retries=DNAC_RATE_LIMIT_RETRIES,
+                         log_retry=None):
+    """
+    Call an SDK function once a token of the controller rate limiter is available.
+
+    HTTP 429 and 503 responses are retried up to max_retries times after the delay in their
+    Retry-After header; the delay is shared with the other forks through the rate limiter so
+    they back off as well. log_retry(status_code, retry_after, attempt, max_retries) is called
+    before every retry.
+    """
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return func(*args, **(kwargs or {}))
+        except exceptions.ApiError as e:
+            status_code = getattr(getattr(e, "response", None), "status_code", None)
+            if status_code not in RATE_LIMIT_STATUS_CODES or attempt >= max_retries:
+                raise
+            attempt += 1
+            retry_after = get_retry_after(e)
+            if log_retry is not None:
+                log_retry(status_code, retry_after, attempt, max_retries)
+            if rate_limiter is not None:
+                rate_limiter.penalize(retry_after)
+            else:
+                time.sleep(retry_after)
+
+
+class ChecksumFile(object):
+    """Read-only file wrapper that updates the requested digests with every chunk read.
+
+    The multipart encoder of the SDK reads the file in chunks while the request body is
+    sent, so the checksums are computed in that same single pass over the file.
+    """
+
+    def __init__(self, fileobj, algorithms):
+        self.fileobj = fileobj
+        self.hashes = dict((algorithm, hashlib.new(algorithm)) for algorithm in algorithms)
+        self.size = 0
+
+    def read(self, size=-1):
+        chunk = self.fileobj.read(size)
+        for file_hash in self.hashes.values():
+            file_hash.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    def fileno(self):
+        return self.fileobj.fileno()
+
+    def tell(self):
+        return self.fileobj.tell()
+
+    def close(self):
+        self.fileobj.close()
+
+    def rewind(self):
+        """Go back to the start of the file and restart the digests, before the file is sent again."""
+        self.fileobj.seek(0)
+        self.hashes = dict((algorithm, hashlib.new(algorithm)) for algorithm in self.hashes)
+        self.size = 0
+
+    def digests(self):
+        return dict((algorithm, file_hash.hexdigest()) for algorithm, file_hash in self.hashes.items())
+
+
+class MultipartUpload(object):
+    """Files of one multipart upload, closed when the context exits.
+
+    open() returns the (file name, file object[, content type]) tuple expected in the
+    multipart_fields of the SDK, and monitor_callback can be passed as its
+    multipart_monitor_callback to log the upload progress. When checksums lists
+    'md5' and/or 'sha256', the digests are computed while the files are streamed.
+    """
+
+    def __init__(self, checksums=None, log=None):
+        self.checksums = [algorithm for algorithm in (checksums or []) if algorithm in UPLOAD_CHECKSUM_ALGORITHMS]
+        self.log = log
+        self.files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+        return False
+
+    def open(self, field, file_path, content_type=None):
+        fileobj = open(file_path, "rb")
+        if self.checksums:
+            fileobj = ChecksumFile(fileobj, self.checksums)
+        self.files.append((field, file_path, fileobj))
+        file_name = os.path.basename(file_path)
+        if content_type:
+            return (file_name, fileobj, content_type)
+        return (file_name, fileobj)
+
+    def close(self):
+        for field, file_path, fileobj in self.files:
+            fileobj.close()
+
+    def rewind(self):
+        for field, file_path, fileobj in self.files:
+            if isinstance(fileobj, ChecksumFile):
+                fileobj.rewind()
+            else:
+                fileobj.seek(0)
+
+    def rewinding(self, func):
+        """Wrap the SDK function so every call, rate limit retries included, sends the files from the start."""
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            self.rewind()
+            return func(*args, **kwargs)
+        return call
+
+    def monitor_callback(self, encoder):
+        """Return a monitor callback logging the upload progress every UPLOAD_PROGRESS_STEP percent."""
+        total = encoder.len
+        progress = dict(step=0)
+
+        def callback(monitor):
+            if self.log is None:
+                return
+            percent = int(monitor.bytes_read * 100 / total) if total else 100
+            step = percent // UPLOAD_PROGRESS_STEP
+            if step > progress["step"]:
+                progress["step"] = step
+                self.log("Uploaded {0} of {1} bytes ({2}%)".format(monitor.bytes_read, total, percent))
+
+        return callback
+
+    def summary(self):
+        """Return the path, size and checksums of every uploaded file."""
+        uploaded_files = []
+        for field, file_path, fileobj in self.files:
+            uploaded_file = dict(field=field, path=file_path, size=os.path.getsize(file_path))
+            if isinstance(fileobj, ChecksumFile):
+                uploaded_file.update(fileobj.digests())
+            uploaded_files.append(uploaded_file)
+        return uploaded_files
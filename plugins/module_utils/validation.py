@@ -8,6 +8,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import copy
+
 from ansible.module_utils.common import validation
 
 
@@ -337,6 +339,352 @@ def validate_dict(item, param_spec, param_name, invalid_params, module=None):
     return validation.check_type_dict(item)
 
 
+# Spec keys describing the container itself rather than one of its nested parameters
+COMMON_SPEC_KEYS = frozenset(["type", "elements", "required", "default", "choices", "no_log"])
+
+# Compiled specs keyed on their frozen content, shared by every call in the process
+COMPILED_SPECS = {}
+COMPILED_SPECS_MAX = 256
+
+
+class UncompilableSpecError(Exception):
+    """Raised while compiling a spec whose shape is only handled by the plain validation loop."""
+
+
+def freeze_spec(value):
+    """
+    This function converts a spec into a hashable value used as the key of the compiled spec cache.
+    The type of every scalar is part of the key, so specs such as `default: 1` and `default: True`
+    are kept apart. A TypeError is raised when the spec holds a value that cannot be hashed.
+
+    Args:
+        value (any): The spec, or one of its nested values.
+
+    Returns:
+        tuple: The frozen representation of the value.
+    """
+    if isinstance(value, dict):
+        return ("dict", tuple((key, freeze_spec(val)) for key, val in value.items()))
+
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(freeze_spec(val) for val in value))
+
+    if isinstance(value, (set, frozenset)):
+        return (type(value).__name__, frozenset(freeze_spec(val) for val in value))
+
+    hash(value)
+    return (type(value).__name__, value)
+
+
+def add_no_log_value(param, item, module):
+    """
+    This function registers the value of a `no_log` parameter with the Ansible module so it is
+    masked in the output. An exception is raised when no module object is available.
+
+    Args:
+        param (str): The name of the parameter.
+        item (any): The value of the parameter.
+        module (object): Ansible module object.
+    """
+    if module is not None:
+        module.no_log_values.add(item)
+        return
+
+    msg = "\n\n'{0}' is a no_log parameter".format(param)
+    msg += "\nAnsible module object must be passed to this "
+    msg += "\nfunction to ensure it is not logged\n\n"
+    raise Exception(msg)
+
+
+def compile_choices_check(choice, message=None):
+    """
+    This function builds the check of the `choices` of a parameter. List and tuple choices are
+    looked up in a frozenset; unhashable items and other kinds of choices use the `in` operator
+    on the original value, as the plain validation loop does.
+
+    Args:
+        choice (any): The `choices` of the parameter spec.
+        message (str): Format string of the error, called with the item. Defaults to the message
+                       of `validate_list_of_dicts_plain`, which lists the valid choices.
+
+    Returns:
+        callable: Function called with the item and the list collecting the error messages.
+    """
+    choice_set = None
+    if isinstance(choice, (list, tuple, set, frozenset)):
+        try:
+            choice_set = frozenset(choice)
+        except TypeError:
+            choice_set = None
+
+    def check_choice(item, invalid_params):
+        if choice_set is None:
+            missing = item not in choice
+        else:
+            try:
+                missing = item not in choice_set
+            except TypeError:
+                missing = item not in choice
+
+        if not missing:
+            return
+        if message is not None:
+            invalid_params.append(message.format(item))
+        else:
+            invalid_params.append(
+                f"{item} : Invalid choice provided. Valid choices are {', '.join(choice)}"
+            )
+
+    return check_choice
+
+
+def compile_entry(spec):
+    """
+    This function compiles the spec of a dictionary entry into a single validation function.
+    The validator, default, required flag, choices and `no_log` flag of every parameter are
+    resolved once, so validating an entry is a single pass over the precomputed parameters.
+
+    Args:
+        spec (dict): An argument spec dict, as accepted by `validate_list_of_dicts`.
+
+    Returns:
+        callable: Function called with the entry, the list collecting the error messages and the
+        Ansible module object, returning the normalized entry.
+    """
+    params = []
+    for param, param_spec in spec.items():
+        if not isinstance(param_spec, dict):
+            raise UncompilableSpecError(param)
+
+        default = param_spec.get("default")
+        choice = param_spec.get("choices")
+        params.append(
+            (
+                param,
+                param_spec.get("required"),
+                default,
+                isinstance(default, (list, dict, set)),
+                compile_validator(param_spec),
+                compile_choices_check(choice) if choice else None,
+                param_spec.get("no_log"),
+            )
+        )
+
+    def validate_entry(list_entry, invalid_params, module):
+        valid_params_dict = {}
+        for param, required, default, copy_default, validator, check_choice, no_log in params:
+            item = list_entry.get(param)
+            if item is None:
+                if required:
+                    invalid_params.append(
+                        "{0} : Required parameter not found".format(param)
+                    )
+                else:
+                    # Mutable defaults are copied since the compiled spec outlives this call
+                    valid_params_dict[param] = copy.deepcopy(default) if copy_default else default
+                continue
+
+            item = validator(item, param, invalid_params, module)
+            if check_choice is not None:
+                check_choice(item, invalid_params)
+
+            if no_log:
+                add_no_log_value(param, item, module)
+
+            valid_params_dict[param] = item
+
+        return valid_params_dict
+
+    return validate_entry
+
+
+def compile_list_validator(param_spec):
+    """
+    This function compiles the spec of a `list` parameter. Lists of dictionaries are validated
+    with the compiled spec of their elements; any spec or item outside the common shape is
+    handed to `validate_list` so the result and the error messages stay the same.
+
+    Args:
+        param_spec (dict): The parameter's specification, with `type: list`.
+
+    Returns:
+        callable: Function called with the item, the parameter name, the list collecting the
+        error messages and the Ansible module object.
+    """
+
+    def fallback(item, param_name, invalid_params, module):
+        return validate_list(item, param_spec, param_name, invalid_params, module)
+
+    if len(param_spec) == 1:
+        def validate_plain_list(item, param_name, invalid_params, module):
+            if type(item).__name__ != "list":
+                return fallback(item, param_name, invalid_params, module)
+
+            return validation.check_type_list(item)
+
+        return validate_plain_list
+
+    if "elements" not in param_spec:
+        return fallback
+
+    elements = param_spec["elements"]
+    validate_element = None
+    if elements == "dict":
+        filtered_param_spec = {
+            key: value
+            for key, value in param_spec.items()
+            if key not in COMMON_SPEC_KEYS
+        }
+        if filtered_param_spec:
+            try:
+                validate_element = compile_entry(filtered_param_spec)
+            except UncompilableSpecError:
+                return fallback
+
+    def validate_list_items(item, param_name, invalid_params, module):
+        if type(item).__name__ != "list":
+            return fallback(item, param_name, invalid_params, module)
+
+        if not elements:
+            return item
+
+        list_invalid_params = []
+        try:
+            normalized = item
+            if validate_element is not None:
+                # Nested entries are validated without the module object, as in validate_list
+                normalized = [
+                    validate_element(element, list_invalid_params, None)
+                    for element in item
+                ]
+
+            for element in normalized:
+                if type(element).__name__ != elements:
+                    list_invalid_params.append(
+                        "{0} is not of the same datatype as expected which is {1}".format(
+                            element, elements
+                        )
+                    )
+        except Exception:
+            return fallback(item, param_name, invalid_params, module)
+
+        invalid_params.extend(list_invalid_params)
+        return normalized
+
+    return validate_list_items
+
+
+def compile_dict_validator(param_spec):
+    """
+    This function compiles the spec of a `dict` parameter, validating its nested parameters with
+    a compiled entry spec.
+
+    Args:
+        param_spec (dict): The parameter's specification, with `type: dict`.
+
+    Returns:
+        callable: Function called with the item, the parameter name, the list collecting the
+        error messages and the Ansible module object.
+    """
+    filtered_param_spec = {
+        key: value
+        for key, value in param_spec.items()
+        if key not in COMMON_SPEC_KEYS
+    }
+    validate_entry = compile_entry(filtered_param_spec) if filtered_param_spec else None
+
+    def validate_dict_items(item, param_name, invalid_params, module):
+        if type(item).__name__ != "dict":
+            return validate_dict(item, param_spec, param_name, invalid_params, module)
+
+        if validate_entry is not None:
+            item = validate_entry(item, invalid_params, module)
+
+        return validation.check_type_dict(item)
+
+    return validate_dict_items
+
+
+def compile_validator(param_spec):
+    """
+    This function returns the validation function for one parameter based on its `type`.
+
+    Args:
+        param_spec (dict): The parameter's specification.
+
+    Returns:
+        callable: Function called with the item, the parameter name, the list collecting the
+        error messages and the Ansible module object, returning the validated item.
+    """
+    data_type = param_spec.get("type")
+    if data_type == "list":
+        return compile_list_validator(param_spec)
+
+    if data_type == "dict":
+        return compile_dict_validator(param_spec)
+
+    if data_type == "raw":
+        return lambda item, *_: item
+
+    scalar_validator = {
+        "str": validate_str,
+        "int": validate_integer_within_range,
+        "float": validate_float,
+        "bool": validate_bool,
+    }.get(data_type)
+
+    if scalar_validator is None:
+        def report_unsupported(item, param_name, invalid_params, module):
+            invalid_params.append(
+                "{0}:{1} : Unsupported data type {2}.".format(
+                    param_name, item, data_type
+                )
+            )
+            return item
+
+        return report_unsupported
+
+    def validate_scalar(item, param_name, invalid_params, module):
+        return scalar_validator(item, param_spec, param_name, invalid_params, module)
+
+    return validate_scalar
+
+
+def compile_spec(spec):
+    """
+    This function compiles an argument spec into a tree of validation functions and caches it,
+    so the spec is walked once instead of once for every entry of the playbook list, and later
+    calls with the same spec reuse it.
+
+    Args:
+        spec (dict): An argument spec dict, as accepted by `validate_list_of_dicts`.
+
+    Returns:
+        callable or None: The compiled entry validator, or None when the spec has a shape that
+        is only handled by the plain validation loop.
+    """
+    try:
+        cache_key = freeze_spec(spec)
+    except TypeError:
+        cache_key = None
+
+    if cache_key is not None and cache_key in COMPILED_SPECS:
+        return COMPILED_SPECS[cache_key]
+
+    try:
+        # Compile from a copy so later changes to the caller's spec do not leak into the cache
+        compiled = compile_entry(copy.deepcopy(spec))
+    except UncompilableSpecError:
+        compiled = None
+
+    if cache_key is not None:
+        if len(COMPILED_SPECS) >= COMPILED_SPECS_MAX:
+            COMPILED_SPECS.clear()
+        COMPILED_SPECS[cache_key] = compiled
+
+    return compiled
+
+
 def validate_list_of_dicts(param_list, spec, module=None):
     """Validate/Normalize playbook params. Will raise when invalid parameters found.
     param_list: a playbook parameter list of dicts
@@ -344,6 +692,39 @@ def validate_list_of_dicts(param_list, spec, module=None):
         e.g. spec = dict(ip=dict(required=True, type='bool'),
                         foo=dict(type='str', default='bar'))
     return: list of normalized input data
+    The spec is compiled once with `compile_spec` and the compiled validator is applied to
+    every entry; specs it cannot compile are validated with the plain loop.
+    """
+
+    if not spec or not isinstance(spec, dict):
+        return validate_list_of_dicts_plain(param_list, spec, module)
+
+    validate_entry = compile_spec(spec)
+    if validate_entry is None:
+        return validate_list_of_dicts_plain(param_list, spec, module)
+
+    invalid_params = []
+    normalized = [
+        validate_entry(list_entry, invalid_params, module)
+        for list_entry in param_list
+    ]
+
+    return normalized, invalid_params
+
+
+def validate_list_of_dicts_plain(param_list, spec, module=None):
+    """
+    This function validates the playbook list against the spec one parameter at a time,
+    without compiling the spec. It is used for empty specs and for specs that `compile_spec`
+    does not handle.
+
+    Args:
+        param_list (list): A playbook parameter list of dicts.
+        spec (dict): An argument spec dict.
+        module (object, optional): Ansible module object, required if any parameter has `no_log` enabled.
+
+    Returns:
+        tuple: The list of normalized entries and the list of error messages.
     """
 
     v = validation
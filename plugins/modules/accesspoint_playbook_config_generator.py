@@ -3178,6 +3178,33 @@ def main():
             "type": "int",
             "default": 2
         },
+        "dnac_task_poll_initial_delay": {
+            "type": "float"
+        },
+        "dnac_task_poll_backoff_factor": {
+            "type": "float"
+        },
+        "dnac_task_poll_max_delay": {
+            "type": "float"
+        },
+        "dnac_task_poll_jitter": {
+            "type": "float"
+        },
+        "dnac_max_workers": {
+            "type": "int"
+        },
+        "dnac_rate_limit": {
+            "type": "float"
+        },
+        "dnac_rate_limit_burst": {
+            "type": "int"
+        },
+        "dnac_rate_limit_retries": {
+            "type": "int"
+        },
+        "dnac_lookup_cache": {
+            "type": "bool"
+        },
         "validate_response_schema": {
             "type": "bool",
             "default": True
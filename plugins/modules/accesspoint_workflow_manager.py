@@ -4611,6 +4611,15 @@ def main():
         "dnac_log_append": {"type": "bool", "default": True},
         "dnac_api_task_timeout": {"type": "int", "default": 1200},
         "dnac_task_poll_interval": {"type": "int", "default": 2},
+        "dnac_task_poll_initial_delay": {"type": "float"},
+        "dnac_task_poll_backoff_factor": {"type": "float"},
+        "dnac_task_poll_max_delay": {"type": "float"},
+        "dnac_task_poll_jitter": {"type": "float"},
+        "dnac_max_workers": {"type": "int"},
+        "dnac_rate_limit": {"type": "float"},
+        "dnac_rate_limit_burst": {"type": "int"},
+        "dnac_rate_limit_retries": {"type": "int"},
+        "dnac_lookup_cache": {"type": "bool"},
         "next_task_after_interval": {"type": "int", "default": 5},
         "config": {"required": True, "type": "list", "elements": "dict"},
         "validate_response_schema": {"type": "bool", "default": True},
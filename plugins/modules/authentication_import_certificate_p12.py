@@ -16,6 +16,13 @@ extends_documentation_fragment:
   - cisco.dnac.module
 author: Rafael Campos (@racampos)
 options:
+  fileChecksums:
+    description:
+      - Checksums computed while the file is read for the upload, in a single pass.
+      - The path, size and checksums of the uploaded files are returned in C(uploaded_files).
+    type: list
+    elements: str
+    choices: [md5, sha256]
   listOfUsers:
     description: ListOfUsers query parameter. Specify whether the certificate will be used for controller ("server"), disaster
       recovery ("ipsec") or both ("server, ipsec"). If no value is provided, the default value taken will be "server".
@@ -73,4 +80,20 @@ dnac_response:
       },
       "version": "string"
     }
+uploaded_files:
+  description:
+    - The files sent in the multipart upload, with their path, size and, when C(fileChecksums) is set, the
+      requested checksums computed while they were streamed.
+  returned: when a file was uploaded
+  type: list
+  elements: dict
+  sample: >
+    [
+      {
+        "field": "p12FileUpload",
+        "path": "/tmp/cert.p12",
+        "size": 4096,
+        "sha256": "string"
+      }
+    ]
 """
@@ -473,6 +473,23 @@ options:
           at one go
         type: bool
         default: false
+      poll_discovery_by_id:
+        description:
+          - Tracks the created discovery by its ID instead
+            of searching it by name in the discoveries
+            range on every poll.
+          - The discovery ID is taken from the discovery
+            task, or resolved once by name, and only that
+            discovery is polled, with the backoff of the
+            'dnac_task_poll_*' parameters.
+          - The discovered devices are retrieved page by
+            page while the discovery is still running, and
+            all of them are retrieved again once it is
+            complete so their reachability is up to date.
+          - Recommended when Catalyst Center holds many
+            historical discoveries.
+        type: bool
+        default: false
 requirements:
   - dnacentersdk == 2.6.10
   - python >= 3.9
@@ -485,6 +502,8 @@ notes:
     discovery.Discovery.get_discovered_network_devices_by_discovery_id',
     discovery.Discovery.delete_discovery_by_id discovery.Discovery.delete_all_discovery
     discovery.Discovery.get_count_of_all_discovery_jobs
+    discovery.Discovery.get_discovery_by_id
+    discovery.Discovery.get_discovered_devices_by_range
   - Paths used are
     get /dna/intent/api/v2/global-credential
     post /dna/intent/api/v1/discovery get /dna/intent/api/v1/task/{taskId}
@@ -492,6 +511,8 @@ notes:
     get /dna/intent/api/v1/discovery/{id}/network-device
     delete /dna/intent/api/v1/discovery/{id} delete
     /dna/intent/api/v1/delete get /dna/intent/api/v1/discovery/count
+    get /dna/intent/api/v1/discovery/{id}
+    get /dna/intent/api/v1/discovery/{id}/network-device/{startIndex}/{recordsToReturn}
   - Removed 'global_cli_len' option in v6.12.0.
 """
 EXAMPLES = r"""
@@ -765,6 +786,9 @@ from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
 import time
 import re
 
+# Largest page accepted by the 'get_discovered_devices_by_range' API
+DISCOVERED_DEVICES_PAGE_SIZE = 500
+
 
 class Discovery(DnacBase):
     def __init__(self, module):
@@ -780,10 +804,14 @@ class Discovery(DnacBase):
           following instance attributes:
           - self.creds_ids_list: An empty list that will be used to store
                                  credentials IDs.
+          - self.discovery_id: The ID of the discovery created by the module.
+          - self.discovered_devices: The devices of the discovery retrieved so far.
         """
 
         super().__init__(module)
         self.creds_ids_list = []
+        self.discovery_id = None
+        self.discovered_devices = []
         self.supported_states = ["merged", "deleted"]
 
     def validate_input(self, state=None):
@@ -835,6 +863,11 @@ class Discovery(DnacBase):
                 "required": False,
                 "default": True,
             },
+            "poll_discovery_by_id": {
+                "type": "bool",
+                "required": False,
+                "default": False,
+            },
         }
 
         if state == "merged":
@@ -1684,6 +1717,7 @@ class Discovery(DnacBase):
 
         result = False
         params = dict(task_id=task_id)
+        poller = self.get_task_poller("discovery")
         while True:
             response = self.dnac_apply["exec"](
                 family="task",
@@ -1720,16 +1754,26 @@ class Discovery(DnacBase):
             try:
                 progress_value = int(progress)
                 result = True
+                # The progress of a completed discovery task is the discovery ID
+                self.discovery_id = progress
                 self.log("The discovery process is completed", "INFO")
                 self.result.update(dict(discovery_task=response))
+                poller.done()
                 return result
             except Exception:
                 self.log(
-                    "The progress status is {0}, continue to check the status after 3 seconds. Putting into sleep for 3 seconds".format(
+                    "The progress status is {0}, continue to check the status after the next poll interval".format(
                         progress
                     )
                 )
-                time.sleep(3)
+                if poller.is_timed_out():
+                    msg = "Discovery task with id {0} has not completed in {1} seconds - Progress: {2}".format(
+                        task_id, poller.timeout, progress
+                    )
+                    self.log(msg, "CRITICAL")
+                    self.module.fail_json(msg=msg)
+
+                poller.wait()
 
     def get_deleted_task_status(self, task_id=None):
         """
@@ -1746,6 +1790,7 @@ class Discovery(DnacBase):
 
         result = False
         params = dict(task_id=task_id)
+        poller = self.get_task_poller("discovery")
         while True:
             response = self.dnac_apply["exec"](
                 family="task",
@@ -1783,14 +1828,22 @@ class Discovery(DnacBase):
                 result = True
                 self.log("The discovery process is completed", "INFO")
                 self.result.update(dict(discovery_task=response))
+                poller.done()
                 return result
 
             self.log(
-                "The progress status is {0}, continue to check the status after 3 seconds. Putting into sleep for 3 seconds".format(
+                "The progress status is {0}, continue to check the status after the next poll interval".format(
                     progress
                 )
             )
-            time.sleep(3)
+            if poller.is_timed_out():
+                msg = "Discovery deletion task with id {0} has not completed in {1} seconds - Progress: {2}".format(
+                    task_id, poller.timeout, progress
+                )
+                self.log(msg, "CRITICAL")
+                self.module.fail_json(msg=msg)
+
+            poller.wait()
 
     def lookup_discovery_by_range_via_name(self):
         """
@@ -1861,6 +1914,9 @@ class Discovery(DnacBase):
                        and returns None.
         """
 
+        if self.validated_config[0].get("poll_discovery_by_id"):
+            return self.get_discovery_by_id_until_success(self.resolve_discovery_id())
+
         result = False
         aborted = False
         discovery = self.lookup_discovery_by_range_via_name()
@@ -1872,16 +1928,26 @@ class Discovery(DnacBase):
             self.log(msg, "INFO")
             self.module.fail_json(msg=msg)
 
+        poller = self.get_task_poller("discovery")
         while True:
             discovery = self.lookup_discovery_by_range_via_name()
             discovery_condition = discovery.get("discoveryCondition")
             if discovery_condition == "Complete":
                 result = True
+                poller.done()
                 break
             elif discovery_condition == "Aborted":
                 aborted = True
                 break
-            time.sleep(3)
+
+            if poller.is_timed_out():
+                msg = "Discovery with name {0} has not completed in {1} seconds -- Discovery result: {2}".format(
+                    str(self.validated_config[0].get("discovery_name")), poller.timeout, str(discovery)
+                )
+                self.log(msg, "CRITICAL")
+                self.module.fail_json(msg=msg)
+
+            poller.wait()
 
         if not result:
             if aborted is True:
@@ -1902,6 +1968,211 @@ class Discovery(DnacBase):
         self.result.update(dict(discovery_range=discovery))
         return discovery
 
+    def resolve_discovery_id(self):
+        """
+        Return the ID of the discovery managed by the module, looking it up by name
+        only when it was not taken from the discovery task.
+
+        Returns:
+          - discovery_id: The ID of the discovery. The function fails the module
+                          when no discovery with the configured name exists.
+        """
+
+        if self.discovery_id:
+            return self.discovery_id
+
+        discovery = self.lookup_discovery_by_range_via_name()
+        if not discovery:
+            msg = "Cannot find any discovery task with name {0} -- Discovery result: {1}".format(
+                str(self.validated_config[0].get("discovery_name")), str(discovery)
+            )
+            self.log(msg, "CRITICAL")
+            self.module.fail_json(msg=msg)
+
+        self.discovery_id = discovery.get("id")
+        self.log(
+            "Resolved the ID of the discovery {0}: {1}".format(
+                self.validated_config[0].get("discovery_name"), self.discovery_id
+            ),
+            "DEBUG",
+        )
+        return self.discovery_id
+
+    def get_discovery_by_id_until_success(self, discovery_id):
+        """
+        Poll a discovery by its ID in the Cisco Catalyst Center until it is complete,
+        retrieving the devices it discovered in the meantime.
+
+        Parameters:
+          - discovery_id: ID of the discovery to poll.
+
+        Returns:
+          - discovery: The completed discovery. If the discovery is aborted or the
+                       task timeout is reached, the function fails the module.
+        """
+
+        poller = self.get_task_poller("discovery")
+        while True:
+            response = self.dnac_apply["exec"](
+                family="discovery",
+                function="get_discovery_by_id",
+                params=dict(id=discovery_id),
+                op_modifies=True,
+            )
+            discovery = response.get("response") or {}
+            discovery_condition = discovery.get("discoveryCondition")
+            self.log(
+                "Discovery {0} condition is {1} after {2:.2f} seconds".format(
+                    discovery_id, discovery_condition, poller.elapsed()
+                ),
+                "DEBUG",
+            )
+            if discovery_condition == "Complete":
+                poller.done()
+                break
+
+            if discovery_condition == "Aborted":
+                msg = (
+                    "Discovery with name {0} is aborted by the user on the GUI".format(
+                        str(self.validated_config[0].get("discovery_name"))
+                    )
+                )
+                self.log(msg, "CRITICAL")
+                self.module.fail_json(msg=msg)
+
+            if poller.is_timed_out():
+                msg = "Discovery with id {0} has not completed in {1} seconds -- Discovery result: {2}".format(
+                    discovery_id, poller.timeout, str(discovery)
+                )
+                self.log(msg, "CRITICAL")
+                self.module.fail_json(msg=msg)
+
+            for device in self.stream_discovered_devices(discovery_id):
+                self.log(
+                    "Device {0} discovered with reachability status {1}".format(
+                        device.get("managementIpAddress"), device.get("reachabilityStatus")
+                    ),
+                    "INFO",
+                )
+
+            poller.wait()
+
+        self.result.update(dict(discovery_range=discovery))
+        return discovery
+
+    def get_discovered_devices_page(self, discovery_id, start_index):
+        """
+        Retrieve one page of the devices of a discovery.
+
+        Parameters:
+          - discovery_id: ID of the discovery to retrieve devices from.
+          - start_index: Index of the first device of the page, starting at 1.
+
+        Returns:
+          - page: The devices of the page, an empty list when there are none.
+        """
+
+        response = self.dnac_apply["exec"](
+            family="discovery",
+            function="get_discovered_devices_by_range",
+            params=dict(
+                id=discovery_id,
+                start_index=start_index,
+                records_to_return=DISCOVERED_DEVICES_PAGE_SIZE,
+            ),
+            op_modifies=True,
+        )
+        page = response.get("response") or []
+        self.log(
+            "Retrieved {0} device(s) of the discovery {1} from index {2}".format(
+                len(page), discovery_id, start_index
+            ),
+            "DEBUG",
+        )
+        return page
+
+    def stream_discovered_devices(self, discovery_id):
+        """
+        Retrieve the devices of a discovery that were not retrieved yet, page by page.
+        It is used to report the progress of a running discovery, the devices are
+        retrieved again with 'refresh_discovered_devices' once it is complete.
+
+        Parameters:
+          - discovery_id: ID of the discovery to retrieve devices from.
+
+        Yields:
+          - device: Every newly discovered device, which is also appended to
+                    'self.discovered_devices'.
+        """
+
+        known_ids = set(device.get("id") for device in self.discovered_devices)
+        while True:
+            page = self.get_discovered_devices_page(discovery_id, len(self.discovered_devices) + 1)
+            for device in page:
+                if device.get("id") in known_ids:
+                    continue
+
+                known_ids.add(device.get("id"))
+                self.discovered_devices.append(device)
+                yield device
+
+            if len(page) < DISCOVERED_DEVICES_PAGE_SIZE:
+                break
+
+    def refresh_discovered_devices(self, discovery_id):
+        """
+        Retrieve all the devices of a discovery again, from the first page, so the
+        reachability status of the devices retrieved while the discovery was running
+        is up to date.
+
+        Parameters:
+          - discovery_id: ID of the discovery to retrieve devices from.
+
+        Returns:
+          - devices: All the devices of the discovery, also stored in 'self.discovered_devices'.
+        """
+
+        devices = []
+        known_ids = set()
+        while True:
+            page = self.get_discovered_devices_page(discovery_id, len(devices) + 1)
+            for device in page:
+                if device.get("id") not in known_ids:
+                    known_ids.add(device.get("id"))
+                    devices.append(device)
+
+            if len(page) < DISCOVERED_DEVICES_PAGE_SIZE:
+                break
+
+        self.discovered_devices = devices
+        return devices
+
+    def check_devices_reachability(self, devices):
+        """
+        Log the reachability of the discovered devices.
+
+        Parameters:
+          - devices: The devices of the discovery.
+
+        Returns:
+          - result: True once the reachability of the devices is known, whether
+                    all, some or none of them are reachable.
+        """
+
+        if all(res.get("reachabilityStatus") == "Success" for res in devices):
+            self.log("All devices in the range are reachable", "INFO")
+            return True
+
+        if any(res.get("reachabilityStatus") == "Success" for res in devices):
+            self.log("Some devices in the range are reachable", "INFO")
+            return True
+
+        self.log(
+            "All devices are not reachable, but discovery is completed",
+            "WARNING",
+        )
+        return True
+
     def get_discovery_device_info(self, discovery_id=None, task_id=None):
         """
         Retrieve the information of devices discovered by a specific discovery
@@ -1917,6 +2188,20 @@ class Discovery(DnacBase):
           - result: True if all devices are reachable, False otherwise.
         """
 
+        if self.validated_config[0].get("poll_discovery_by_id"):
+            devices = self.refresh_discovered_devices(discovery_id)
+            result = self.check_devices_reachability(devices)
+            self.log(
+                "Discovery with id {0} found {1} device(s), {2} of them reachable".format(
+                    discovery_id,
+                    len(devices),
+                    sum(1 for device in devices if device.get("reachabilityStatus") == "Success"),
+                ),
+                "INFO",
+            )
+            self.result.update(dict(discovery_device_info=devices))
+            return result
+
         params = dict(
             id=discovery_id,
             task_id=task_id,
@@ -1939,22 +2224,8 @@ class Discovery(DnacBase):
                 ),
                 "DEBUG",
             )
-            if all(res.get("reachabilityStatus") == "Success" for res in devices):
-                result = True
-                self.log("All devices in the range are reachable", "INFO")
-                break
-
-            elif any(res.get("reachabilityStatus") == "Success" for res in devices):
-                result = True
-                self.log("Some devices in the range are reachable", "INFO")
-                break
-
-            elif all(res.get("reachabilityStatus") != "Success" for res in devices):
-                result = True
-                self.log(
-                    "All devices are not reachable, but discovery is completed",
-                    "WARNING",
-                )
+            result = self.check_devices_reachability(devices)
+            if result:
                 break
 
             count += 1
@@ -2230,6 +2501,15 @@ def main():
         "config_verify": {"type": "bool", "default": False},
         "dnac_api_task_timeout": {"type": "int", "default": 1200},
         "dnac_task_poll_interval": {"type": "int", "default": 2},
+        "dnac_task_poll_initial_delay": {"type": "float"},
+        "dnac_task_poll_backoff_factor": {"type": "float"},
+        "dnac_task_poll_max_delay": {"type": "float"},
+        "dnac_task_poll_jitter": {"type": "float"},
+        "dnac_max_workers": {"type": "int"},
+        "dnac_rate_limit": {"type": "float"},
+        "dnac_rate_limit_burst": {"type": "int"},
+        "dnac_rate_limit_retries": {"type": "int"},
+        "dnac_lookup_cache": {"type": "bool"},
         "config": {"required": True, "type": "list", "elements": "dict"},
         "state": {"default": "merged", "choices": ["merged", "deleted"]},
     }
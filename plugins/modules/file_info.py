@@ -35,6 +35,17 @@ options:
     description:
       - The filename used to save the download file.
     type: str
+  dest:
+    description:
+      - Local file or directory the file is streamed to, in chunks, instead of being returned in C(data).
+      - When it is a directory, the file is named after I(filename) or the name sent by Cisco DNA Center.
+      - Only the metadata of the downloaded file (path, size and checksum) is returned.
+    type: path
+  checksum:
+    description:
+      - Checksum algorithm computed while the file is written to I(dest).
+    type: str
+    choices: [md5, sha1, sha256]
 requirements:
   - dnacentersdk >= 2.11.0
   - python >= 3.12
@@ -63,10 +74,28 @@ EXAMPLES = r"""
     headers: "{{my_headers | from_json}}"
     fileId: string
   register: result
+
+- name: Download a large file to disk with its checksum
+  cisco.dnac.file_info:
+    dnac_host: "{{dnac_host}}"
+    dnac_username: "{{dnac_username}}"
+    dnac_password: "{{dnac_password}}"
+    dnac_verify: "{{dnac_verify}}"
+    dnac_port: "{{dnac_port}}"
+    dnac_version: "{{dnac_version}}"
+    dnac_debug: "{{dnac_debug}}"
+    fileId: string
+    dest: /tmp/downloads/
+    checksum: sha256
+  register: result
 """
 RETURN = r"""
 dnac_response:
-  description: A dictionary or list with the response returned by the Cisco DNAC Python SDK
+  description:
+    - A dictionary or list with the response returned by the Cisco DNAC Python SDK.
+    - When I(dest) is set, only the C(filename), C(dirpath), C(path), C(size), C(content_type)
+      and, with I(checksum), the C(checksum) and C(checksum_algorithm) of the downloaded file.
+    - Binary files downloaded without I(dest) are returned base64 encoded, with C(encoding) set to C(base64).
   returned: always
   type: dict
   sample: >
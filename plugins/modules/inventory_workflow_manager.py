@@ -502,6 +502,22 @@ options:
                 complete hierarchical path of the site (For example,
                 "Global/USA/San Francisco/BGL_18/floor_pnp").
             type: str
+          file_path:
+            description:
+              - Path of the CSV file the exported rows are written to.
+              - Defaults to the file name returned by Cisco Catalyst Center for
+                credential details, or C(devices-<date>.csv) for device details,
+                in the current directory.
+              - The rows are decrypted, parsed and written one at a time, so the
+                export does not hold the whole inventory in memory.
+            type: str
+          columns:
+            description:
+              - CSV columns written to the file, in the given order.
+              - All the exported columns are written when not specified.
+              - The export fails when a column is not in the exported file.
+            type: list
+            elements: str
       export_device_details_limit:
         description:
           - Maximum devices per export batch.
@@ -1361,8 +1377,10 @@ except ImportError:
 
 import csv
 import time
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
-from io import BytesIO, StringIO
+from io import BytesIO, TextIOWrapper
+import os
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
@@ -1493,6 +1511,8 @@ class Inventory(DnacBase):
                 "password": {"type": "str"},
                 "operation_enum": {"type": "str"},
                 "parameters": {"type": "list", "elements": "str"},
+                "file_path": {"type": "str"},
+                "columns": {"type": "list", "elements": "str"},
             },
             "provision_wired_device": {
                 "type": "list",
@@ -1578,6 +1598,23 @@ class Inventory(DnacBase):
         # If no information is available, return an empty list
         return []
 
+    def get_device_list_page(self, offset):
+        """
+        Retrieve one page of the devices present in Cisco Catalyst Center.
+        Parameters:
+            offset (int): The offset of the page.
+        Returns:
+            list: The device details of the page.
+        """
+        response = self.dnac._exec(
+            family="devices",
+            function="get_device_list",
+            params={"offset": offset, "limit": self.get_device_details_limit()},
+        )
+        self.log("Received API response from 'get_device_list' at offset %s: %s", "DEBUG", offset, response)
+
+        return (response or {}).get("response") or []
+
     def get_existing_devices_in_ccc(self):
         """
         Check which devices already exists and retrieve the list of devices that already exist in Cisco Catalyst Center.
@@ -1637,6 +1674,17 @@ class Inventory(DnacBase):
                     device_ip = ip["managementIpAddress"]
                     existing_devices_in_ccc.add(device_ip)
 
+                if len(response) >= limit and self.get_max_workers() > 1:
+                    total = self.get_api_count("devices", "get_device_count")
+                    if total is not None:
+                        remaining_devices = self.fetch_pages_concurrently(
+                            self.get_device_list_page, (offset - 1) * limit, limit, total, first_index=0
+                        )
+                        existing_devices_in_ccc.update(
+                            device["managementIpAddress"] for device in remaining_devices
+                        )
+                        break
+
             except Exception as e:
                 self.status = "failed"
                 self.msg = "Error while fetching device details from Cisco Catalyst Center: {0}".format(
@@ -1858,9 +1906,12 @@ class Inventory(DnacBase):
             response (requests.Response): HTTP response object containing the encrypted CSV file.
             password (str): Password used for decrypting the CSV file.
         Returns:
-            csv.DictReader: A CSV reader object for the decrypted content, allowing iteration over rows as dictionaries.
+            A context manager giving a csv.DictReader over the decrypted content, allowing iteration over
+            rows as dictionaries, and closing the zip archive and its member when it exits.
         Description:
             Decrypts and reads a CSV-like file from the given HTTP response using the provided password.
+            The rows are decrypted and parsed from the zip member stream as the reader is iterated,
+            instead of decoding the whole file into one string first.
         """
 
         zip_data = BytesIO(response.data)
@@ -1897,6 +1948,23 @@ class Inventory(DnacBase):
             self.result["response"] = self.msg
             return self
 
+        return self.read_decrypted_csv(zip_data, encryption_method, password)
+
+    @contextmanager
+    def read_decrypted_csv(self, zip_data, encryption_method, password):
+        """
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            zip_data (BytesIO): The encrypted zip archive.
+            encryption_method (str): The pyzipper encryption of the archive.
+            password (str): Password used for decrypting the CSV file.
+        Yields:
+            csv.DictReader: A CSV reader over the decrypted file, valid until the context exits.
+        Description:
+            Opens the single file of the archive with the password, its content is decrypted and
+            decoded chunk by chunk while the CSV rows are read. The archive and the file are closed
+            when the context exits.
+        """
         # Create a PyZipper object with the password
         with pyzipper.AESZipFile(
             zip_data, "r", compression=pyzipper.ZIP_LZMA, encryption=encryption_method
@@ -1904,22 +1972,15 @@ class Inventory(DnacBase):
             # Assuming there is a single file in the zip archive
             file_name = zip_ref.namelist()[0]
 
-            # Extract the content of the file with the provided password
-            file_content_binary = zip_ref.read(file_name, pwd=password.encode("utf-8"))
-
-        # Now 'file_content_binary' contains the binary content of the decrypted file
-        # Since the content is text, so we can decode it
-        file_content_text = file_content_binary.decode("utf-8")
-
-        # Now 'file_content_text' contains the text content of the decrypted file
-        self.log(
-            "Text content of decrypted file: {0}".format(file_content_text), "DEBUG"
-        )
-
-        # Parse the CSV-like string into a list of dictionaries
-        csv_reader = csv.DictReader(StringIO(file_content_text))
-
-        return csv_reader
+            with zip_ref.open(file_name, pwd=password.encode("utf-8")) as file_stream:
+                csv_reader = csv.DictReader(TextIOWrapper(file_stream, encoding="utf-8", newline=""))
+                self.log(
+                    "Reading decrypted file '{0}' with columns: {1}".format(
+                        file_name, csv_reader.fieldnames
+                    ),
+                    "DEBUG",
+                )
+                yield csv_reader
 
     def export_device_details(self):
         """
@@ -1932,7 +1993,8 @@ class Inventory(DnacBase):
             This function exports device details from Cisco Catalyst Center based on the provided IP addresses in the configuration.
             It retrieves the device UUIDs, calls the export device list API, and downloads the exported data of both device details and
             and device credentials with an encrtypted zip file with password into CSV format.
-            The CSV data is then parsed and written to a file.
+            The CSV rows are decrypted, parsed and written to the file one at a time, keeping only
+            the requested 'columns' when they are given.
         """
 
         device_ips = self.get_device_ips_from_config_priority()
@@ -1973,54 +2035,82 @@ class Inventory(DnacBase):
             # Export the device data in a batch of 500 devices at a time by default
             start = 0
             device_batch_size = self.config[0].get("export_device_details_limit", 500)
-            device_data = []
-            first_run = True
-
-            while start < len(device_uuids):
-                device_ids_list = device_uuids[start : start + device_batch_size]
-                payload_params = {
-                    "deviceUuids": device_ids_list,
-                    "password": password,
-                    "operationEnum": export_device_list.get("operation_enum", "0"),
-                    "parameters": export_device_list.get("parameters"),
-                }
+            output_file_name = export_device_list.get("file_path")
+            columns = export_device_list.get("columns")
+            csv_file = None
+            csv_writer = None
+            row_count = 0
+            completed = False
 
-                response = self.trigger_export_api(payload_params)
-                self.check_return_status()
+            try:
+                while start < len(device_uuids):
+                    device_ids_list = device_uuids[start : start + device_batch_size]
+                    payload_params = {
+                        "deviceUuids": device_ids_list,
+                        "password": password,
+                        "operationEnum": export_device_list.get("operation_enum", "0"),
+                        "parameters": export_device_list.get("parameters"),
+                    }
 
-                if payload_params["operationEnum"] == "0":
-                    temp_file_name = response.filename
-                    if first_run:
-                        output_file_name = temp_file_name.split(".")[0] + ".csv"
-                    csv_reader = self.decrypt_and_read_csv(response, password)
+                    response = self.trigger_export_api(payload_params)
                     self.check_return_status()
-                else:
-                    decoded_resp = response.data.decode(encoding="utf-8")
-                    self.log(
-                        "Decoded response of Export Device Credential file: {0}".format(
-                            str(decoded_resp)
-                        ),
-                        "DEBUG",
-                    )
-
-                    # Parse the CSV-like string into a list of dictionaries
-                    csv_reader = csv.DictReader(StringIO(decoded_resp))
-                    current_date = datetime.now()
-                    formatted_date = current_date.strftime("%m-%d-%Y")
-                    if first_run:
-                        output_file_name = "devices-" + str(formatted_date) + ".csv"
-
-                for row in csv_reader:
-                    device_data.append(row)
-                start += device_batch_size
-                first_run = False
 
-            # Write the data to a CSV file
-            with open(output_file_name, "w", newline="") as csv_file:
-                fieldnames = device_data[0].keys()
-                csv_writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-                csv_writer.writeheader()
-                csv_writer.writerows(device_data)
+                    if payload_params["operationEnum"] == "0":
+                        if not output_file_name:
+                            output_file_name = response.filename.split(".")[0] + ".csv"
+                        csv_source = self.decrypt_and_read_csv(response, password)
+                        self.check_return_status()
+                    else:
+                        # Parse the CSV rows straight from the response bytes
+                        csv_source = nullcontext(csv.DictReader(
+                            TextIOWrapper(BytesIO(response.data), encoding="utf-8", newline="")
+                        ))
+                        if not output_file_name:
+                            formatted_date = datetime.now().strftime("%m-%d-%Y")
+                            output_file_name = "devices-" + str(formatted_date) + ".csv"
+
+                    with csv_source as csv_reader:
+                        unknown_columns = [
+                            column for column in (columns or [])
+                            if column not in (csv_reader.fieldnames or [])
+                        ]
+                        if unknown_columns:
+                            self.status = "failed"
+                            self.msg = (
+                                "Column(s) {0} given in 'columns' are not in the exported file. "
+                                "Available columns: {1}".format(unknown_columns, csv_reader.fieldnames)
+                            )
+                            self.log(self.msg, "ERROR")
+                            self.result["response"] = self.msg
+                            return self
+
+                        if csv_writer is None:
+                            # The rows are written to a temporary file first so that a failed
+                            # batch does not leave a partial export behind
+                            csv_file = open(output_file_name + ".part", "w", newline="")
+                            csv_writer = csv.DictWriter(
+                                csv_file,
+                                fieldnames=columns or csv_reader.fieldnames or [],
+                                extrasaction="ignore",
+                            )
+                            csv_writer.writeheader()
+
+                        for row in csv_reader:
+                            csv_writer.writerow(row)
+                            row_count += 1
+                    start += device_batch_size
+                completed = True
+            finally:
+                if csv_file is not None:
+                    csv_file.close()
+                    if not completed:
+                        os.remove(output_file_name + ".part")
+
+            os.replace(output_file_name + ".part", output_file_name)
+            self.log(
+                "Wrote {0} exported rows to '{1}'".format(row_count, output_file_name),
+                "DEBUG",
+            )
 
             self.msg = (
                 "Device Details Exported Successfully to the CSV file: {0}".format(
@@ -7846,6 +7936,15 @@ def main():
         "config_verify": {"type": "bool", "default": False},
         "dnac_api_task_timeout": {"type": "int", "default": 1200},
         "dnac_task_poll_interval": {"type": "int", "default": 2},
+        "dnac_task_poll_initial_delay": {"type": "float"},
+        "dnac_task_poll_backoff_factor": {"type": "float"},
+        "dnac_task_poll_max_delay": {"type": "float"},
+        "dnac_task_poll_jitter": {"type": "float"},
+        "dnac_max_workers": {"type": "int"},
+        "dnac_rate_limit": {"type": "float"},
+        "dnac_rate_limit_burst": {"type": "int"},
+        "dnac_rate_limit_retries": {"type": "int"},
+        "dnac_lookup_cache": {"type": "bool"},
         "config": {"required": True, "type": "list", "elements": "dict"},
         "state": {"default": "merged", "choices": ["merged", "deleted"]},
     }
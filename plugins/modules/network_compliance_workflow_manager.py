@@ -98,6 +98,27 @@ options:
           on the system.
         type: int
         default: 100
+      run_compliance_max_in_flight:
+        description: Pipelines the compliance check batches.
+          When set, at most this many batches run
+          at the same time, the next batch is submitted
+          as soon as one completes and the compliance
+          report of every completed batch is retrieved
+          while the other batches are still running,
+          so a fleet wide check takes about as long as
+          its slowest batches. When not set, all the
+          batches are submitted at once and the reports
+          are retrieved after the last one completed.
+        type: int
+      run_compliance_adaptive_batch_size:
+        description: Only used with "run_compliance_max_in_flight".
+          Adjusts the size of the next batches to
+          the observed task latency, shrinking them
+          when a batch takes longer than 5 minutes and
+          growing them back, up to "run_compliance_batch_size",
+          when batches complete faster.
+        type: bool
+        default: false
       run_compliance_categories:
         description: Specifying compliance categories
           allows you to trigger compliance checks only
@@ -378,6 +399,12 @@ from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
 )
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+# Batch duration aimed at when 'run_compliance_adaptive_batch_size' is enabled
+COMPLIANCE_TARGET_BATCH_SECONDS = 300
 
 
 class NetworkCompliance(DnacBase):
@@ -435,6 +462,12 @@ class NetworkCompliance(DnacBase):
                 "required": False,
                 "default": 100,
             },
+            "run_compliance_max_in_flight": {"type": "int", "required": False},
+            "run_compliance_adaptive_batch_size": {
+                "type": "bool",
+                "required": False,
+                "default": False,
+            },
             "sync_device_config": {"type": "bool", "required": False, "default": False},
         }
 
@@ -1195,6 +1228,31 @@ class NetworkCompliance(DnacBase):
         Returns:
             dict: A dictionary with device management IPs as keys and lists of compliance details as values.
         """
+        final_response, device_list = self.collect_compliance_details(
+            run_compliance_params, mgmt_ip_to_instance_id_map
+        )
+
+        # If no compliance details were found, update the result with an error message
+        if not final_response:
+            device_list_str = ", ".join(device_list)
+            self.msg = "No Compliance Details found for the devices: {0}".format(
+                device_list_str
+            )
+            self.fail_and_exit(self.msg)
+
+        return final_response
+
+    def collect_compliance_details(self, run_compliance_params, mgmt_ip_to_instance_id_map):
+        """
+        Retrieve the compliance details of every device of a compliance check.
+        Args:
+            run_compliance_params (dict): Parameters for running compliance checks.
+                                          Expected to contain "deviceUuids" and optionally "categories".
+            mgmt_ip_to_instance_id_map (dict): Mapping of device management IPs to device UUIDs.
+        Returns:
+            tuple: A dictionary with device management IPs as keys and lists of compliance details as values,
+                   and the list of the device IPs processed.
+        """
         # Initialize the lists/dicts
         final_response = {}
         device_list = []
@@ -1249,15 +1307,7 @@ class NetworkCompliance(DnacBase):
                 if response:
                     final_response[device_ip].extend(response)
 
-        # If no compliance details were found, update the result with an error message
-        if not final_response:
-            device_list_str = ", ".join(device_list)
-            self.msg = "No Compliance Details found for the devices: {0}".format(
-                device_list_str
-            )
-            self.fail_and_exit(self.msg)
-
-        return final_response
+        return final_response, device_list
 
     def run_compliance(self, run_compliance_params, batch_size):
         """
@@ -1376,36 +1426,41 @@ class NetworkCompliance(DnacBase):
             list: A list of dictionaries where each dictionary contains the 'task_id', 'batch_params',
                   'task_status', and 'msg' for each batch.
         Description:
-            This function iterates over the provided batches, retrieves the task status for each batch,
-            and stores the result including task ID, batch parameters, task status, and message.
+            This function waits on the compliance check tasks of all the batches with a single polling
+            loop, so the total wait is the one of the slowest batch, and stores the result including
+            task ID, batch parameters, task status, and message for each batch.
         """
         batches_result = []
         task_name = "Run Compliance"
+        batch_by_task_id = dict(
+            (batch_info["task_id"], (idx, batch_info))
+            for idx, batch_info in batches_dict.items()
+        )
+
+        # Get task status for all the batches at once
+        if self.dnac_version <= self.version_2_3_5_3:
+            watcher = self.watch_tasks(
+                list(batch_by_task_id), task_name, legacy_api=True,
+                progress_validation="report has been generated successfully"
+            )
+        else:
+            watcher = self.watch_tasks(list(batch_by_task_id), task_name)
 
-        for idx, batch_info in batches_dict.items():
-            task_id = batch_info["task_id"]
+        for task_id, status, task_details in watcher.watch():
+            idx, batch_info = batch_by_task_id[task_id]
             device_ids = batch_info["batch_params"]["deviceUuids"]
             success_msg = "{0} Task with Task ID: '{1}' for batch number: '{2}' with {3} devices: {4} is successful.".format(
                 task_name, task_id, idx, len(device_ids), device_ids
             )
-
-            # Get task status for the current batch
-            if self.dnac_version <= self.version_2_3_5_3:
-                failure_msg = "{0} Task with Task ID: '{1}' Failed for batch number: '{2}' with {3} devices: {4}.".format(
-                    task_name, task_id, idx, len(device_ids), device_ids
-                )
-                progress_validation = "report has been generated successfully"
-                self.get_task_status_from_task_by_id(
-                    task_id,
-                    task_name,
-                    failure_msg,
-                    success_msg,
-                    progress_validation=progress_validation,
+            task_status = "success" if status == "SUCCESS" else "failed"
+            if status == "FAILURE":
+                self.log(
+                    "{0} Task with Task ID: '{1}' Failed for batch number: '{2}' with {3} devices: {4}. Details: {5}".format(
+                        task_name, task_id, idx, len(device_ids), device_ids, task_details
+                    ),
+                    "ERROR",
                 )
-            else:
-                self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
 
-            task_status = self.status
             self.log(
                 "The task status of batch: {0} with task id: {1} is {2}".format(
                     idx, task_id, task_status
@@ -1562,15 +1617,43 @@ class NetworkCompliance(DnacBase):
             "DEBUG",
         )
 
-        # Reverse the mgmt_ip_to_instance_id_map to map device IDs to IPs
-        id_to_ip_map = {v: k for k, v in mgmt_ip_to_instance_id_map.items()}
-
-        # Determine unsuccessful devices
+        # All the devices the compliance check was run on
         all_device_ids = [
             device_id
             for batch in batches_dict.values()
             for device_id in batch["batch_params"]["deviceUuids"]
         ]
+
+        compliance_report = None
+        if successful_devices:
+            successful_devices_params = self.want.get("run_compliance_params").copy()
+            successful_devices_params["deviceUuids"] = successful_devices
+            compliance_report = self.get_compliance_report(
+                successful_devices_params, mgmt_ip_to_instance_id_map
+            )
+
+        return self.set_compliance_check_result(
+            successful_devices, all_device_ids, compliance_report, mgmt_ip_to_instance_id_map
+        )
+
+    def set_compliance_check_result(
+        self, successful_devices, all_device_ids, compliance_report, mgmt_ip_to_instance_id_map
+    ):
+        """
+        Summarize a compliance check and set the operation result.
+        Args:
+            successful_devices (list): The device IDs on which the compliance check was successful.
+            all_device_ids (list): All the device IDs the compliance check was run on.
+            compliance_report (dict): The compliance details of the successful devices, by device IP.
+            mgmt_ip_to_instance_id_map (dict): A dictionary mapping management IP addresses to instance IDs.
+        Returns:
+            self
+        """
+        task_name = "Run Compliance Check"
+
+        # Reverse the mgmt_ip_to_instance_id_map to map device IDs to IPs
+        id_to_ip_map = {v: k for k, v in mgmt_ip_to_instance_id_map.items()}
+
         unsuccessful_devices = list(set(all_device_ids) - set(successful_devices))
         unsuccessful_ips = [
             id_to_ip_map[device_id]
@@ -1587,11 +1670,6 @@ class NetworkCompliance(DnacBase):
                 if device_id in id_to_ip_map
             ]
 
-            successful_devices_params = self.want.get("run_compliance_params").copy()
-            successful_devices_params["deviceUuids"] = successful_devices
-            compliance_report = self.get_compliance_report(
-                successful_devices_params, mgmt_ip_to_instance_id_map
-            )
             self.log(
                 "Compliance Report for device on which compliance operation was successful: {0}".format(
                     compliance_report
@@ -1656,6 +1734,149 @@ class NetworkCompliance(DnacBase):
 
         return self
 
+    def run_compliance_pipelined(self, run_compliance_params, batch_size):
+        """
+        Run the compliance check in pipelined batches and retrieve each batch report as soon as it completes.
+        Args:
+            run_compliance_params (dict): Parameters for running the compliance check.
+            batch_size (int): The number of devices to include in each batch, the upper bound when the
+                              batch size is adaptive.
+        Returns:
+            dict: The 'successful_devices', 'all_device_ids' and 'compliance_report' of the compliance check.
+        Description:
+            At most 'run_compliance_max_in_flight' batches run at the same time and the next batch is submitted
+            as soon as one completes, while the compliance details of the completed batch are retrieved on a
+            background worker. Like 'validate_batch_result', the devices of a failed batch are retried once in
+            batches of one device. With 'run_compliance_adaptive_batch_size', the size of the next batch is scaled
+            by COMPLIANCE_TARGET_BATCH_SECONDS over the latency of the last completed batch, between 1 and 'batch_size'.
+        """
+        device_uuids = run_compliance_params.get("deviceUuids")
+        if not device_uuids:
+            self.msg = "No device UUIDs were found for the execution of the compliance operation."
+            self.set_operation_result("ok", False, self.msg, "INFO")
+            self.module.exit_json(**self.result)
+
+        task_name = "Run Compliance"
+        max_in_flight = max(self.want.get("run_compliance_max_in_flight"), 1)
+        adaptive = self.want.get("run_compliance_adaptive_batch_size")
+        if self.dnac_version <= self.version_2_3_5_3:
+            watcher = self.watch_tasks(
+                [], task_name, legacy_api=True,
+                progress_validation="report has been generated successfully"
+            )
+        else:
+            watcher = self.watch_tasks([], task_name)
+
+        pending = deque(device_uuids)
+        retry_pending = deque()
+        retried = set()
+        running = {}
+        report_futures = []
+        successful_devices = []
+        current_batch_size = batch_size
+        poller = self.get_task_poller(task_name)
+
+        with ThreadPoolExecutor(max_workers=self.get_max_workers()) as report_executor:
+            while pending or retry_pending or running:
+                # Retried devices go first, one device per batch
+                while (retry_pending or pending) and len(running) < max_in_flight:
+                    is_retry = bool(retry_pending)
+                    if is_retry:
+                        batch = [retry_pending.popleft()]
+                    else:
+                        batch = [pending.popleft() for _index in range(min(current_batch_size, len(pending)))]
+
+                    batch_params = run_compliance_params.copy()
+                    batch_params["deviceUuids"] = batch
+                    self.log("Submitting 'run_compliance' for {0} device(s), {1} batch(es) in flight: {2}".format(
+                        len(batch), len(running), batch), "DEBUG")
+                    task_id = self.get_taskid_post_api_call("compliance", "run_compliance", batch_params)
+                    if task_id:
+                        running[task_id] = (batch_params, time.time(), is_retry)
+                    else:
+                        self.log("No response received from the 'run_compliance' API call for batch: {0}.".format(
+                            batch_params), "ERROR")
+
+                if not running:
+                    break
+
+                completed = False
+                for task_id, task_details in watcher.poll(list(running)):
+                    batch_params, started_at, is_retry = running[task_id]
+                    status = watcher.get_completion_status(task_details)
+                    latency = time.time() - started_at
+                    if status is None:
+                        if latency < poller.timeout:
+                            continue
+                        status = "TIMEOUT"
+
+                    del running[task_id]
+                    completed = True
+                    batch = batch_params["deviceUuids"]
+                    self.log("{0} task '{1}' for {2} device(s) completed with status '{3}' after {4:.2f} seconds.".format(
+                        task_name, task_id, len(batch), status, latency), "INFO")
+
+                    if status == "SUCCESS":
+                        successful_devices.extend(batch)
+                        report_params = self.want.get("run_compliance_params").copy()
+                        report_params["deviceUuids"] = batch
+                        report_futures.append(report_executor.submit(
+                            self.run_as_worker, self.collect_compliance_details, report_params,
+                            self.want.get("mgmt_ip_to_instance_id_map")
+                        ))
+                    else:
+                        self.log("{0} task '{1}' failed for device(s) {2}. Details: {3}".format(
+                            task_name, task_id, batch, task_details), "ERROR")
+                        for device_id in batch:
+                            if device_id not in retried:
+                                retried.add(device_id)
+                                retry_pending.append(device_id)
+
+                    # Retry batches always hold one device, their latency does not resize the regular batches
+                    if adaptive and status == "SUCCESS" and not is_retry:
+                        scale = min(max(COMPLIANCE_TARGET_BATCH_SECONDS / max(latency, 1), 0.5), 2)
+                        current_batch_size = min(max(int(round(len(batch) * scale)), 1), batch_size)
+                        self.log("Next compliance batches hold {0} device(s).".format(current_batch_size), "DEBUG")
+
+                if completed:
+                    poller = self.get_task_poller(task_name)
+                elif running:
+                    poller.wait()
+
+        # The pool has finished, a failed report fails the module from this thread
+        compliance_report = {}
+        device_list = []
+        for future in report_futures:
+            batch_report, batch_devices = self.get_worker_result(future)
+            compliance_report.update(batch_report)
+            device_list.extend(batch_devices)
+
+        if successful_devices and not compliance_report:
+            self.msg = "No Compliance Details found for the devices: {0}".format(", ".join(device_list))
+            self.fail_and_exit(self.msg)
+
+        return {
+            "successful_devices": successful_devices,
+            "all_device_ids": list(device_uuids),
+            "compliance_report": compliance_report or None,
+        }
+
+    def get_pipelined_compliance_status(self, pipeline_result, mgmt_ip_to_instance_id_map):
+        """
+        Set the operation result of a compliance check run by 'run_compliance_pipelined'.
+        Args:
+            pipeline_result (dict): The result returned by 'run_compliance_pipelined'.
+            mgmt_ip_to_instance_id_map (dict): A dictionary mapping management IP addresses to instance IDs.
+        Returns:
+            self
+        """
+        return self.set_compliance_check_result(
+            pipeline_result["successful_devices"],
+            pipeline_result["all_device_ids"],
+            pipeline_result["compliance_report"],
+            mgmt_ip_to_instance_id_map,
+        )
+
     def get_sync_config_task_status(self, task_id, mgmt_ip_to_instance_id_map):
         """
         This function manages the status of device configuration synchronization tasks in Cisco Catalyst Center.
@@ -1973,6 +2194,8 @@ class NetworkCompliance(DnacBase):
             mgmt_ip_to_instance_id_map=mgmt_ip_to_instance_id_map,
             run_compliance_params=run_compliance_params,
             run_compliance_batch_size=config.get("run_compliance_batch_size"),
+            run_compliance_max_in_flight=config.get("run_compliance_max_in_flight"),
+            run_compliance_adaptive_batch_size=config.get("run_compliance_adaptive_batch_size"),
             sync_device_config_params=sync_device_config_params,
             compliance_detail_params_sync=compliance_detail_params_sync,
             compliance_details=compliance_details,
@@ -1995,11 +2218,19 @@ class NetworkCompliance(DnacBase):
         # Action map for different network compliance operations
         self.log("Starting 'get_diff_merged' operation.", "INFO")
 
-        action_map = {
-            "run_compliance_params": (
+        if self.want.get("run_compliance_max_in_flight"):
+            run_compliance_actions = (
+                self.run_compliance_pipelined,
+                self.get_pipelined_compliance_status,
+            )
+        else:
+            run_compliance_actions = (
                 self.run_compliance,
                 self.get_compliance_task_status,
-            ),
+            )
+
+        action_map = {
+            "run_compliance_params": run_compliance_actions,
             "sync_device_config_params": (
                 self.sync_device_config,
                 self.get_sync_config_task_status,
@@ -2157,6 +2388,15 @@ def main():
         "config_verify": {"type": "bool", "default": False},
         "dnac_api_task_timeout": {"type": "int", "default": 1200},
         "dnac_task_poll_interval": {"type": "int", "default": 2},
+        "dnac_task_poll_initial_delay": {"type": "float"},
+        "dnac_task_poll_backoff_factor": {"type": "float"},
+        "dnac_task_poll_max_delay": {"type": "float"},
+        "dnac_task_poll_jitter": {"type": "float"},
+        "dnac_max_workers": {"type": "int"},
+        "dnac_rate_limit": {"type": "float"},
+        "dnac_rate_limit_burst": {"type": "int"},
+        "dnac_rate_limit_retries": {"type": "int"},
+        "dnac_lookup_cache": {"type": "bool"},
         "config": {"required": True, "type": "list", "elements": "dict"},
         "state": {"default": "merged", "choices": ["merged"]},
     }
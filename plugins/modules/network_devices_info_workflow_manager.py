@@ -21,7 +21,7 @@ description:
     VLANs, line cards, supervisor cards, POE, module count, connected devices, configuration,
     summary, polling interval, stack, and link mismatch details.
   - Handles query retries, timeouts, and polling intervals for robust data collection.
-  - Supports output to a file using the C(output_file_info) option. Output can be JSON or YAML,
+  - Supports output to a file using the C(output_file_info) option. Output can be JSON, JSON Lines or YAML,
     with user-defined file path, file mode (overwrite or append), and optional timestamp.
   - If C(output_file_info) is provided, results are written to the file; otherwise, results are
     returned in the Ansible output.
@@ -233,7 +233,7 @@ options:
               file_path:
                 description:
                   - Absolute path to the output file without file extension.
-                  - File extension is automatically appended based on the selected file format (.json or .yaml).
+                  - File extension is automatically appended based on the selected file format (.json, .jsonl or .yaml).
                   - Directory structure will be created automatically if it does not exist.
                   - Path must be writable by the user executing the Ansible playbook.
                 type: str
@@ -243,10 +243,16 @@ options:
                   - Determines file structure and extension applied to the file path.
                   - YAML format provides better human readability while JSON offers programmatic parsing advantages.
                   - Format selection affects file extension and data serialization method.
+                  - C(jsonl) writes JSON Lines, one JSON document per line for each entry of the result.
+                    In append mode the new entries are added at the end of the file without reading
+                    or rewriting its previous content, so scheduled exports can keep growing one file.
+                    Each line can be read back on its own, for example with
+                    C(lookup('ansible.builtin.file', '<file_path>.jsonl').splitlines() | map('from_json') | list).
                 type: str
                 default: yaml
                 choices:
                   - json
+                  - jsonl
                   - yaml
               file_mode:
                 description:
@@ -275,6 +281,10 @@ notes:
     - This is a facts/info module, it only retrieves information and does not modify any device or configuration.
     - Writing to a local file is for reporting/archival purposes only and does not affect the state of any managed device.
     - Safe to use in check mode.
+    - When C(dnac_max_workers) is greater than 1, all the requested information types are
+      collected in one pass on a shared pool of workers, with fewer concurrent calls for the configuration, connected
+      device and interface range details, and C(device_info) is read for up to 50 devices per C(get_device_list) call.
+      The time spent on each information type is returned in C(collection_timing).
     - SDK Methods used are
         - devices.Devices.get_device_list
         - devices.Devices.get_device_interface_vlans
@@ -416,6 +426,39 @@ EXAMPLES = r"""
                   file_format: json
                   file_mode: w
                   timestamp: true
+
+# 3 Example Playbook to append device information to a JSON Lines file and read it back
+- name: Append Network devices information to a JSON Lines file
+  hosts: localhost
+  connection: local
+  vars_files:
+    - "credentials.yml"
+  tasks:
+    - name: Append the device information of a site to the export file
+      cisco.dnac.network_devices_info_workflow_manager:
+        dnac_host: "{{ dnac_host }}"
+        dnac_username: "{{ dnac_username }}"
+        dnac_password: "{{ dnac_password }}"
+        dnac_verify: "{{ dnac_verify }}"
+        dnac_port: "{{ dnac_port }}"
+        dnac_version: "{{ dnac_version }}"
+        dnac_debug: "{{ dnac_debug }}"
+        dnac_log: true
+        dnac_log_level: DEBUG
+        state: queried
+        config:
+          - network_devices:
+              - site_hierarchy: Global/USA/SAN JOSE
+                requested_info:
+                  - device_info
+                output_file_info:
+                  file_path: /tmp/device_info
+                  file_format: jsonl
+                  file_mode: a
+
+    - name: Read every entry appended to the export file so far
+      ansible.builtin.set_fact:
+        device_info_records: "{{ lookup('ansible.builtin.file', '/tmp/device_info.jsonl').splitlines() | map('from_json') | list }}"
 """
 
 RETURN = r"""
@@ -885,8 +928,12 @@ response_network_device_by_ip:
 
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
+    WorkerFailure,
+    write_records,
 )
 from ansible.module_utils.basic import AnsibleModule
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import json
 import time
 import os
@@ -900,6 +947,16 @@ from datetime import datetime
 from ansible_collections.cisco.dnac.plugins.module_utils.validation import (
     validate_list_of_dicts,)
 
+# Calls a category may have in flight when the requested information is collected concurrently,
+# the per device APIs below are the most expensive ones for Catalyst Center
+CATEGORY_MAX_WORKERS = {
+    "connected_device_info": 2,
+    "device_config_info": 2,
+    "device_interfaces_by_range_info": 4,
+}
+# Device IDs sent in one 'get_device_list' call when 'device_info' is collected concurrently
+DEVICE_INFO_BATCH_SIZE = 50
+
 
 class NetworkDevicesInfo(DnacBase):
     """Class containing member attributes for network_devices_info_workflow_manager module"""
@@ -1026,7 +1083,7 @@ class NetworkDevicesInfo(DnacBase):
                     "file_format": {
                         "type": "str",
                         "default": "yaml",
-                        "allowed_values": ["json", "yaml"]
+                        "allowed_values": ["json", "jsonl", "yaml"]
                     },
                     "file_mode": {
                         "type": "str",
@@ -1123,7 +1180,7 @@ class NetworkDevicesInfo(DnacBase):
             "device_identifier", "timeout", "retries", "interval", "requested_info", "output_file_info"
         }
         allowed_output_file_info_keys = {"file_path", "file_format", "file_mode", "timestamp"}
-        allowed_file_formats = {"json", "yaml"}
+        allowed_file_formats = {"json", "jsonl", "yaml"}
         allowed_file_modes = {"a", "w"}
 
         for config in self.config:
@@ -1360,83 +1417,48 @@ class NetworkDevicesInfo(DnacBase):
             else:
                 self.total_response.append("The network devices filtered from the provided filters are: {0}".format(list(device_ids.keys())))
 
+            collection_plan = []
             if device_info:
-                self.log("Retrieving device details for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                device_info_result = self.get_device_info(device_ids)
-                self.total_response.append(device_info_result)
-                combined_data["device_info"] = device_info_result
-
+                collection_plan.append(("device_info", "device_info", self.get_device_info))
             if interface_info:
-                self.log("Retrieving interface details for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                interface_info_result = self.get_interface_info(device_ids)
-                self.total_response.append(interface_info_result)
-                combined_data["interface_info"] = interface_info_result
-
+                collection_plan.append(("interface_info", "interface_info", self.get_interface_info))
             if interface_vlan_info:
-                self.log("Retrieving VLAN details for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                interface_vlan_info_result = self.get_interface_vlan_info(device_ids)
-                self.total_response.append(interface_vlan_info_result)
-                combined_data["interface_vlan_info"] = interface_vlan_info_result
-
+                collection_plan.append(("interface_vlan_info", "interface_vlan_info", self.get_interface_vlan_info))
             if linecard_info:
-                self.log("Retrieving linecard details for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                linecard_info_result = self.get_linecard_info(device_ids)
-                self.total_response.append(linecard_info_result)
-                combined_data["linecard_info"] = linecard_info_result
-
+                collection_plan.append(("line_card_info", "linecard_info", self.get_linecard_info))
             if supervisor_card_info:
-                self.log("Retrieving Supervisor card details for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                supervisor_card_info_result = self.get_supervisor_card_info(device_ids)
-                self.total_response.append(supervisor_card_info_result)
-                combined_data["supervisor_card_info"] = supervisor_card_info_result
-
+                collection_plan.append(("supervisor_card_info", "supervisor_card_info", self.get_supervisor_card_info))
             if poe_info:
-                self.log("Retrieving PoE details for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                poe_info_result = self.get_poe_info(device_ids)
-                self.total_response.append(poe_info_result)
-                combined_data["poe_info"] = poe_info_result
-
+                collection_plan.append(("poe_info", "poe_info", self.get_poe_info))
             if module_count_info:
-                self.log("Retrieving module count details for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                module_count_info_result = self.get_module_count_info(device_ids)
-                self.total_response.append(module_count_info_result)
-                combined_data["module_count_info"] = module_count_info_result
-
+                collection_plan.append(("module_count_info", "module_count_info", self.get_module_count_info))
             if connected_device_info:
-                self.log("Retrieving connected neighbor device information via interface for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                connected_devices_result = self.get_connected_device_details_from_interfaces(device_ids)
-                self.total_response.append(connected_devices_result)
-                combined_data["connected_devices_info"] = connected_devices_result
-
+                collection_plan.append((
+                    "connected_device_info", "connected_devices_info", self.get_connected_device_details_from_interfaces
+                ))
             if device_interfaces_by_range_info:
-                self.log("Retrieving interface information for specified range for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                device_interfaces_by_range_info_result = self.get_interfaces_by_specified_range(device_ids)
-                self.total_response.append(device_interfaces_by_range_info_result)
-                combined_data["device_interfaces_by_range_info"] = device_interfaces_by_range_info_result
-
+                collection_plan.append((
+                    "device_interfaces_by_range_info", "device_interfaces_by_range_info", self.get_interfaces_by_specified_range
+                ))
             if device_config_info:
-                self.log("Retrieving device configuration information for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                device_config_info_result = self.get_device_config_info(device_ids)
-                self.total_response.append(device_config_info_result)
-                combined_data["device_config_info"] = device_config_info_result
-
+                collection_plan.append(("device_config_info", "device_config_info", self.get_device_config_info))
             if device_summary_info:
-                self.log("Retrieving device summary information for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                device_summary_info_result = self.get_device_summary_info(device_ids)
-                self.total_response.append(device_summary_info_result)
-                combined_data["device_summary_info"] = device_summary_info_result
-
+                collection_plan.append(("device_summary_info", "device_summary_info", self.get_device_summary_info))
             if device_polling_interval_info:
-                self.log("Retrieving device polling interval information for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                device_polling_interval_info_result = self.get_device_polling_interval_info(device_ids)
-                self.total_response.append(device_polling_interval_info_result)
-                combined_data["device_polling_interval_info"] = device_polling_interval_info_result
-
+                collection_plan.append((
+                    "device_polling_interval_info", "device_polling_interval_info", self.get_device_polling_interval_info
+                ))
             if device_stack_info:
-                self.log("Retrieving device stack information for network devices: {0}".format(list(device_ids.keys())), "DEBUG")
-                device_stack_info_result = self.get_device_stack_info(device_ids)
-                self.total_response.append(device_stack_info_result)
-                combined_data["device_stack_info"] = device_stack_info_result
+                collection_plan.append(("device_stack_info", "device_stack_info", self.get_device_stack_info))
+
+            self.log("Retrieving {0} for network devices: {1}".format(
+                [category for category, _key, _collector in collection_plan], list(device_ids.keys())), "DEBUG")
+            collected = self.collect_device_details(
+                [(category, collector) for category, _key, collector in collection_plan], device_ids
+            )
+            for category, combined_key, _collector in collection_plan:
+                self.total_response.append(collected[category])
+                combined_data[combined_key] = collected[category]
 
             if device_link_mismatch_info:
                 site_hierarchy = device_cfg.get("site_hierarchy")
@@ -2728,6 +2750,156 @@ class NetworkDevicesInfo(DnacBase):
 
         return filtered_devices
 
+    def collect_device_details(self, collection_plan, ip_uuid_map):
+        """
+        Collect all the requested information categories for the given devices in one scheduled pass.
+
+        Args:
+            collection_plan (list): (category, collector) tuples, where the collector takes an IP to UUID
+                map and returns a list with a single dictionary holding the per device entries of the category.
+            ip_uuid_map (dict): A mapping of device IPs to their UUIDs.
+
+        Returns:
+            dict: The result of each category, in the shape returned by its collector.
+
+        Description:
+            With a single worker (the default) the collectors run one after another. When 'dnac_max_workers'
+            is greater than one, the per device calls of every category are queued on one worker pool and
+            dispatched as workers free up, each category running at most CATEGORY_MAX_WORKERS calls at a
+            time, while 'device_info' is read DEVICE_INFO_BATCH_SIZE devices at a time with multi-ID
+            'get_device_list' calls. The devices, wall clock and busy time spent per category are logged
+            and returned in 'collection_timing'.
+        """
+        max_workers = min(self.get_max_workers(), max(len(ip_uuid_map), 1) * max(len(collection_plan), 1))
+        timings = OrderedDict((category, {"devices": len(ip_uuid_map), "started": None, "finished": None, "busy": 0.0})
+                              for category, _collector in collection_plan)
+
+        def run_job(category, collector, chunk):
+            started = time.time()
+            result = collector(chunk)
+            return started, time.time(), result
+
+        def record(category, started, finished):
+            timing = timings[category]
+            timing["started"] = started if timing["started"] is None else min(timing["started"], started)
+            timing["finished"] = finished if timing["finished"] is None else max(timing["finished"], finished)
+            timing["busy"] += finished - started
+
+        results = {}
+        if max_workers <= 1:
+            for category, collector in collection_plan:
+                started, finished, results[category] = run_job(category, collector, ip_uuid_map)
+                record(category, started, finished)
+        else:
+            device_items = list(ip_uuid_map.items())
+            queues = OrderedDict()
+            chunk_results = {}
+            for category, collector in collection_plan:
+                if category == "device_info":
+                    collector = self.get_device_info_bulk
+                    chunks = [OrderedDict(device_items[index:index + DEVICE_INFO_BATCH_SIZE])
+                              for index in range(0, len(device_items), DEVICE_INFO_BATCH_SIZE)]
+                else:
+                    chunks = [OrderedDict([device_item]) for device_item in device_items]
+
+                queues[category] = deque((index, collector, chunk) for index, chunk in enumerate(chunks))
+                chunk_results[category] = [None] * len(chunks)
+
+            self.log("Collecting {0} categories for {1} devices with {2} workers".format(
+                len(collection_plan), len(device_items), max_workers), "INFO")
+            running = {}
+            active = dict((category, 0) for category in queues)
+            worker_failure = None
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while running or (any(queues.values()) and worker_failure is None):
+                    # Round robin over the categories so that a slow one does not hold the whole pool
+                    submitted = True
+                    while submitted and len(running) < max_workers and worker_failure is None:
+                        submitted = False
+                        for category, queue in queues.items():
+                            category_limit = CATEGORY_MAX_WORKERS.get(category, max_workers)
+                            if queue and active[category] < category_limit and len(running) < max_workers:
+                                index, collector, chunk = queue.popleft()
+                                future = executor.submit(self.run_as_worker, run_job, category, collector, chunk)
+                                running[future] = (category, index)
+                                active[category] += 1
+                                submitted = True
+
+                    done, _not_done = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        category, index = running.pop(future)
+                        active[category] -= 1
+                        try:
+                            started, finished, chunk_results[category][index] = future.result()
+                        except WorkerFailure as error:
+                            # Let the running calls finish, then fail from this thread
+                            worker_failure = worker_failure or error
+                            continue
+                        record(category, started, finished)
+
+            if worker_failure is not None:
+                self.fail_for_worker_failure(worker_failure)
+
+            for category, _collector in collection_plan:
+                entries = []
+                result_key = category
+                for chunk_result in chunk_results[category]:
+                    for result_key, chunk_entries in chunk_result[0].items():
+                        entries.extend(chunk_entries)
+                results[category] = [{result_key: entries}]
+
+        collection_timing = self.result.setdefault("collection_timing", OrderedDict())
+        for category, timing in timings.items():
+            wall_time = (timing["finished"] - timing["started"]) if timing["started"] is not None else 0.0
+            collection_timing[category] = {
+                "devices": timing["devices"],
+                "seconds": round(wall_time, 3),
+                "busy_seconds": round(timing["busy"], 3),
+            }
+            self.log("Collected '{0}' for {1} devices in {2:.3f} seconds ({3:.3f} seconds of API calls)".format(
+                category, timing["devices"], wall_time, timing["busy"]), "INFO")
+
+        return results
+
+    def get_device_info_bulk(self, ip_uuid_map):
+        """
+        Fetch the details of several network devices with a single multi-ID 'get_device_list' call.
+
+        Args:
+            ip_uuid_map (dict): A mapping of device IPs to their UUIDs.
+
+        Returns:
+            list: A list with a single dictionary, in the same shape as returned by 'get_device_info'.
+        """
+        self.log("Fetching device info for {0} devices in one call: {1}".format(
+            len(ip_uuid_map), list(ip_uuid_map.keys())), "DEBUG")
+        try:
+            response = self.dnac._exec(
+                family="devices",
+                function="get_device_list",
+                params={"id": ",".join(ip_uuid_map.values())}
+            )
+            self.log("Received API response from 'get_device_list' for devices {0}: {1}".format(
+                list(ip_uuid_map.values()), response), "DEBUG")
+        except Exception as e:
+            self.msg = "Exception occurred while getting device list for devices {0}: {1}".format(list(ip_uuid_map.keys()), e)
+            return [{"device_info": [
+                {"device_ip": device_ip, "device_details": "Error: {0}".format(e)} for device_ip in ip_uuid_map
+            ]}]
+
+        devices_by_id = {}
+        for device in response.get("response") or []:
+            devices_by_id.setdefault(device.get("id"), []).append(device)
+
+        device_info_list = []
+        for device_ip, device_id in ip_uuid_map.items():
+            device_details = devices_by_id.get(device_id, [])
+            if not device_details:
+                self.log("No device details found for device_id: {0}, device_ip: {1}".format(device_id, device_ip), "WARNING")
+            device_info_list.append({"device_ip": device_ip, "device_details": device_details})
+
+        return [{"device_info": device_info_list}]
+
     def get_device_info(self, ip_uuid_map):
         """
         Fetch detailed information for a list of network devices from Cisco Catalyst Center.
@@ -4353,6 +4525,8 @@ class NetworkDevicesInfo(DnacBase):
         self.log("Fetching device link mismatch data for {0} devices: {1}".format(len(ip_uuid_map), list(ip_uuid_map.keys())), "INFO")
 
         link_mismatch_info = []
+        # The mismatch data is reported per site, so it is read once per category for all the devices
+        site_responses = {}
 
         for device_ip, device_id in ip_uuid_map.items():
             site_result = {
@@ -4366,14 +4540,16 @@ class NetworkDevicesInfo(DnacBase):
                 self.log("Fetching device link mismatch info for device_id: {0}, device_ip: {1}".format(device_id, device_ip), "DEBUG")
 
                 try:
-                    response = self.dnac._exec(
-                        family="devices",
-                        function="inventory_insight_device_link_mismatch",
-                        params={
-                            'site_id': site_id,
-                            'category': category
-                        }
-                    )
+                    if category not in site_responses:
+                        site_responses[category] = self.dnac._exec(
+                            family="devices",
+                            function="inventory_insight_device_link_mismatch",
+                            params={
+                                'site_id': site_id,
+                                'category': category
+                            }
+                        )
+                    response = site_responses[category]
                     self.log(
                         "Received API response from 'inventory_insight_device_link_mismatch': {0}".format(
                             (response)
@@ -4428,7 +4604,7 @@ class NetworkDevicesInfo(DnacBase):
         Write collected network device information to a specified file with comprehensive format support and error handling.
 
         This method provides robust file output capabilities for network device data with support for multiple
-        formats (JSON/YAML), file modes (overwrite/append), automatic directory creation, timestamp insertion,
+        formats (JSON/JSON Lines/YAML), file modes (overwrite/append), automatic directory creation, timestamp insertion,
         and comprehensive error handling with detailed logging for operational traceability.
 
         Parameters:
@@ -4437,7 +4613,7 @@ class NetworkDevicesInfo(DnacBase):
                 {
                     "output_output_file_info": {
                         "file_path": str,   # Absolute path without extension (required)
-                        "file_format": str, # "json" or "yaml" (default: "yaml")
+                        "file_format": str, # "json", "jsonl" or "yaml" (default: "yaml")
                         "file_mode": str,   # "w" (overwrite) or "a" (append) (default: "w")
                         "timestamp": bool   # Include download timestamp (default: False)
                     },
@@ -4492,6 +4668,14 @@ class NetworkDevicesInfo(DnacBase):
             else:
                 new_data_with_timestamp = new_data
 
+            if output_file_format == "jsonl":
+                record_count = write_records(
+                    full_path_with_ext, new_data_with_timestamp, "jsonl", append=file_write_mode == "a"
+                )
+                self.log("Successfully wrote {0} device info records to file: {1}".format(
+                    record_count, full_path_with_ext), "INFO")
+                return self
+
             if file_write_mode == "a" and os.path.exists(full_path_with_ext):
                 try:
                     with open(full_path_with_ext, "r") as f:
@@ -4547,6 +4731,15 @@ def main():
                     'config_verify': {'type': 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_task_poll_initial_delay': {'type': 'float'},
+                    'dnac_task_poll_backoff_factor': {'type': 'float'},
+                    'dnac_task_poll_max_delay': {'type': 'float'},
+                    'dnac_task_poll_jitter': {'type': 'float'},
+                    'dnac_max_workers': {'type': 'int'},
+                    'dnac_rate_limit': {'type': 'float'},
+                    'dnac_rate_limit_burst': {'type': 'int'},
+                    'dnac_rate_limit_retries': {'type': 'int'},
+                    'dnac_lookup_cache': {'type': 'bool'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'gathered', 'choices': ['gathered']}
                     }
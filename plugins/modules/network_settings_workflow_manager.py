@@ -32,6 +32,20 @@ options:
       Center after applying the playbook config.
     type: bool
     default: false
+  ip_pool_snapshot:
+    description:
+      - Set to True to retrieve the global pools and
+        the reserved pools of each site once per run
+        and answer every pool lookup from an index by
+        name, site and CIDR, instead of paging through
+        all the pools for each pool of the playbook.
+      - The index is updated after every create, update
+        and delete operation, so the verification of
+        the playbook config is also answered from it.
+      - Recommended when the playbook declares many
+        pools or Catalyst Center holds many pools.
+    type: bool
+    default: false
   state:
     description: The state of Cisco Catalyst Center
       after module completion.
@@ -951,6 +965,7 @@ class NetworkSettings(DnacBase):
         self.all_reserved_pool_details = {}
         self.global_pool_response = {}
         self.reserve_pool_response = {}
+        self.ip_pool_snapshot = {"global": None, "reserve": {}, "site_ids": {}}
 
     def validate_input(self):
         """
@@ -2165,9 +2180,29 @@ class NetworkSettings(DnacBase):
             network_details: Processed Network data in a format suitable for configuration, or None on error.
         """
 
-        dhcp_details = self.get_dhcp_settings_for_site(site_name, site_id)
-        dns_details = self.get_dns_settings_for_site(site_name, site_id)
-        telemetry_details = self.get_telemetry_settings_for_site(site_name, site_id)
+        # The settings reads are independent, they run on the worker pool when 'dnac_max_workers'
+        # allows it and one after another, in this order, otherwise
+        settings_readers = [
+            self.get_dhcp_settings_for_site,
+            self.get_dns_settings_for_site,
+            self.get_telemetry_settings_for_site,
+            self.get_ntp_settings_for_site,
+            self.get_time_zone_settings_for_site,
+            self.get_banner_settings_for_site,
+            self.get_aaa_settings_for_site,
+        ]
+        (
+            dhcp_details,
+            dns_details,
+            telemetry_details,
+            ntpserver_details,
+            timezone_details,
+            messageoftheday_details,
+            aaa_details,
+        ) = self.run_concurrently(
+            lambda settings_reader: settings_reader(site_name, site_id), settings_readers
+        )
+        network_aaa, client_and_endpoint_aaa = aaa_details
         if telemetry_details.get("wiredDataCollection") is None:
             wired_data_collection = ""
         else:
@@ -2181,12 +2216,6 @@ class NetworkSettings(DnacBase):
         netflow_details = telemetry_details.get("applicationVisibility")
         snmp_details = telemetry_details.get("snmpTraps")
         syslog_details = telemetry_details.get("syslogs")
-        ntpserver_details = self.get_ntp_settings_for_site(site_name, site_id)
-        timezone_details = self.get_time_zone_settings_for_site(site_name, site_id)
-        messageoftheday_details = self.get_banner_settings_for_site(site_name, site_id)
-        network_aaa, client_and_endpoint_aaa = self.get_aaa_settings_for_site(
-            site_name, site_id
-        )
 
         # Prepare the network details for Cisco Catalyst Center configuration
         if not network_aaa:
@@ -2405,6 +2434,210 @@ class NetworkSettings(DnacBase):
 
         return self
 
+    def index_ip_pools(self, pools, name_key):
+        """
+        Index a list of IP pools by name, ID and CIDR.
+
+        Parameters:
+            pools (list of dict) - The IP pools as returned by Catalyst Center.
+            name_key (str) - The key holding the name of the pool, 'ipPoolName',
+            'groupName' or 'name' depending on the API.
+
+        Returns:
+            dict - The 'pools' list, and the 'by_name', 'by_id' and 'by_cidr' lookups.
+        """
+
+        snapshot = {"pools": pools, "by_name": {}, "by_id": {}, "by_cidr": {}}
+        for pool in pools:
+            if not isinstance(pool, dict):
+                continue
+
+            snapshot["by_name"].setdefault(pool.get(name_key), pool)
+            snapshot["by_id"][pool.get("id")] = pool
+            cidr = pool.get("ipPoolCidr")
+            address_space = pool.get("addressSpace")
+            if isinstance(address_space, dict):
+                cidr = address_space.get("subnet")
+
+            if cidr:
+                snapshot["by_cidr"].setdefault(cidr, pool)
+
+        return snapshot
+
+    def get_global_pool_snapshot(self):
+        """
+        Retrieve all the global pools once and index them, see 'ip_pool_snapshot'.
+
+        Parameters:
+            None
+
+        Returns:
+            dict - The indexed global pools, as returned by 'index_ip_pools'.
+        """
+
+        if self.ip_pool_snapshot.get("global") is not None:
+            return self.ip_pool_snapshot.get("global")
+
+        is_old_version = self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.9") < 0
+        page_limit = 25 if is_old_version else 500
+        all_global_pools = []
+        offset = 1
+        while True:
+            try:
+                if is_old_version:
+                    response = self.dnac._exec(
+                        family="network_settings",
+                        function="get_global_pool",
+                        params={"offset": offset}
+                    )
+                else:
+                    response = self.dnac._exec(
+                        family="network_settings",
+                        function="retrieves_global_ip_address_pools",
+                        params={"offset": offset,
+                                "limit": 500}
+                    )
+            except Exception as msg:
+                self.msg = "Exception occurred while getting the global pool details: {msg}".format(msg=msg)
+                self.log(str(msg), "ERROR")
+                self.fail_and_exit(self.msg)
+
+            if not isinstance(response, dict):
+                self.msg = "Failed to retrieve the global pool details - Response is not a dictionary"
+                self.log(self.msg, "CRITICAL")
+                self.fail_and_exit(self.msg)
+
+            global_pool_details = response.get("response") or []
+            all_global_pools.extend(global_pool_details)
+            if len(global_pool_details) < page_limit:
+                break
+
+            offset += page_limit
+
+        self.ip_pool_snapshot["global"] = self.index_ip_pools(
+            all_global_pools, "ipPoolName" if is_old_version else "name"
+        )
+        self.log("Indexed {0} global pool(s) from the Catalyst Center.".format(len(all_global_pools)), "INFO")
+        return self.ip_pool_snapshot.get("global")
+
+    def get_reserve_pool_snapshot(self, site_name, site_id):
+        """
+        Retrieve all the reserved pools of a site once and index them, see 'ip_pool_snapshot'.
+
+        Parameters:
+            site_name (str) - The name of the site.
+            site_id (str) - The ID of the site.
+
+        Returns:
+            dict - The indexed reserved pools of the site, as returned by 'index_ip_pools'.
+        """
+
+        if site_id in self.ip_pool_snapshot.get("reserve"):
+            return self.ip_pool_snapshot.get("reserve").get(site_id)
+
+        self.get_reserved_ip_subpool(site_name, site_id)
+        self.ip_pool_snapshot["site_ids"][site_name] = site_id
+        is_old_version = self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.9") < 0
+        reserve_pools = self.all_reserved_pool_details.get(site_id) or []
+        self.ip_pool_snapshot["reserve"][site_id] = self.index_ip_pools(
+            reserve_pools, "groupName" if is_old_version else "name"
+        )
+        self.log(
+            "Indexed {0} reserved pool(s) of the site '{1}' from the Catalyst Center.".format(
+                len(reserve_pools), site_name
+            ),
+            "INFO",
+        )
+        return self.ip_pool_snapshot.get("reserve").get(site_id)
+
+    def update_ip_pool_snapshot(self, pool_type, pool_id=None, site_names=None):
+        """
+        Keep the IP pool snapshot in line with a create, update or delete operation.
+
+        Parameters:
+            pool_type (str) - 'Global' or 'Reserve'.
+            pool_id (str) - The ID of a deleted pool, removed from the index in place.
+            site_names (list of str) - The sites whose reserved pools were created or updated.
+
+        Returns:
+            None
+        Description:
+            Deleted pools are dropped from the index. Created and updated pools get their ID and
+            normalized settings from Catalyst Center, so the affected global pools or sites are
+            retrieved again on their next lookup.
+        """
+
+        if pool_type == "Global":
+            snapshots = [self.ip_pool_snapshot.get("global")]
+        else:
+            snapshots = list(self.ip_pool_snapshot.get("reserve").values())
+
+        if pool_id:
+            for snapshot in snapshots:
+                if not snapshot or pool_id not in snapshot.get("by_id"):
+                    continue
+
+                pool = snapshot.get("by_id").pop(pool_id)
+                snapshot["pools"] = [each_pool for each_pool in snapshot.get("pools") if each_pool is not pool]
+                for index_name in ("by_name", "by_cidr"):
+                    for key, value in list(snapshot.get(index_name).items()):
+                        if value is pool:
+                            del snapshot[index_name][key]
+
+            self.log("Removed the {0} pool '{1}' from the IP pool snapshot.".format(pool_type, pool_id), "DEBUG")
+            return
+
+        if pool_type == "Global":
+            self.ip_pool_snapshot["global"] = None
+        else:
+            for site_name in site_names or []:
+                site_id = self.ip_pool_snapshot.get("site_ids").get(site_name)
+                self.ip_pool_snapshot.get("reserve").pop(site_id, None)
+
+        self.log("Invalidated the {0} pools of the IP pool snapshot.".format(pool_type), "DEBUG")
+
+    def global_pool_exists_from_snapshot(self, name):
+        """
+        Check if the Global Pool with the given name exists, using the IP pool snapshot.
+
+        Parameters:
+            name (str) - The name of the Global Pool to check for existence,
+            an empty name returns all the Global Pools for the deleted state.
+
+        Returns:
+            dict or list - Same as 'global_pool_exists'.
+        """
+
+        global_pool = {"exists": False, "details": None, "id": None}
+        snapshot = self.get_global_pool_snapshot()
+        if not snapshot.get("pools"):
+            self.log("Global pool '{0}' does not exist".format(name), "INFO")
+            return [] if name == "" else global_pool
+
+        if name == "":
+            if self.payload.get("state") != "deleted":
+                return global_pool
+
+            return [
+                {
+                    "exists": True,
+                    "id": each_pool.get("id"),
+                    "details": self.get_global_pool_params(each_pool),
+                }
+                for each_pool in snapshot.get("pools")
+            ]
+
+        global_pool_details = snapshot.get("by_name").get(name)
+        if not global_pool_details:
+            self.log("Global pool '{0}' does not exist".format(name), "INFO")
+            return global_pool
+
+        self.log("Global pool found with name '{0}': {1}".format(name, global_pool_details), "INFO")
+        global_pool.update({"exists": True})
+        global_pool.update({"id": global_pool_details.get("id")})
+        global_pool["details"] = self.get_global_pool_params(global_pool_details)
+        return global_pool
+
     def global_pool_exists(self, name):
         """
         Check if the Global Pool with the given name exists
@@ -2419,6 +2652,9 @@ class NetworkSettings(DnacBase):
             - 'details' (dict or None): Details of the Global Pool if it exists, else None.
         """
 
+        if self.params.get("ip_pool_snapshot"):
+            return self.global_pool_exists_from_snapshot(name)
+
         global_pool = {"exists": False, "details": None, "id": None}
         all_global_pool = []
         offset = 1
@@ -2557,7 +2793,11 @@ class NetworkSettings(DnacBase):
             self.status = "failed"
             return reserve_pool
 
-        if not self.all_reserved_pool_details.get(site_id):
+        snapshot = None
+        if self.params.get("ip_pool_snapshot"):
+            snapshot = self.get_reserve_pool_snapshot(site_name, site_id)
+            self.all_reserved_pool_details[site_id] = snapshot.get("pools")
+        elif not self.all_reserved_pool_details.get(site_id):
             self.get_reserved_ip_subpool(site_name, site_id)
 
         if not self.all_reserved_pool_details.get(site_id):
@@ -2572,6 +2812,8 @@ class NetworkSettings(DnacBase):
         reserve_pool_details = None
         if name == "":
             reserve_pool_details = self.all_reserved_pool_details.get(site_id)
+        elif snapshot:
+            reserve_pool_details = snapshot.get("by_name").get(name)
         else:
             if self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.9") < 0:
                 reserve_pool_details = get_dict_result(
@@ -3049,6 +3291,31 @@ class NetworkSettings(DnacBase):
             self.status = "failed"
             return self.check_return_status()
 
+        if self.params.get("ip_pool_snapshot"):
+            snapshot = self.get_global_pool_snapshot()
+            if global_pool_name:
+                global_pool_details = snapshot.get("by_name").get(global_pool_name)
+            else:
+                try:
+                    subnet = self.split_cidr(global_pool_cidr).get("network_prefix")
+                except Exception as e:
+                    self.log(f"Error while splitting CIDR '{global_pool_cidr}': {e}", "ERROR")
+                    self.msg = "Invalid CIDR format provided."
+                    self.status = "failed"
+                    return self.check_return_status()
+
+                global_pool_details = snapshot.get("by_cidr").get(subnet)
+
+            if not global_pool_details:
+                self.msg = f"No information found for the global pool named '{global_pool_name}'"
+                self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+
+            self.log(f"Global pool found in the IP pool snapshot: {global_pool_details}", "INFO")
+            if is_old_version:
+                return global_pool_details.get("ipPoolCidr")
+
+            return global_pool_details.get("id")
+
         offset = 1
         while True:
             self.log(f"Querying global pool details with offset {offset}.", "DEBUG")
@@ -4890,9 +5157,14 @@ class NetworkSettings(DnacBase):
             self
         """
         if self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.9") >= 0:
-            return self.update_global_pool_v2(global_pool)
+            result = self.update_global_pool_v2(global_pool)
+        else:
+            result = self.update_global_pool_v1(global_pool)
 
-        return self.update_global_pool_v1(global_pool)
+        if self.params.get("ip_pool_snapshot"):
+            self.update_ip_pool_snapshot("Global")
+
+        return result
 
     def update_global_pool_v1(self, global_pool):
         """
@@ -5242,9 +5514,16 @@ class NetworkSettings(DnacBase):
         based on Catalyst Center version (v1 or v2).
         """
         if self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.9") < 0:
-            return self.update_reserve_pool_v1(reserve_pool)
+            result = self.update_reserve_pool_v1(reserve_pool)
         else:
-            return self.update_reserve_pool_v2(reserve_pool)
+            result = self.update_reserve_pool_v2(reserve_pool)
+
+        if self.params.get("ip_pool_snapshot"):
+            self.update_ip_pool_snapshot(
+                "Reserve", site_names=[item.get("site_name") for item in reserve_pool]
+            )
+
+        return result
 
     def update_reserve_pool_v1(self, reserve_pool):
         """
@@ -6002,80 +6281,46 @@ class NetworkSettings(DnacBase):
                     "site_name"
                 )
 
+                settings_updates = []
                 dhcp_settings = net_params.get("settings").get("dhcpServer")
                 if dhcp_settings is not None:
-                    response = self.update_dhcp_settings_for_site(
-                        site_name, site_id, dhcp_settings
-                    )
-                    self.log(
-                        "Received API response of 'set_dhcp_settings_for_a_site': {0}".format(
-                            response
-                        ),
-                        "DEBUG",
-                    )
-                    self.check_tasks_response_status(
-                        response, "set_dhcp_settings_for_a_site"
-                    ).check_return_status()
+                    settings_updates.append((
+                        "set_dhcp_settings_for_a_site",
+                        self.update_dhcp_settings_for_site,
+                        (site_name, site_id, dhcp_settings),
+                    ))
 
                 ntp_settings = net_params.get("settings").get("ntpServer")
                 if ntp_settings is not None:
-                    response = self.update_ntp_settings_for_site(
-                        site_name, site_id, ntp_settings
-                    )
-                    self.log(
-                        "Received API response of 'set_n_t_p_settings_for_a_site': {0}".format(
-                            response
-                        ),
-                        "DEBUG",
-                    )
-                    self.check_tasks_response_status(
-                        response, "set_n_t_p_settings_for_a_site"
-                    ).check_return_status()
+                    settings_updates.append((
+                        "set_n_t_p_settings_for_a_site",
+                        self.update_ntp_settings_for_site,
+                        (site_name, site_id, ntp_settings),
+                    ))
 
                 time_zone_settings = net_params.get("settings").get("timezone")
                 if time_zone_settings is not None:
-                    response = self.update_time_zone_settings_for_site(
-                        site_name, site_id, time_zone_settings
-                    )
-                    self.log(
-                        "Received API response of 'set_time_zone_for_a_site': {0}".format(
-                            response
-                        ),
-                        "DEBUG",
-                    )
-                    self.check_tasks_response_status(
-                        response, "set_time_zone_for_a_site"
-                    ).check_return_status()
+                    settings_updates.append((
+                        "set_time_zone_for_a_site",
+                        self.update_time_zone_settings_for_site,
+                        (site_name, site_id, time_zone_settings),
+                    ))
 
                 dns_settings = net_params.get("settings").get("dnsServer")
                 if dns_settings is not None:
-                    response = self.update_dns_settings_for_site(
-                        site_name, site_id, dns_settings
-                    )
-                    self.log(
-                        "Received API response of 'set_d_n_s_settings_for_a_site': {0}".format(
-                            response
-                        ),
-                        "DEBUG",
-                    )
-                    self.check_tasks_response_status(
-                        response, "set_d_n_s_settings_for_a_site"
-                    ).check_return_status()
+                    settings_updates.append((
+                        "set_d_n_s_settings_for_a_site",
+                        self.update_dns_settings_for_site,
+                        (site_name, site_id, dns_settings),
+                    ))
 
                 banner_settings = net_params.get("settings").get("messageOfTheday")
                 if banner_settings is not None:
-                    response = self.update_banner_settings_for_site(
-                        site_name, site_id, banner_settings
-                    )
-                    self.log(
-                        "Received API response of 'set_banner_settings_for_a_site': {0}".format(
-                            response
-                        ),
-                        "DEBUG",
-                    )
-                    self.check_tasks_response_status(
-                        response, "set_banner_settings_for_a_site"
-                    ).check_return_status()
+                    settings_updates.append((
+                        "set_banner_settings_for_a_site",
+                        self.update_banner_settings_for_site,
+                        (site_name, site_id, banner_settings),
+                    ))
 
                 if any(
                     [
@@ -6099,36 +6344,24 @@ class NetworkSettings(DnacBase):
                             "wireless_telemetry"
                         ),
                     }
-                    response = self.update_telemetry_settings_for_site(
-                        site_name, site_id, telemetry_settings
-                    )
-                    self.log(
-                        "Received API response of 'set_telemetry_settings_for_a_site': {0}".format(
-                            response
-                        ),
-                        "DEBUG",
-                    )
-                    self.check_tasks_response_status(
-                        response, "set_telemetry_settings_for_a_site"
-                    ).check_return_status()
+                    settings_updates.append((
+                        "set_telemetry_settings_for_a_site",
+                        self.update_telemetry_settings_for_site,
+                        (site_name, site_id, telemetry_settings),
+                    ))
 
                 network_aaa = net_params.get("settings").get("network_aaa")
                 client_and_endpoint_aaa = net_params.get("settings").get(
                     "client_and_endpoint_aaa"
                 )
                 if network_aaa is not None or client_and_endpoint_aaa is not None:
-                    response = self.update_aaa_settings_for_site(
-                        site_name, site_id, network_aaa, client_and_endpoint_aaa
-                    )
-                    self.log(
-                        "Received API response of 'set_aaa_settings_for_a_site': {0}".format(
-                            response
-                        ),
-                        "DEBUG",
-                    )
-                    self.check_tasks_response_status(
-                        response, "set_aaa_settings_for_a_site"
-                    ).check_return_status()
+                    settings_updates.append((
+                        "set_aaa_settings_for_a_site",
+                        self.update_aaa_settings_for_site,
+                        (site_name, site_id, network_aaa, client_and_endpoint_aaa),
+                    ))
+
+                self.apply_site_settings_updates(site_name, settings_updates)
 
             self.log(
                 "Network under the site '{0}' has been changed successfully".format(
@@ -6150,6 +6383,79 @@ class NetworkSettings(DnacBase):
 
         return self
 
+    def apply_site_settings_updates(self, site_name, settings_updates):
+        """
+        Apply the settings updates of a site and wait for their tasks.
+
+        Parameters:
+            site_name (str) - The name of the site being updated.
+            settings_updates (list of tuple) - The (api_name, update_function, args) of every update,
+            where 'update_function(*args)' returns the API response holding the task ID.
+
+        Returns:
+            self - The current object, exits the module when an update fails.
+        Description:
+            With a single worker, every update waits for its task before the next one is sent.
+            When 'dnac_max_workers' is greater than one the updates, which touch independent
+            settings, are sent on the worker pool and all their tasks are then awaited together,
+            so a site costs the latency of its slowest update instead of the sum of all of them.
+        """
+
+        if self.get_max_workers() <= 1 or len(settings_updates) <= 1:
+            for api_name, update_function, args in settings_updates:
+                response = update_function(*args)
+                self.log(
+                    "Received API response of '{0}': {1}".format(api_name, response),
+                    "DEBUG",
+                )
+                self.check_tasks_response_status(response, api_name).check_return_status()
+
+            return self
+
+        responses = self.run_concurrently(
+            lambda settings_update: settings_update[1](*settings_update[2]), settings_updates
+        )
+        task_api_names = {}
+        for (api_name, update_function, args), response in zip(settings_updates, responses):
+            self.log(
+                "Received API response of '{0}': {1}".format(api_name, response),
+                "DEBUG",
+            )
+            task_info = response.get("response") if isinstance(response, dict) else None
+            if not task_info or task_info.get("errorcode") is not None or not task_info.get("taskId"):
+                self.msg = "Failed to update the network settings of the site '{0}' with '{1}': {2}".format(
+                    site_name, api_name, response
+                )
+                self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+
+            task_api_names[task_info.get("taskId")] = api_name
+
+        task_results = self.watch_tasks(list(task_api_names), "network settings").wait_all()
+        for task_id, api_name in task_api_names.items():
+            status, task_details = task_results.get(task_id, ("TIMEOUT", None))
+            if status == "SUCCESS":
+                continue
+
+            if status == "TIMEOUT":
+                self.msg = "Max timeout of {0} sec has reached for the task id '{1}' of the API '{2}'.".format(
+                    self.max_timeout, task_id, api_name
+                )
+            else:
+                self.msg = (task_details or {}).get("failureReason") or (
+                    "The task id '{0}' of the API '{1}' ended with the status '{2}'.".format(task_id, api_name, status)
+                )
+
+            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+
+        self.result["changed"] = True
+        self.log(
+            "Applied {0} settings update(s) to the site '{1}' concurrently.".format(
+                len(task_api_names), site_name
+            ),
+            "INFO",
+        )
+        return self
+
     def update_device_controllability(self, device_controllability_details):
         """
         Update the Device Controllability settings for a specified site in Cisco Catalyst Center.
@@ -6301,6 +6607,9 @@ class NetworkSettings(DnacBase):
                      format(pool_type, self.pprint(response)), "DEBUG")
 
             if (execution_id or task_id) and self.status == "success":
+                if self.params.get("ip_pool_snapshot"):
+                    self.update_ip_pool_snapshot(pool_type, pool_id=pool_id)
+
                 return {
                     "name": name,
                     "msg": success_msg,
@@ -6597,7 +6906,9 @@ class NetworkSettings(DnacBase):
             self - The current object with Global Pool, Reserved Pool, Network Servers information.
         """
 
-        self.all_reserved_pool_details = {}
+        if not self.params.get("ip_pool_snapshot"):
+            self.all_reserved_pool_details = {}
+
         self.get_have(config)
         self.log("Current State (have): {0}".format(self.have), "INFO")
         self.log("Requested State (want): {0}".format(self.want), "INFO")
@@ -6761,7 +7072,9 @@ class NetworkSettings(DnacBase):
             self - The current object with Global Pool, Reserved Pool, Network Servers information.
         """
 
-        self.all_reserved_pool_details = {}
+        if not self.params.get("ip_pool_snapshot"):
+            self.all_reserved_pool_details = {}
+
         self.get_have(config)
         self.log("Current State (have): {0}".format(self.have), "INFO")
         self.log("Desired State (want): {0}".format(self.want), "INFO")
@@ -6966,9 +7279,19 @@ def main():
         "config_verify": {"type": "bool", "default": False},
         "dnac_api_task_timeout": {"type": "int", "default": 1200},
         "dnac_task_poll_interval": {"type": "int", "default": 2},
+        "dnac_task_poll_initial_delay": {"type": "float"},
+        "dnac_task_poll_backoff_factor": {"type": "float"},
+        "dnac_task_poll_max_delay": {"type": "float"},
+        "dnac_task_poll_jitter": {"type": "float"},
+        "dnac_max_workers": {"type": "int"},
+        "dnac_rate_limit": {"type": "float"},
+        "dnac_rate_limit_burst": {"type": "int"},
+        "dnac_rate_limit_retries": {"type": "int"},
+        "dnac_lookup_cache": {"type": "bool"},
         "config": {"type": "list", "required": True, "elements": "dict"},
         "state": {"default": "merged", "choices": ["merged", "deleted"]},
         "validate_response_schema": {"type": "bool", "default": True},
+        "ip_pool_snapshot": {"type": "bool", "default": False},
     }
 
     # Create an AnsibleModule object with argument specifications
@@ -613,7 +613,6 @@ response_3:
       "msg": String
     }
 """
-import time
 import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
@@ -1049,6 +1048,7 @@ class Provision(DnacBase):
         """
         result = False
         params = {"task_id": task_id}
+        poller = self.get_task_poller("provision")
         while True:
             response = self.dnac_apply["exec"](
                 family="task", function="get_task_by_id", params=params
@@ -1083,9 +1083,18 @@ class Provision(DnacBase):
             ) or "deleted successfully" in response.get("progress"):
 
                 result = True
+                poller.done()
                 break
 
-            time.sleep(3)
+            if poller.is_timed_out():
+                msg = "Provision task with id {0} has not completed in {1} seconds - Progress: {2}".format(
+                    task_id, poller.timeout, response.get("progress")
+                )
+                self.log(msg, "CRITICAL")
+                self.module.fail_json(msg=msg)
+                return False
+
+            poller.wait()
         self.result.update(dict(provision_task=response))
         return result
 
@@ -1107,6 +1116,7 @@ class Provision(DnacBase):
         """
         result = False
         params = {"execution_id": execution_id}
+        poller = self.get_task_poller("provision")
         while True:
             response = self.dnac_apply["exec"](
                 family="task",
@@ -1142,9 +1152,18 @@ class Provision(DnacBase):
 
             if response.get("status") == "SUCCESS":
                 result = True
+                poller.done()
                 break
 
-            time.sleep(3)
+            if poller.is_timed_out():
+                msg = "Wireless provisioning execution with id {0} has not completed in {1} seconds - Status: {2}".format(
+                    execution_id, poller.timeout, response.get("status")
+                )
+                self.log(msg, "CRITICAL")
+                self.module.fail_json(msg=msg)
+                return False
+
+            poller.wait()
         self.result.update(dict(assignment_task=response))
         return result
 
@@ -2558,7 +2577,11 @@ class Provision(DnacBase):
             success_msg.append(re_prov_success_msg)
             self.re_provision_wired_device.append(reprovision_needed)
 
-        if provision_params:
+        if len(provision_params) > 100 and self.compare_dnac_versions(self.get_ccc_version(), "2.3.5.3") > 0:
+            success_msg.extend(
+                self.provision_wired_device_batches(provision_params, provision_needed)
+            )
+        elif provision_params:
             for i in range(0, len(provision_params), 100):
                 batch_params = provision_params[i : i + 100]
                 batch_devices = provision_needed[i : i + 100]
@@ -2584,6 +2607,97 @@ class Provision(DnacBase):
         self.log("Bulk wired device provisioning process completed.", "INFO")
         return self
 
+    def provision_wired_device_batches(self, provision_params, device_ips, batch_size=100):
+        """
+        Submits all the wired provisioning batches and then waits on their tasks together.
+
+        Args:
+            provision_params (list): The 'provision_devices' payload items, one per device.
+            device_ips (list): The management IP addresses matching 'provision_params'.
+            batch_size (int): The number of devices provisioned by one 'provision_devices' call.
+
+        Returns:
+            list: The success messages of the provisioned batches.
+
+        Description:
+            Instead of waiting on each batch before submitting the next one, all the batches are
+            submitted first and their task IDs are polled with a single loop, so the total wait is the
+            one of the slowest batch. The operation fails if any of the batches fails.
+        """
+
+        batch_devices_by_task_id = {}
+        for i in range(0, len(provision_params), batch_size):
+            batch_params = provision_params[i : i + batch_size]
+            batch_devices = device_ips[i : i + batch_size]
+            self.log(
+                "Provisioning of the device(s) - {0} with the param - {1}".format(
+                    batch_devices, batch_params
+                ),
+                "INFO",
+            )
+            task_id, response = None, None
+            try:
+                response = self.dnac._exec(
+                    family="sda",
+                    function="provision_devices",
+                    op_modifies=True,
+                    params={"payload": batch_params},
+                )
+                self.log(
+                    "Received API response from 'provision_devices': {0}".format(
+                        str(response)
+                    ),
+                    "DEBUG",
+                )
+                task_id = response.get("response", {}).get("taskId")
+            except Exception as e:
+                self.msg = "Error in provisioning device '{0}' due to {1}".format(
+                    batch_devices, str(e)
+                )
+                self.set_operation_result(
+                    "failed", False, self.msg, "ERROR"
+                ).check_return_status()
+
+            if not task_id:
+                self.msg = "Error in provisioning device '{0}' due to {1}".format(
+                    batch_devices, response
+                )
+                self.set_operation_result(
+                    "failed", False, self.msg, "ERROR"
+                ).check_return_status()
+
+            batch_devices_by_task_id[task_id] = batch_devices
+
+        success_msg, failure_msg = [], []
+        watcher = self.watch_tasks(
+            list(batch_devices_by_task_id), "provision_device", require_end_time=False
+        )
+        for task_id, status, task_details in watcher.watch():
+            batch_devices = batch_devices_by_task_id[task_id]
+            if status == "SUCCESS":
+                self.provisioned_wired_device.append(batch_devices)
+                success_msg.append(
+                    "Provisioning of the device(s) '{0}' completed successfully.".format(
+                        batch_devices
+                    )
+                )
+            else:
+                fail_reason = (task_details or {}).get("failureReason") or status
+                failure_msg.append(
+                    "Error in provisioned device '{0}' due to {1}".format(
+                        batch_devices, fail_reason
+                    )
+                )
+
+        if failure_msg:
+            self.msg = failure_msg
+            self.set_operation_result(
+                "failed", bool(success_msg), self.msg, "ERROR"
+            ).check_return_status()
+
+        self.result["changed"] = True
+        return success_msg
+
     def get_device_type(self):
         """
         Classifies devices as 'wired' or 'wireless' based on their family type from the Cisco DNA Center API.
@@ -4326,6 +4440,15 @@ def main():
         "config_verify": {"type": "bool", "default": False},
         "dnac_api_task_timeout": {"type": "int", "default": 1200},
         "dnac_task_poll_interval": {"type": "int", "default": 2},
+        "dnac_task_poll_initial_delay": {"type": "float"},
+        "dnac_task_poll_backoff_factor": {"type": "float"},
+        "dnac_task_poll_max_delay": {"type": "float"},
+        "dnac_task_poll_jitter": {"type": "float"},
+        "dnac_max_workers": {"type": "int"},
+        "dnac_rate_limit": {"type": "float"},
+        "dnac_rate_limit_burst": {"type": "int"},
+        "dnac_rate_limit_retries": {"type": "int"},
+        "dnac_lookup_cache": {"type": "bool"},
         "validate_response_schema": {"type": "bool", "default": True},
         "config": {"required": True, "type": "list", "elements": "dict"},
         "state": {"default": "merged", "choices": ["merged", "deleted"]},
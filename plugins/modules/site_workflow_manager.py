@@ -35,6 +35,17 @@ options:
         operations have been successfully completed in Cisco Catalyst Center.
     type: bool
     default: false
+  bulk_site_pipeline:
+    description:
+      - Set to true to run the bulk site operations of Catalyst Center version 2.3.7.6 and above as a pipeline.
+      - The existing sites are retrieved once with a paginated 'get_sites' call and indexed by
+        their name hierarchy, instead of looking every site of the playbook up one by one.
+      - The sites to create are ordered by type (area, building, floor) and depth, and sent in bulk
+        requests of at most 100 sites, each one completing before the next is sent.
+      - The floor images of the created floors are uploaded concurrently, up to the
+        'dnac_max_workers' parameter or the DNAC_MAX_WORKERS environment variable.
+    type: bool
+    default: false
   state:
     description:
       - Defines the intended state of the sites after module execution.
@@ -567,6 +578,7 @@ floor_plan = {
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
+    WorkerFailure,
     validate_list_of_dicts,
     get_dict_result,
     validate_str
@@ -575,6 +587,9 @@ from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
 import os
 import copy
 
+# Largest number of sites sent in one 'create_sites' request when 'bulk_site_pipeline' is enabled
+BULK_SITE_CHUNK_SIZE = 100
+
 
 class Site(DnacBase):
     """Class containing member attributes for Site workflow_manager module"""
@@ -586,6 +601,7 @@ class Site(DnacBase):
         self.deleted_site_list, self.site_absent_list = [], []
         self.keymap = {}
         self.handle_config = {}
+        self.site_snapshot = None
 
     def validate_input(self):
         """
@@ -853,7 +869,7 @@ class Site(DnacBase):
 
         if self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.6") >= 0:
             sites = None
-            response = self.get_site(site_name_hierarchy)
+            response = self.lookup_site(site_name_hierarchy)
             self.log("Raw response from get_site: {}".format(response), "DEBUG")
 
             if not response:
@@ -897,6 +913,74 @@ class Site(DnacBase):
 
         return site_exists, current_site
 
+    def get_site_snapshot(self):
+        """
+        Retrieve all the sites once and index them by their name hierarchy.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+        Returns:
+            dict: The site details keyed by 'nameHierarchy'.
+        Description:
+            The sites are read with the paginated 'get_sites' API, with the pages after the
+            first one fetched concurrently when 'dnac_max_workers' allows it. The snapshot is
+            kept until 'invalidate_site_snapshot' is called after sites were created or updated.
+        """
+        if self.site_snapshot is not None:
+            return self.site_snapshot
+
+        limit = 500
+        offset = 1
+        all_sites = []
+        while True:
+            response = self.execute_get_request("site_design", "get_sites", {"offset": offset, "limit": limit})
+            sites = (response or {}).get("response") or []
+            all_sites.extend(sites)
+            if len(sites) < limit:
+                break
+
+            if self.get_max_workers() > 1:
+                total = self.get_api_count("site_design", "get_sites_count")
+                if total is not None:
+                    def fetch_page(page_offset):
+                        page = self.execute_get_request("site_design", "get_sites", {"offset": page_offset, "limit": limit})
+                        return (page or {}).get("response") or []
+
+                    all_sites.extend(self.fetch_pages_concurrently(fetch_page, offset, limit, total))
+                    break
+
+            offset += limit
+
+        self.site_snapshot = dict(
+            (site.get("nameHierarchy"), site) for site in all_sites if isinstance(site, dict)
+        )
+        self.log("Indexed {0} site(s) of the Cisco Catalyst Center by name hierarchy.".format(
+            len(self.site_snapshot)), "INFO")
+        return self.site_snapshot
+
+    def invalidate_site_snapshot(self):
+        """
+        Drop the site snapshot so the next lookup retrieves the sites again.
+        """
+        self.site_snapshot = None
+
+    def lookup_site(self, site_name_hierarchy):
+        """
+        Retrieve the details of a site, from the site snapshot when 'bulk_site_pipeline' is enabled.
+        Parameters:
+            site_name_hierarchy (str): The name hierarchy of the site.
+        Returns:
+            dict or None: The same response as 'get_site', None when the site does not exist.
+        """
+        if not self.params.get("bulk_site_pipeline"):
+            return self.get_site(site_name_hierarchy)
+
+        site = self.get_site_snapshot().get(site_name_hierarchy)
+        if not site:
+            self.log("Site '{0}' not found in the site snapshot.".format(site_name_hierarchy), "DEBUG")
+            return None
+
+        return {"response": [site]}
+
     def get_parent_id(self, parent_name):
         """
         Retrieve the ID of the parent site in Cisco Catalyst Center.
@@ -1246,7 +1330,7 @@ class Site(DnacBase):
                             "site_exists": False
                         }
 
-                        response = self.get_site(have["site_name_hierarchy"])
+                        response = self.lookup_site(have["site_name_hierarchy"])
                         self.log("Raw response from get_site: {}".format(response), "DEBUG")
 
                         if not response:
@@ -1849,6 +1933,9 @@ class Site(DnacBase):
             - For floor sites, attempts to upload the floor map if an upload path is provided.
             - If a floor map upload fails, logs an error message. If no upload path is provided, logs that no floor map was uploaded.
         """
+        if self.params.get("bulk_site_pipeline"):
+            return self.process_bulk_site_pipeline(process_config)
+
         self.log("Initiating bulk site creation for {0} sites.".format(
             len(process_config)), "INFO")
         response = self.creating_bulk_site(process_config)
@@ -1910,6 +1997,117 @@ class Site(DnacBase):
         self.log("Bulk site creation process completed successfully.", "INFO")
         return True
 
+    def get_site_depth(self, site):
+        """
+        Return the depth of a site payload in the site hierarchy, 'Global' being at depth zero.
+        """
+        parent_hierarchy = site.get(self.keymap["parent_name_hierarchy"]) or site.get(self.keymap["parent_name"]) or ""
+        return len([name for name in parent_hierarchy.split("/") if name])
+
+    def process_bulk_site_pipeline(self, process_config):
+        """
+        Create sites in depth ordered bulk requests and upload the floor images concurrently.
+
+        Args:
+            process_config (list): A list of dictionaries, where each dictionary contains details for creating a site.
+
+        Returns:
+            bool: True if all sites were created successfully, False if a bulk request failed.
+
+        Details:
+            - The sites are sorted by type (area, building, floor) and then by depth, so parents
+              are always created before their children, and sent in chunks of BULK_SITE_CHUNK_SIZE.
+            - Each chunk waits for its 'create_sites' task before the next one is sent. When a task
+              fails the module fails right away, listing the sites of the chunks already created,
+              and neither the remaining chunks nor the floor images are sent. The sites are added
+              to 'created_site_list' once every chunk succeeded.
+            - Once all the sites exist, the site snapshot is refreshed once and the floor images
+              are uploaded on the worker pool. The upload failures are collected and the module
+              fails once all the uploads have finished.
+        """
+        type_order = {"area": 0, "building": 1, "floor": 2}
+        ordered_sites = sorted(
+            process_config,
+            key=lambda site: (type_order.get(site.get("type"), len(type_order)), self.get_site_depth(site))
+        )
+        chunks = [
+            ordered_sites[index:index + BULK_SITE_CHUNK_SIZE]
+            for index in range(0, len(ordered_sites), BULK_SITE_CHUNK_SIZE)
+        ]
+        self.log("Initiating bulk site creation for {0} sites in {1} request(s).".format(
+            len(ordered_sites), len(chunks)), "INFO")
+
+        created_sites = []
+        for chunk_index, chunk in enumerate(chunks, start=1):
+            response = self.creating_bulk_site(chunk)
+            self.log("Response from creating_bulk_site for chunk {0}/{1}: {2}".format(
+                chunk_index, len(chunks), response), "DEBUG")
+            if not response or not isinstance(response, dict):
+                self.log("Invalid response received from creating_bulk_site.", "ERROR")
+                return False
+
+            task_id = response.get("response", {}).get("taskId")
+            if not task_id:
+                self.log("Failed to retrieve task ID for site creation.", "ERROR")
+                return False
+
+            self.log("Task Id for the 'site_creation' task of chunk {0}/{1}: {2}".format(
+                chunk_index, len(chunks), task_id), "INFO")
+            self.get_task_status_from_tasks_by_id(task_id, "create_sites", "Site created successfully.", True)
+            if self.status == "failed":
+                self.msg = "Failed to create the sites of bulk request {0}/{1}: {2} Sites created: {3}".format(
+                    chunk_index, len(chunks), self.msg, [site.get("name") for site in created_sites]
+                )
+                self.fail_and_exit(self.msg)
+
+            created_sites.extend(site for site in chunk if site.get("name"))
+
+        self.created_site_list.extend("{0}: {1}".format(site, site.get("name")) for site in created_sites)
+        self.invalidate_site_snapshot()
+        floors_with_image = [
+            site for site in ordered_sites
+            if site.get("type") == "floor" and site.get("upload_floor_image_path")
+        ]
+        if floors_with_image:
+            self.log("Uploading the floor maps of {0} floor(s).".format(len(floors_with_image)), "INFO")
+            self.get_site_snapshot()
+            upload_results = self.run_concurrently(self.upload_floor_image_or_error, floors_with_image)
+            upload_errors = {}
+            for site, ((map_details, map_status, success_message), error) in zip(floors_with_image, upload_results):
+                if error:
+                    upload_errors[site.get("name")] = error
+                elif map_details:
+                    self.log("Floor map for '{0}' uploaded successfully: {1}".format(
+                        site.get("name"), success_message), "INFO")
+                else:
+                    self.log("Floor map upload failed for '{0}'. Please check the upload path and retry.".
+                             format(site.get("name")), "ERROR")
+
+            if upload_errors:
+                self.msg = "Failed to upload the floor map(s) {0}. Sites created: {1}".format(
+                    upload_errors, [site.get("name") for site in created_sites]
+                )
+                self.fail_and_exit(self.msg)
+
+        self.log("Bulk site creation process completed successfully.", "INFO")
+        return True
+
+    def upload_floor_image_or_error(self, config):
+        """
+        Upload a floor image, returning the reason of a failure instead of failing the module.
+
+        Args:
+            config (dict): The floor site payload, including the file path of the floor image.
+
+        Returns:
+            tuple: The (map_details, map_status, success_message) returned by 'upload_floor_image'
+                   and the failure message, None when the upload did not fail the module.
+        """
+        try:
+            return self.run_as_worker(self.upload_floor_image, config), None
+        except WorkerFailure as error:
+            return (None, None, None), error.msg
+
     def get_diff_merged(self, config):
         """
         Update/Create site information in Cisco Catalyst Center with fields
@@ -2571,6 +2769,8 @@ class Site(DnacBase):
         """
         try:
             if self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.6") >= 0:
+                # The sites were created or updated since the snapshot was taken
+                self.invalidate_site_snapshot()
                 self.get_have(config)
                 config_count = len(config)
                 site_exist_list = [
@@ -2634,6 +2834,8 @@ class Site(DnacBase):
             It validates whether the specified site exists in the Catalyst Center configuration.
         """
         if self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.6") >= 0:
+            # The sites were deleted since the snapshot was taken
+            self.invalidate_site_snapshot()
             self.get_have(config)
             config_count = len(config)
             site_not_exist_list = [
@@ -2768,18 +2970,18 @@ class Site(DnacBase):
             self.log("File path extracted from config: {}".format(file_path), "DEBUG")
 
             if not isinstance(file_path, str) or not file_path:
-                msg = "Invalid file path format. It must be a non-empty string."
-                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+                self.msg = "Invalid file path format. It must be a non-empty string."
+                self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
             if not os.path.exists(file_path):
-                msg = "File path does not exist: {0}".format(file_path)
-                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+                self.msg = "File path does not exist: {0}".format(file_path)
+                self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
 
             self.log("File path exists: {0}".format(file_path), "DEBUG")
 
             valid_extensions = ['.png', '.jpg', '.jpeg', '.pdf']
             if not any(file_path.lower().endswith(ext) for ext in valid_extensions):
-                msg = "Unsupported file format. Supported formats: {0}".format(", ".join(valid_extensions))
-                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+                self.msg = "Unsupported file format. Supported formats: {0}".format(", ".join(valid_extensions))
+                self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
 
             if file_path.lower().endswith('.png'):
                 content_type = 'image/png'
@@ -2794,8 +2996,8 @@ class Site(DnacBase):
                 with open(file_path, "rb") as image_file:
                     file_content = image_file.read()
             except IOError as e:
-                msg = "Failed to read file at {0}: {1}".format(file_path, str(e))
-                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+                self.msg = "Failed to read file at {0}: {1}".format(file_path, str(e))
+                self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
 
             multipart_fields = {
                 'image': (os.path.basename(file_path), file_content, content_type)
@@ -2808,8 +3010,8 @@ class Site(DnacBase):
             site_exists, current_site = self.site_exists(site_hierarchy)
             site_id = current_site.get("id")
             if not site_id:
-                msg = "No valid Site found for the site hierarchy {0}".format(site_hierarchy)
-                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+                self.msg = "No valid Site found for the site hierarchy {0}".format(site_hierarchy)
+                self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
 
             try:
                 response = self.dnac._exec(
@@ -2867,8 +3069,18 @@ def main():
                     'dnac_log': {'type': 'bool', 'default': False},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config_verify': {'type': 'bool', "default": False},
+                    'bulk_site_pipeline': {'type': 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_task_poll_initial_delay': {'type': 'float'},
+                    'dnac_task_poll_backoff_factor': {'type': 'float'},
+                    'dnac_task_poll_max_delay': {'type': 'float'},
+                    'dnac_task_poll_jitter': {'type': 'float'},
+                    'dnac_max_workers': {'type': 'int'},
+                    'dnac_rate_limit': {'type': 'float'},
+                    'dnac_rate_limit_burst': {'type': 'int'},
+                    'dnac_rate_limit_retries': {'type': 'int'},
+                    'dnac_lookup_cache': {'type': 'bool'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
@@ -16,6 +16,13 @@ extends_documentation_fragment:
   - cisco.dnac.module
 author: Rafael Campos (@racampos)
 options:
+  fileChecksums:
+    description:
+      - Checksums computed while the file is read for the upload, in a single pass.
+      - The path, size and checksums of the uploaded files are returned in C(uploaded_files).
+    type: list
+    elements: str
+    choices: [md5, sha256]
   filePath:
     description: File absolute path.
     type: str
@@ -75,4 +82,20 @@ dnac_response:
       },
       "version": "string"
     }
+uploaded_files:
+  description:
+    - The files sent in the multipart upload, with their path, size and, when C(fileChecksums) is set, the
+      requested checksums computed while they were streamed.
+  returned: when a file was uploaded
+  type: list
+  elements: dict
+  sample: >
+    [
+      {
+        "field": "file",
+        "path": "/tmp/cat9k_iosxe.17.09.04a.SPA.bin",
+        "size": 1234567890,
+        "sha256": "string"
+      }
+    ]
 """
@@ -510,6 +510,34 @@ options:
             description: Device MAC address where the
               image needs to be distributed
             type: str
+          rollout:
+            description: |
+              Roll the image distribution out to the devices of a site or tag in waves instead of
+              one bulk request. Only used when more than one device is targeted.
+              Each device is triggered on its own and at most 'max_concurrent' devices are
+              distributed to at the same time; the next device starts as soon as one finishes.
+            type: dict
+            suboptions:
+              max_concurrent:
+                description: Maximum number of devices distributed to at the same time.
+                type: int
+                default: 1
+              failure_budget:
+                description: Percentage of the devices allowed to fail or time out. Once
+                  it is exceeded no new device is started and the remaining devices are
+                  reported as skipped.
+                type: float
+              device_timeout:
+                description: Seconds each device is given to complete, counted from the
+                  start of its own task rather than for the whole rollout. Defaults to
+                  'image_distribution_timeout'.
+                type: int
+              state_file:
+                description: Path of a file recording the progress of the rollout. When the
+                  module is run again with the same images, devices already done are skipped
+                  and the tasks still running are watched instead of being triggered again.
+                  The file is removed once all the devices succeeded.
+                type: path
       image_activation_details:
         description: |
           Parameters for specifying the target device(s) for SWIM image activation. The device can be identified using one of the following options:
@@ -690,6 +718,34 @@ options:
               value:
                 description: Feature status (e.g., Enable or Disable)
                 type: str
+          rollout:
+            description: |
+              Roll the image activation out to the devices of a site or tag in waves instead of
+              one bulk request. Only used when more than one device is targeted.
+              Each device is triggered on its own and at most 'max_concurrent' devices are
+              activated on at the same time; the next device starts as soon as one finishes.
+            type: dict
+            suboptions:
+              max_concurrent:
+                description: Maximum number of devices activated on at the same time.
+                type: int
+                default: 1
+              failure_budget:
+                description: Percentage of the devices allowed to fail or time out. Once
+                  it is exceeded no new device is started and the remaining devices are
+                  reported as skipped.
+                type: float
+              device_timeout:
+                description: Seconds each device is given to complete, counted from the
+                  start of its own task rather than for the whole rollout. Defaults to
+                  'image_activation_timeout'.
+                type: int
+              state_file:
+                description: Path of a file recording the progress of the rollout. When the
+                  module is run again with the same images, devices already done are skipped
+                  and the tasks still running are watched instead of being triggered again.
+                  The file is removed once all the devices succeeded.
+                type: path
 
 requirements:
   - dnacentersdk == 2.7.3
@@ -954,6 +1010,29 @@ EXAMPLES = r"""
           device_series_name: Cisco Catalyst 9300 Series
             Switches
 
+- name: Distribute the given image to the devices of a site four at a time,
+    stopping once more than 10 percent of them failed.
+  cisco.dnac.swim_workflow_manager:
+    dnac_host: "{{dnac_host}}"
+    dnac_username: "{{dnac_username}}"
+    dnac_password: "{{dnac_password}}"
+    dnac_verify: "{{dnac_verify}}"
+    dnac_port: "{{dnac_port}}"
+    dnac_version: "{{dnac_version}}"
+    dnac_debug: "{{dnac_debug}}"
+    dnac_log_level: "{{dnac_log_level}}"
+    dnac_log: true
+    config:
+      - image_distribution_details:
+          image_name: cat9k_iosxe.17.12.01.SPA.bin
+          site_name: Global/USA/San Francisco/BGL_18
+          device_family_name: Switches and Hubs
+          rollout:
+            max_concurrent: 4
+            failure_budget: 10
+            device_timeout: 1800
+            state_file: /tmp/bgl_18_distribution.json
+
 - name: Distribute the given image on devices associated with device tag
     to that site with specified role.
   cisco.dnac.swim_workflow_manager:
@@ -1187,11 +1266,16 @@ response:
 
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
+    MultipartUpload,
     validate_list_of_dicts,
     get_dict_result,
 )
 from ansible.module_utils.basic import AnsibleModule
-import os
+from ansible.module_utils.common.validation import (
+    check_type_float,
+    check_type_int,
+    check_type_path,
+)
 import time
 
 
@@ -1239,6 +1323,13 @@ class Swim(DnacBase):
 
         # Validate swim params
         valid_temp, invalid_params = validate_list_of_dicts(self.config, temp_spec)
+        for config in valid_temp:
+            for details_name in ("image_distribution_details", "image_activation_details"):
+                details = config.get(details_name)
+                if isinstance(details, dict) and details.get("rollout") is not None:
+                    details["rollout"] = self.validate_rollout_details(
+                        details["rollout"], details_name, invalid_params
+                    )
 
         if invalid_params:
             self.msg = "Invalid parameters in playbook: {0}".format(invalid_params)
@@ -1255,6 +1346,56 @@ class Swim(DnacBase):
 
         return self
 
+    def validate_rollout_details(self, rollout, details_name, invalid_params):
+        """
+        Validate and convert the 'rollout' suboptions of the image distribution or activation details.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            rollout (dict): The 'rollout' dictionary of the playbook.
+            details_name (str): 'image_distribution_details' or 'image_activation_details'.
+            invalid_params (list): The validation errors, the errors found here are appended to it.
+        Returns:
+            dict: The rollout options converted to their documented types.
+        Description:
+            'max_concurrent' and 'device_timeout' must be integers of at least 1, 'failure_budget' a
+            percentage between 0 and 100 and 'state_file' a path, so the RolloutScheduler is only
+            built with values it can compare and compute with.
+        """
+        if not isinstance(rollout, dict):
+            invalid_params.append("{0}.rollout: {1} : is not a valid dictionary".format(details_name, rollout))
+            return rollout
+
+        suboptions = (
+            ("max_concurrent", check_type_int, 1, None),
+            ("failure_budget", check_type_float, 0, 100),
+            ("device_timeout", check_type_int, 1, None),
+            ("state_file", check_type_path, None, None),
+        )
+        validated_rollout = dict(rollout)
+        for name, check_type, range_min, range_max in suboptions:
+            value = rollout.get(name)
+            if value is None:
+                continue
+
+            param_name = "{0}.rollout.{1}".format(details_name, name)
+            try:
+                value = check_type(value)
+            except TypeError as e:
+                invalid_params.append("{0}: value: {1} {2}".format(param_name, value, str(e)))
+                continue
+
+            if (range_min is not None and value < range_min) or (range_max is not None and value > range_max):
+                invalid_params.append(
+                    "{0}: {1} : The item exceeds the allowed range of min: {2} and max: {3}".format(
+                        param_name, value, range_min, range_max)
+                )
+                continue
+
+            validated_rollout[name] = value
+
+        self.log("Validated rollout options of '{0}': {1}".format(details_name, validated_rollout), "DEBUG")
+        return validated_rollout
+
     def site_exists(self, site_name):
         """
         Parameters:
@@ -1349,6 +1490,10 @@ class Swim(DnacBase):
         """
 
         self.log("Attempting to find image ID for image with name: '{0}'".format(name), "DEBUG")
+        found, image_id = self.get_cached_lookup("image", name)
+        if found:
+            return image_id
+
         try:
             image_response = self.dnac._exec(
                 family="software_image_management_swim",
@@ -1365,6 +1510,7 @@ class Swim(DnacBase):
                 image_id = image_list[0].get("imageUuid")
                 if image_id:
                     self.log("Successfully found SWIM image '{0}' with ID: {1}".format(name, image_id), "INFO")
+                    self.cache_lookup("image", name, image_id)
                     return image_id
                 else:
                     self.log("Image found but missing imageUuid field for '{0}'".format(name), "WARNING")
@@ -2735,14 +2881,6 @@ class Swim(DnacBase):
                         third_party_application_type=self.want.get(
                             "local_import_details"
                         ).get("third_party_application_type"),
-                        multipart_fields={
-                            "file": (
-                                os.path.basename(file_path),
-                                open(file_path, "rb"),
-                                "application/octet-stream",
-                            )
-                        },
-                        multipart_monitor_callback=None,
                     )
                     import_function = "import_local_software_image"
                 else:  # CCO import
@@ -2764,18 +2902,36 @@ class Swim(DnacBase):
 
                 if import_type == "remote" or import_type == "local":
                     try:
-                        response = self.dnac._exec(
-                            family="software_image_management_swim",
-                            function=import_function,
-                            op_modifies=True,
-                            params=import_params,
-                        )
-                        self.log(
-                            "Received API response from {0}: {1}".format(
-                                import_function, str(response)
-                            ),
-                            "DEBUG",
-                        )
+                        with MultipartUpload(
+                            self.get_upload_checksums(),
+                            lambda message: self.log(message, "INFO"),
+                        ) as image_upload:
+                            if import_type == "local":
+                                import_params["multipart_fields"] = {
+                                    "file": image_upload.open(
+                                        "file", file_path, "application/octet-stream"
+                                    )
+                                }
+                                import_params["multipart_monitor_callback"] = (
+                                    image_upload.monitor_callback
+                                )
+                            response = self.dnac._exec(
+                                family="software_image_management_swim",
+                                function=import_function,
+                                op_modifies=True,
+                                params=import_params,
+                            )
+                            self.log(
+                                "Received API response from {0}: {1}".format(
+                                    import_function, str(response)
+                                ),
+                                "DEBUG",
+                            )
+                            if image_upload.files:
+                                self.log(
+                                    "Uploaded image file: {0}".format(image_upload.summary()),
+                                    "INFO",
+                                )
 
                         if (
                             response
@@ -3186,6 +3342,7 @@ class Swim(DnacBase):
                 site_name = tagging_details.get("site_name")
 
             start_time = time.time()
+            poller = self.get_task_poller("golden tagging")
 
             while True:
                 task_details = self.get_task_details(task_id)
@@ -3235,14 +3392,13 @@ class Swim(DnacBase):
                     self.status = "failed"
                     break
 
-                poll_interval = self.params.get("dnac_task_poll_interval")
+                poll_interval = poller.wait()
                 self.log(
-                    "Waiting for the next poll interval of {0} seconds before checking task status again.".format(
+                    "Waited {0:.2f} seconds before checking task status again.".format(
                         poll_interval
                     ),
                     "DEBUG",
                 )
-                time.sleep(poll_interval)
 
             return self
         else:
@@ -3505,6 +3661,10 @@ class Swim(DnacBase):
             with an appropriate error message logged.
         """
 
+        found, device = self.get_cached_lookup("device", ("id", str(device_id).lower()))
+        if found:
+            return device.get("managementIpAddress")
+
         try:
             response = self.dnac._exec(
                 family="devices",
@@ -3520,6 +3680,7 @@ class Swim(DnacBase):
             )
             response = response.get("response")[0]
             device_ip = response.get("managementIpAddress")
+            self.index_device_identities([response])
 
             return device_ip
         except Exception as e:
@@ -3541,39 +3702,26 @@ class Swim(DnacBase):
                 - device_ips_list (list): A list of device IP addresses for which the SWIM task failed.
                 - device_count (int): The count of devices for which the SWIM task was successful.
         Description:
-            This function iterates through the distribution_task_dict, which contains the mapping of
-            device IP address to their respective task ID. It checks the status of the SWIM task for each device by
-            repeatedly querying for task details until the task is either completed successfully or fails. If the task
-            is successful, the device count is incremented. If the task fails, an error message is logged, and the device
-            IP is appended to the device_ips_list and return a tuple containing the device_ips_list and device_count.
+            This function waits on all the task IDs of the distribution_task_dict, which contains the mapping of
+            device IP address to their respective task ID, with a single polling loop until each task is either
+            completed successfully, fails or the timeout is reached. If the task is successful, the device count
+            is incremented. If the task fails, an error message is logged, and the device IP is appended to the
+            device_ips_list and return a tuple containing the device_ips_list and device_count.
         """
 
         device_ips_list = []
         device_count = 0
-
+        device_ips_by_task_id = {}
         for device_ip, task_id in swim_task_dict.items():
-            start_time = time.time()
-
-            while True:
-                end_time = time.time()
-                max_timeout = self.params.get("dnac_api_task_timeout")
+            device_ips_by_task_id.setdefault(task_id, []).append(device_ip)
 
-                if (end_time - start_time) >= max_timeout:
-                    self.log(
-                        """Max timeout of {0} has reached for the task id '{1}' for the device '{2}' and unexpected
-                                 task status so moving out to next task id""".format(
-                            max_timeout, task_id, device_ip
-                        ),
-                        "WARNING",
-                    )
-                    device_ips_list.append(device_ip)
-                    break
-
-                task_details = self.get_task_details(task_id)
-
-                if not task_details.get("isError") and (
-                    "completed successfully" in task_details.get("progress")
-                ):
+        watcher = self.watch_tasks(
+            list(device_ips_by_task_id), swim_task_name, legacy_api=True,
+            progress_validation="completed successfully", require_end_time=False
+        )
+        for task_id, status, task_details in watcher.watch():
+            for device_ip in device_ips_by_task_id[task_id]:
+                if status == "SUCCESS":
                     self.result["changed"] = True
                     self.status = "success"
                     self.log(
@@ -3583,17 +3731,22 @@ class Swim(DnacBase):
                         "INFO",
                     )
                     device_count += 1
-                    break
-
-                if task_details.get("isError"):
+                elif status == "TIMEOUT":
+                    self.log(
+                        """Max timeout of {0} has reached for the task id '{1}' for the device '{2}' and unexpected
+                                 task status so moving out to next task id""".format(
+                            self.params.get("dnac_api_task_timeout"), task_id, device_ip
+                        ),
+                        "WARNING",
+                    )
+                    device_ips_list.append(device_ip)
+                else:
                     error_msg = "Image {0} gets failed for the device '{1}'".format(
                         swim_task_name, device_ip
                     )
                     self.log(error_msg, "ERROR")
                     self.result["response"] = task_details
                     device_ips_list.append(device_ip)
-                    break
-                time.sleep(self.params.get("dnac_task_poll_interval"))
 
         return device_ips_list, device_count
 
@@ -4234,6 +4387,11 @@ class Swim(DnacBase):
             "INFO",
         )
 
+        if distribution_details.get("rollout"):
+            return self.run_swim_rollout(
+                "distribution", distribution_details, device_uuid_list, image_name, image_ids
+            )
+
         distribution_task_dict = {}
         success_distribution_list = []
         failed_distribution_list = []
@@ -4317,39 +4475,15 @@ class Swim(DnacBase):
 
         else:
             # -------- NEW VERSION (Bulk Distribution) -------- #
-            for device_uuid in device_uuid_list:
-                device_ip = self.get_device_ip_from_id(device_uuid)
+            preflight = self.run_swim_preflight(device_uuid_list, image_name, convert_to_wlc)
+            for device_ip in preflight["ineligible"]:
+                device_ip_for_not_elg_list.append(device_ip)
+                self.log("Device {0} is not eligible for image distribution".format(device_ip), "WARNING")
+
+            for device_uuid, device_ip, elg_device_ip, elg_device_uuid in preflight["eligible"]:
                 self.log("Processing device: {0}".format(device_ip), "DEBUG")
                 device_distributed_images = []
 
-                # Initialize variables
-                elg_device_ip = None
-                elg_device_uuid = device_uuid
-
-                if not convert_to_wlc:
-                    self.log(
-                        "Standard mode - performing compliance validation for image '{0}' on device {1}".format(
-                            image_name, device_ip
-                        ),
-                        "DEBUG"
-                    )
-                    self.log("Convert to WLC is set to False", "DEBUG")
-                    elg_device_ip, elg_device_uuid = self.check_device_compliance(device_uuid)
-                else:
-                    self.log(
-                        "WLC conversion mode enabled - bypassing compliance validation "
-                        "for image '{0}' on device {1}".format(image_name, device_ip),
-                        "WARNING"
-                    )
-                    # When convert_to_wlc is True, skip compliance check and use the device as eligible
-                    elg_device_ip = device_ip
-                    elg_device_uuid = device_uuid
-
-                if not elg_device_ip:
-                    device_ip_for_not_elg_list.append(device_ip)
-                    self.log("Device {0} is not eligible for image distribution".format(device_ip), "WARNING")
-                    continue
-
                 for img_name, img_id in image_ids.items():
 
                     self.log("Device {0} is eligible for bulk image distribution of '{1}'".format(elg_device_ip, img_name), "INFO")
@@ -4469,6 +4603,194 @@ class Swim(DnacBase):
 
         return self
 
+    def run_swim_preflight(self, device_uuid_list, image_name, convert_to_wlc=False):
+        """
+        Check which devices are eligible for image distribution or activation, in a single pass.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            device_uuid_list (list): The UUIDs of the devices targeted by the operation.
+            image_name (str): The image being distributed or activated, used for logging.
+            convert_to_wlc (bool): When True, the compliance check is skipped and every device is eligible.
+        Returns:
+            dict: 'eligible' lists (device_uuid, device_ip, elg_device_ip, elg_device_uuid) tuples
+                  in the order of device_uuid_list, 'ineligible' lists the IPs of the other devices.
+        Description:
+            The IP lookup and the image compliance check of every device run on the worker pool
+            of 'run_concurrently' ('dnac_max_workers'), so the whole pre-flight is done before the
+            bulk distribution or activation is triggered. With the lookup cache enabled, the IPs
+            of all the devices are resolved with batched 'get_device_list' calls first.
+        """
+        if len(device_uuid_list) > 1 and self.lookup_cache is not None:
+            self.resolve_devices("id", device_uuid_list)
+
+        def check_device(device_uuid):
+            device_ip = self.get_device_ip_from_id(device_uuid)
+            if convert_to_wlc:
+                self.log(
+                    "WLC conversion mode enabled - bypassing compliance validation "
+                    "for image '{0}' on device {1}".format(image_name, device_ip),
+                    "WARNING"
+                )
+                return device_uuid, device_ip, device_ip, device_uuid
+
+            self.log(
+                "Standard mode - performing compliance validation for image '{0}' on device {1}".format(
+                    image_name, device_ip
+                ),
+                "DEBUG"
+            )
+            elg_device_ip, elg_device_uuid = self.check_device_compliance(device_uuid, image_name)
+            return device_uuid, device_ip, elg_device_ip, elg_device_uuid
+
+        preflight = {"eligible": [], "ineligible": []}
+        for device_uuid, device_ip, elg_device_ip, elg_device_uuid in self.run_concurrently(
+            check_device, device_uuid_list
+        ):
+            if elg_device_ip:
+                preflight["eligible"].append((device_uuid, device_ip, elg_device_ip, elg_device_uuid))
+            else:
+                preflight["ineligible"].append(device_ip)
+
+        self.log(
+            "SWIM pre-flight completed: {0} eligible device(s), not eligible: {1}".format(
+                len(preflight["eligible"]), preflight["ineligible"]
+            ),
+            "INFO",
+        )
+        return preflight
+
+    def run_swim_rollout(self, operation, details, device_uuid_list, image_name, image_ids):
+        """
+        Distribute or activate an image on many devices in waves, as configured by 'rollout'.
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            operation (str): Either 'distribution' or 'activation'.
+            details (dict): The 'image_distribution_details' or 'image_activation_details' of the playbook.
+            device_uuid_list (list): The UUIDs of the devices targeted by the operation.
+            image_name (str): The name of the image being distributed or activated.
+            image_ids (dict): The image names mapped to their IDs, including the sub-package images.
+        Returns:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+        Description:
+            The eligible devices are found with 'run_swim_preflight', then the operation is triggered per
+            device with a RolloutScheduler instead of one bulk call: at most 'max_concurrent' devices are
+            upgraded at the same time, the next device starts as soon as one finishes, a device taking
+            longer than 'device_timeout' seconds is reported as timed out and the rollout stops once more than
+            'failure_budget' percent of the devices failed. With 'state_file', a rerun of the same rollout
+            skips the devices that were already done and resumes watching the running tasks.
+        """
+        rollout = details.get("rollout") or {}
+        convert_to_wlc = details.get("convert_to_wlc", False)
+        preflight = self.run_swim_preflight(device_uuid_list, image_name, convert_to_wlc)
+        device_ip_for_not_elg_list = preflight["ineligible"]
+        eligible = dict((device_id, elg_device_ip) for _uuid, _ip, elg_device_ip, device_id in preflight["eligible"])
+        if not eligible:
+            self.msg = "No eligible devices found for image {0}. Devices not eligible: {1}".format(
+                operation, ", ".join(device_ip_for_not_elg_list) if device_ip_for_not_elg_list else "None"
+            )
+            self.set_operation_result("success", False, self.msg, "INFO")
+            return self
+
+        image_id_list = [img_id for img_id in image_ids.values() if img_id]
+        legacy_flow = self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.9") <= 0
+        network_validation_ids = details.get("network_validation_ids")
+
+        def start(device_id):
+            if legacy_flow and operation == "distribution":
+                function = "trigger_software_image_distribution"
+                params = {"payload": [{"deviceUuid": device_id, "imageUuid": img_id} for img_id in image_id_list]}
+            elif legacy_flow:
+                function = "trigger_software_image_activation"
+                params = {
+                    "schedule_validate": details.get("schedule_validate"),
+                    "payload": [{
+                        "activateLowerImageVersion": details.get("activate_lower_image_version"),
+                        "deviceUpgradeMode": details.get("device_upgrade_mode"),
+                        "distributeIfNeeded": details.get("distribute_if_needed"),
+                        "deviceUuid": device_id,
+                        "imageUuidList": image_id_list,
+                    }],
+                }
+            elif operation == "distribution":
+                function = "distribute_images_on_the_network_device"
+                params = {"id": device_id, "distributedImages": [{"id": img_id} for img_id in image_id_list]}
+            else:
+                function = "update_images_on_the_network_device"
+                params = {"id": device_id, "installedImages": [{"id": img_id} for img_id in image_id_list]}
+                if details.get("compatible_features"):
+                    params["compatibleFeatures"] = details.get("compatible_features")
+
+            if not legacy_flow and network_validation_ids:
+                params["networkValidationIds"] = network_validation_ids
+
+            self.log("Starting image {0} on device {1} with '{2}': {3}".format(
+                operation, eligible[device_id], function, params), "INFO")
+            try:
+                response = self.dnac._exec(
+                    family="software_image_management_swim",
+                    function=function,
+                    op_modifies=True,
+                    params=params,
+                )
+            except Exception as e:
+                self.log("Unable to start image {0} on device {1}: {2}".format(
+                    operation, eligible[device_id], e), "ERROR")
+                return None
+
+            self.log("Received API response from '{0}': {1}".format(function, response), "DEBUG")
+            return ((response or {}).get("response") or {}).get("taskId")
+
+        # Catalyst Center 2.3.7.9 and earlier report the SWIM tasks through 'get_task_by_id' only
+        watch_options = {}
+        if legacy_flow:
+            watch_options = dict(
+                legacy_api=True, progress_validation="completed successfully", require_end_time=False
+            )
+
+        scheduler = self.schedule_rollout(
+            list(eligible), start, task_name="swim_image_" + operation,
+            max_concurrent=rollout.get("max_concurrent"),
+            failure_budget=rollout.get("failure_budget"),
+            task_timeout=rollout.get("device_timeout") or self.max_timeout,
+            state_file=rollout.get("state_file"),
+            run_id="{0}:{1}".format(operation, ",".join(sorted(image_id_list))),
+            **watch_options
+        )
+        results = scheduler.run()
+
+        devices_by_status = {}
+        for device_id, result in results.items():
+            devices_by_status.setdefault(result["status"], []).append(eligible.get(device_id, device_id))
+            if result["status"] != "SUCCESS":
+                self.log("Image {0} on device {1} ended with status '{2}': {3}".format(
+                    operation, eligible.get(device_id, device_id), result["status"], result.get("details")), "WARNING")
+
+        action = "distributed" if operation == "distribution" else "activated"
+        msg_parts = []
+        for status, label in (("SUCCESS", "Successfully {0} '{1}' on".format(action, image_name)),
+                              ("FAILURE", "Failed on"), ("TIMEOUT", "Timed out on"),
+                              ("SKIPPED", "Skipped after the failure budget was exceeded")):
+            if devices_by_status.get(status):
+                msg_parts.append("{0}: {1}".format(label, ", ".join(devices_by_status[status])))
+        if device_ip_for_not_elg_list:
+            msg_parts.append("Devices not eligible for image {0}: {1}".format(
+                operation, ", ".join(device_ip_for_not_elg_list)))
+
+        self.msg = "Image {0} rollout completed. {1}.".format(operation, ". ".join(msg_parts))
+        self.result["rollout"] = devices_by_status
+        succeeded = devices_by_status.get("SUCCESS")
+        if not succeeded:
+            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+            return self
+
+        self.set_operation_result("success", True, self.msg, "INFO")
+        if len(succeeded) == len(results):
+            setattr(self, "complete_successful_" + operation, True)
+        else:
+            setattr(self, "partial_successful_" + operation, True)
+
+        return self
+
     def check_device_compliance(self, device_uuid, image_name=None):
         """
         Check the compliance status of a device's image.
@@ -4841,6 +5163,11 @@ class Swim(DnacBase):
             "INFO",
         )
 
+        if activation_details.get("rollout"):
+            return self.run_swim_rollout(
+                "activation", activation_details, device_uuid_list, image_name, image_ids
+            )
+
         activation_task_dict = {}
         success_activation_list = []
         failed_activation_list = []
@@ -4969,48 +5296,23 @@ class Swim(DnacBase):
             activation_payload_list = []
             device_ip_for_not_elg_list = []
 
-            for device_uuid in device_uuid_list:
-                device_ip = self.get_device_ip_from_id(device_uuid)
-                self.log("Processing device: {0}".format(device_ip), "DEBUG")
-
-                # Aggregate all image ids for this device
-                installed_image_ids = set()
+            # Aggregate all image ids for the devices
+            installed_image_ids = set()
 
-                if image_id_base:
-                    installed_image_ids.add(image_id_base)
+            if image_id_base:
+                installed_image_ids.add(image_id_base)
 
-                for sid in sub_image_ids:
-                    if sid:
-                        installed_image_ids.add(sid)
+            for sid in sub_image_ids:
+                if sid:
+                    installed_image_ids.add(sid)
 
-                # Initialize variables
-                elg_device_ip = None
-                device_id = device_uuid
-
-                if not convert_to_wlc:
-                    self.log(
-                        "Standard mode - performing compliance validation for image '{0}' on device {1}".format(
-                            image_name, device_ip
-                        ),
-                        "DEBUG"
-                    )
-                    self.log("Convert to WLC is set to False", "DEBUG")
-                    elg_device_ip, device_id = self.check_device_compliance(device_uuid, image_name)
-                else:
-                    self.log(
-                        "WLC conversion mode enabled - bypassing compliance validation "
-                        "for image '{0}' on device {1}".format(image_name, device_ip),
-                        "WARNING"
-                    )
-                    # When convert_to_wlc is True, skip compliance check and use the device as eligible
-                    elg_device_ip = device_ip
-                    device_id = device_uuid
-
-                if not elg_device_ip:
-                    self.log("Device not eligible for activation: {0}".format(device_ip), "INFO")
-                    device_ip_for_not_elg_list.append(device_ip)
-                    continue
+            preflight = self.run_swim_preflight(device_uuid_list, image_name, convert_to_wlc)
+            for device_ip in preflight["ineligible"]:
+                self.log("Device not eligible for activation: {0}".format(device_ip), "INFO")
+                device_ip_for_not_elg_list.append(device_ip)
 
+            for device_uuid, device_ip, elg_device_ip, device_id in preflight["eligible"]:
+                self.log("Processing device: {0}".format(device_ip), "DEBUG")
                 device_ips.append(elg_device_ip)
 
                 activation_payload = {}
@@ -5849,6 +6151,15 @@ def main():
                     'config_verify': {'type': 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'dnac_task_poll_initial_delay': {'type': 'float'},
+                    'dnac_task_poll_backoff_factor': {'type': 'float'},
+                    'dnac_task_poll_max_delay': {'type': 'float'},
+                    'dnac_task_poll_jitter': {'type': 'float'},
+                    'dnac_max_workers': {'type': 'int'},
+                    'dnac_rate_limit': {'type': 'float'},
+                    'dnac_rate_limit_burst': {'type': 'int'},
+                    'dnac_rate_limit_retries': {'type': 'int'},
+                    'dnac_lookup_cache': {'type': 'bool'},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
@@ -366,6 +366,16 @@ notes:
     rule_name values are ANDed together.
   - Each device or interface can have a maximum of 500
     tags assigned.
+  - The tags and tag_memberships entries accept a
+    tag_membership_batch_concurrency setting, alongside
+    the network_device_tag_retrieval_batch_size family
+    of settings, to keep up to that many retrieval
+    and update batches in flight at the same time.
+    A failed update batch is then split in halves and
+    retried to isolate the failing members, for at most
+    four rounds. Batches that time out are not retried
+    since their task may still be running, and the
+    splitting stops when every batch of a round fails.
   - |-
     SDK Methods used are tags.Tag.add_members_to_the_tag tags.Tag.create_tag tags.Tag.delete_tag
     devices.Devices.get_device_list devices.Devices.get_interface_details site_design.SiteDesign.get_sites
@@ -989,6 +999,9 @@ from ansible_collections.cisco.dnac.plugins.module_utils.validation import (
 )
 import re
 
+# Rounds in which failed tag membership batches are split in halves and submitted again
+TAG_MEMBERSHIP_MAX_SPLIT_ROUNDS = 4
+
 
 class Tags(DnacBase):
     """Class containing member attributes for tags workflow manager module"""
@@ -1127,6 +1140,12 @@ class Tags(DnacBase):
                     "range_min": 1,
                     "default": 500,
                 },
+                "tag_membership_batch_concurrency": {
+                    "type": "int",
+                    "range_max": 32,
+                    "range_min": 1,
+                    "default": 1,
+                },
             },
             "tag_memberships": {
                 "type": "list",
@@ -1171,6 +1190,12 @@ class Tags(DnacBase):
                     "range_min": 1,
                     "default": 500,
                 },
+                "tag_membership_batch_concurrency": {
+                    "type": "int",
+                    "range_max": 32,
+                    "range_min": 1,
+                    "default": 1,
+                },
             },
         }
 
@@ -1786,6 +1811,9 @@ class Tags(DnacBase):
             "interface_tag_update_batch_size": tag.get(
                 "interface_tag_update_batch_size"
             ),
+            "tag_membership_batch_concurrency": tag.get(
+                "tag_membership_batch_concurrency"
+            ),
         }
 
         self.log(
@@ -3324,8 +3352,8 @@ class Tags(DnacBase):
             len(device_ids) + BATCH_SIZE - 1
         ) // BATCH_SIZE  # Calculate total batches
 
-        for batch_index, i in enumerate(range(0, len(device_ids), BATCH_SIZE), start=1):
-            batch = device_ids[i : i + BATCH_SIZE]
+        def process_batch(batch_job):
+            batch_index, batch = batch_job
 
             self.log(
                 "Processing batch {0}/{1}, Device IDs: {2}".format(
@@ -3359,7 +3387,7 @@ class Tags(DnacBase):
                         ),
                         "DEBUG",
                     )
-                    continue
+                    return
 
                 for device in response:
                     device_id = device.get("id")
@@ -3377,6 +3405,13 @@ class Tags(DnacBase):
                 )
                 self.fail_and_exit(self.msg)
 
+        # Batches touch distinct devices, so they can be in flight at the same time
+        self.run_concurrently(
+            process_batch,
+            enumerate((device_ids[i : i + BATCH_SIZE] for i in range(0, len(device_ids), BATCH_SIZE)), start=1),
+            max_workers=self.TAG_MEMBERSHIP_BATCH_CONCURRENCY,
+        )
+
         self.log(
             "Retrieved tags details from network devices: {0}".format(
                 fetched_tags_details
@@ -3425,10 +3460,8 @@ class Tags(DnacBase):
             len(interface_ids) + BATCH_SIZE - 1
         ) // BATCH_SIZE  # Calculate total batches
 
-        for batch_index, i in enumerate(
-            range(0, len(interface_ids), BATCH_SIZE), start=1
-        ):
-            batch = interface_ids[i : i + BATCH_SIZE]
+        def process_batch(batch_job):
+            batch_index, batch = batch_job
 
             self.log(
                 "Processing batch {0}/{1}, Interface IDs: {2}".format(
@@ -3476,6 +3509,13 @@ class Tags(DnacBase):
                 )
                 self.fail_and_exit(self.msg)
 
+        # Batches touch distinct interfaces, so they can be in flight at the same time
+        self.run_concurrently(
+            process_batch,
+            enumerate((interface_ids[i : i + BATCH_SIZE] for i in range(0, len(interface_ids), BATCH_SIZE)), start=1),
+            max_workers=self.TAG_MEMBERSHIP_BATCH_CONCURRENCY,
+        )
+
         self.log(
             "Retrieved tags details from interfaces: {0}".format(fetched_tags_details),
             "INFO",
@@ -3592,6 +3632,11 @@ class Tags(DnacBase):
         task_name = "update_tags_associated_with_the_network_devices"
 
         BATCH_SIZE = self.NETWORK_DEVICE_TAG_UPDATE_BATCH_SIZE
+        if self.TAG_MEMBERSHIP_BATCH_CONCURRENCY > 1:
+            return self.update_tag_membership_batches_concurrently(
+                task_name, payload, BATCH_SIZE
+            )
+
         start_index = 0
 
         while start_index < len(payload):
@@ -3643,6 +3688,11 @@ class Tags(DnacBase):
 
         task_name = "update_tags_associated_with_the_interfaces"
         BATCH_SIZE = self.INTERFACE_TAG_UPDATE_BATCH_SIZE
+        if self.TAG_MEMBERSHIP_BATCH_CONCURRENCY > 1:
+            return self.update_tag_membership_batches_concurrently(
+                task_name, payload, BATCH_SIZE
+            )
+
         start_index = 0
 
         while start_index < len(payload):
@@ -3675,6 +3725,139 @@ class Tags(DnacBase):
 
         return self
 
+    def update_tag_membership_batches_concurrently(self, task_name, payload, batch_size):
+        """
+        Updates tag memberships with several batches in flight and isolates the failing members.
+
+        Args:
+            task_name (str): The tag API used for the update, for example 'update_tags_associated_with_the_interfaces'.
+            payload (list): A list of members, each with its 'id' and the list of tags to associate with it.
+            batch_size (int): The number of members sent in one API call.
+
+        Returns:
+            self: The instance of the class, allowing for method chaining.
+
+        Description:
+            Submits up to 'TAG_MEMBERSHIP_BATCH_CONCURRENCY' batches at a time and waits for their tasks together.
+            A batch whose task fails is split in halves and the halves are submitted again in the next round, so a
+            single bad member does not fail the whole batch. Splitting stops after TAG_MEMBERSHIP_MAX_SPLIT_ROUNDS
+            rounds, and as soon as every batch of a round with several batches fails, which points to an error
+            common to all the members rather than a bad one. A batch whose task times out is not submitted again
+            since it may still be running in the Cisco Catalyst Center. The members of the batches that are not
+            split are reported with their failure reason once every batch has completed.
+        """
+
+        concurrency = self.TAG_MEMBERSHIP_BATCH_CONCURRENCY
+        batches = [
+            payload[index : index + batch_size]
+            for index in range(0, len(payload), batch_size)
+        ]
+        failed_members = []
+        round_number = 0
+
+        while batches:
+            round_number += 1
+            self.log(
+                "Round {0} of '{1}': submitting {2} batch(es) with up to {3} in flight.".format(
+                    round_number, task_name, len(batches), concurrency
+                ),
+                "INFO",
+            )
+
+            task_ids = self.run_concurrently(
+                lambda batch: self.get_taskid_post_api_call(
+                    "tag", task_name, {"payload": batch}
+                ),
+                batches,
+                max_workers=concurrency,
+            )
+
+            submitted_batches = {}
+            for batch, task_id in zip(batches, task_ids):
+                if not task_id:
+                    self.msg = "Unable to retrieve the task_id for the task '{0}' for the payload {1}.".format(
+                        task_name, batch
+                    )
+                    self.set_operation_result(
+                        "failed", False, self.msg, "ERROR"
+                    ).check_return_status()
+
+                submitted_batches[task_id] = batch
+
+            task_results = self.watch_tasks(
+                list(submitted_batches), task_name, max_workers=concurrency
+            ).wait_all()
+
+            failed_batches = []
+            for task_id, batch in submitted_batches.items():
+                status, task_details = task_results.get(task_id, ("TIMEOUT", None))
+                if status == "SUCCESS":
+                    self.log(
+                        "Task '{0}' updated the tags of {1} member(s) successfully.".format(
+                            task_id, len(batch)
+                        ),
+                        "INFO",
+                    )
+                    continue
+
+                failed_batches.append((task_id, batch, status, task_details))
+
+            round_failed = len(submitted_batches) > 1 and len(failed_batches) == len(submitted_batches)
+            if round_failed:
+                self.log(
+                    "Every batch of round {0} of '{1}' failed, the failed batches are not split further.".format(
+                        round_number, task_name
+                    ),
+                    "WARNING",
+                )
+
+            batches = []
+            for task_id, batch, status, task_details in failed_batches:
+                if status == "TIMEOUT":
+                    failure_reason = (
+                        "The task '{0}' did not complete in time and may still be running in the "
+                        "Cisco Catalyst Center".format(task_id)
+                    )
+                else:
+                    failure_reason = (task_details or {}).get("failureReason") or status
+
+                if (len(batch) > 1 and status != "TIMEOUT" and not round_failed
+                        and round_number <= TAG_MEMBERSHIP_MAX_SPLIT_ROUNDS):
+                    middle = len(batch) // 2
+                    self.log(
+                        "Task '{0}' for {1} member(s) ended with status '{2}', retrying the batch in two halves.".format(
+                            task_id, len(batch), status
+                        ),
+                        "WARNING",
+                    )
+                    batches.extend([batch[:middle], batch[middle:]])
+                    continue
+
+                for member in batch:
+                    self.log(
+                        "Unable to update the tags of the member '{0}': {1}".format(
+                            member.get("id"), failure_reason
+                        ),
+                        "ERROR",
+                    )
+                    failed_members.append(
+                        {"id": member.get("id"), "failure_reason": failure_reason}
+                    )
+
+        if failed_members:
+            self.msg = "Unable to update the tags of {0} member(s) using '{1}' in the Cisco Catalyst Center: {2}".format(
+                len(failed_members), task_name, failed_members
+            )
+            self.set_operation_result(
+                "failed", False, self.msg, "ERROR"
+            ).check_return_status()
+
+        self.msg = "Updated the tags of {0} member(s) using '{1}' successfully in the Cisco Catalyst Center".format(
+            len(payload), task_name
+        )
+        self.set_operation_result("success", True, self.msg, "INFO")
+        return self
+
     def updating_network_device_tag_memberships(
         self, network_device_details, new_tags_details
     ):
@@ -4946,6 +5129,9 @@ class Tags(DnacBase):
         self.INTERFACE_TAG_UPDATE_BATCH_SIZE = tag_data_config.get(
             "interface_tag_update_batch_size"
         )
+        self.TAG_MEMBERSHIP_BATCH_CONCURRENCY = (
+            tag_data_config.get("tag_membership_batch_concurrency") or 1
+        )
 
         self.log(
             "NETWORK_DEVICE_TAG_RETRIEVAL_BATCH_SIZE: {0}".format(
@@ -4971,6 +5157,12 @@ class Tags(DnacBase):
             ),
             "INFO",
         )
+        self.log(
+            "TAG_MEMBERSHIP_BATCH_CONCURRENCY: {0}".format(
+                self.TAG_MEMBERSHIP_BATCH_CONCURRENCY
+            ),
+            "INFO",
+        )
         return self
 
     def process_tag_merged(self, tag):
@@ -5946,6 +6138,15 @@ def main():
         "config_verify": {"type": "bool", "default": False},
         "dnac_api_task_timeout": {"type": "int", "default": 1200},
         "dnac_task_poll_interval": {"type": "int", "default": 2},
+        "dnac_task_poll_initial_delay": {"type": "float"},
+        "dnac_task_poll_backoff_factor": {"type": "float"},
+        "dnac_task_poll_max_delay": {"type": "float"},
+        "dnac_task_poll_jitter": {"type": "float"},
+        "dnac_max_workers": {"type": "int"},
+        "dnac_rate_limit": {"type": "float"},
+        "dnac_rate_limit_burst": {"type": "int"},
+        "dnac_rate_limit_retries": {"type": "int"},
+        "dnac_lookup_cache": {"type": "bool"},
         "config": {"required": True, "type": "list", "elements": "dict"},
         "state": {"default": "merged", "choices": ["merged", "deleted"]},
     }
@@ -16,6 +16,17 @@ else:
 from ansible.module_utils.basic import env_fallback
 from ansible.module_utils.common.text.converters import to_native
 from ansible.utils.display import Display
+from ansible_collections.cisco.dnac.plugins.plugin_utils.exceptions import (
+    InconsistentParameters,
+)
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac_client import (
+    DNAC_RATE_LIMIT_RETRIES,
+    MultipartUpload,
+    call_with_rate_limit,
+    create_dnac_api,
+    create_rate_limiter,
+    get_cached_dnac_api,
+)
 
 display = Display()
 
@@ -25,17 +36,39 @@ except ImportError:
     LOGGING_IN_STANDARD = False
 else:
     LOGGING_IN_STANDARD = True
+import functools
+import hashlib
+import inspect
+import os
 import os.path
 
 ANSIBLE_SUCCESS_STATUS = 200
-
-
-def is_list_complex(x):
-    return isinstance(x[0], dict) or isinstance(x[0], list)
-
-
-def has_diff_elem(ls1, ls2):
-    return any((elem not in ls1 for elem in ls2))
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def canonical_fingerprint(value):
+    """
+    Build a hashable, order-insensitive fingerprint of a nested value.
+
+    Dicts become sorted tuples of (key, fingerprint) pairs and lists become
+    sorted tuples of element fingerprints, so two values produce the same
+    fingerprint when they only differ in dict key order or list order.
+    Scalars are tagged by kind so mixed-type lists can still be sorted.
+    """
+    if isinstance(value, dict):
+        return ("d", tuple(sorted(
+            (canonical_fingerprint(k), canonical_fingerprint(v))
+            for k, v in value.items()
+        )))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ("l", tuple(sorted(canonical_fingerprint(item) for item in value)))
+    if value is None:
+        return ("z", 0)
+    if isinstance(value, (bool, int, float)):
+        return ("n", value)
+    if isinstance(value, str):
+        return ("s", value)
+    return ("o", repr(value))
 
 
 def compare_list(list1, list2):
@@ -47,23 +80,11 @@ def compare_list(list1, list2):
     if len_list1 == 0:
         return True
 
-    attempt_std_cmp = list1 == list2
-    if attempt_std_cmp:
+    if list1 == list2:
         return True
 
-    if not is_list_complex(list1) and not is_list_complex(list2):
-        return set(list1) == set(list2)
-
-    # Compare normally if it exceeds expected size * 2 (len_list1==len_list2)
-    MAX_SIZE_CMP = 100
-    # Fail fast if elem not in list, thanks to any and generators
-    if len_list1 > MAX_SIZE_CMP:
-        return attempt_std_cmp
-    else:
-        # not changes 'has diff elem' to list1 != list2 ':lists are not equal'
-        has_diff_1 = has_diff_elem(list1, list2)
-        has_diff_2 = has_diff_elem(list2, list1)
-        return not has_diff_1 or not has_diff_2
+    # Multiset equality on canonical fingerprints, O(n log n) at any size
+    return canonical_fingerprint(list1) == canonical_fingerprint(list2)
 
 
 def fn_comp_key(k, dict1, dict2):
@@ -145,6 +166,56 @@ def get_dict_result(result, key, value, cmp_fn=simple_cmp):
     return result
 
 
+def name_payload_is_partial(prev_obj, requested_obj):
+    """
+    Tell whether an object returned by a name (list) lookup lacks any of the
+    requested attributes, in which case it cannot be used for the update
+    comparison and has to be fetched again by ID.
+    """
+    return any(
+        key not in prev_obj
+        for key, value in requested_obj.items()
+        if value is not None
+    )
+
+
+def resolve_existing_object(crud_obj, id_key="id", name_key="name"):
+    """
+    Existence check shared by the generated CRUD action plugin classes.
+
+    Looks the object up by ID first and by name otherwise, keeping the
+    object that was fetched instead of requesting it again. The object
+    found by name is only refetched by ID when its list payload is missing
+    attributes that were requested. The resolved ID is stored on
+    crud_obj.new_object so update() and delete() do not look it up again.
+
+    Returns a (it_exists, prev_obj) tuple, like the exists() methods.
+    """
+    id_exists = False
+    name_exists = False
+    prev_obj = None
+    o_id = crud_obj.new_object.get(id_key)
+    name = crud_obj.new_object.get(name_key)
+    if o_id:
+        prev_obj = crud_obj.get_object_by_id(o_id)
+        id_exists = prev_obj is not None and isinstance(prev_obj, dict)
+    if not id_exists and name:
+        prev_obj = crud_obj.get_object_by_name(name)
+        name_exists = prev_obj is not None and isinstance(prev_obj, dict)
+    if name_exists:
+        _id = prev_obj.get(id_key)
+        if id_exists and name_exists and o_id != _id:
+            raise InconsistentParameters(
+                "The 'id' and 'name' params don't refer to the same object"
+            )
+        if _id:
+            crud_obj.new_object.update({id_key: _id})
+            if name_payload_is_partial(prev_obj, crud_obj.new_object):
+                prev_obj = crud_obj.get_object_by_id(_id)
+    it_exists = prev_obj is not None and isinstance(prev_obj, dict)
+    return (it_exists, prev_obj)
+
+
 def dnac_argument_spec():
     argument_spec = dict(
         dnac_host=dict(
@@ -179,6 +250,26 @@ def dnac_argument_spec():
             fallback=(env_fallback, ["VALIDATE_RESPONSE_SCHEMA"]),
             default=True,
         ),
+        dnac_session_cache=dict(
+            type="bool", fallback=(env_fallback, ["DNAC_SESSION_CACHE"]), default=False
+        ),
+        dnac_session_cache_dir=dict(
+            type="str", fallback=(env_fallback, ["DNAC_SESSION_CACHE_DIR"])
+        ),
+        dnac_rate_limit=dict(
+            type="float", fallback=(env_fallback, ["DNAC_RATE_LIMIT"])
+        ),
+        dnac_rate_limit_burst=dict(
+            type="int", fallback=(env_fallback, ["DNAC_RATE_LIMIT_BURST"])
+        ),
+        dnac_rate_limit_retries=dict(
+            type="int",
+            fallback=(env_fallback, ["DNAC_RATE_LIMIT_RETRIES"]),
+            default=DNAC_RATE_LIMIT_RETRIES,
+        ),
+        dnac_paginate=dict(type="bool", default=False),
+        dnac_page_size=dict(type="int"),
+        dnac_max_items=dict(type="int"),
     )
     return argument_spec
 
@@ -192,17 +283,18 @@ class DNACSDK(object):
         )
         self.result = dict(changed=False, result="")
         self.validate_response_schema = params.get("validate_response_schema")
+        self.paginate = params.get("dnac_paginate")
+        self.page_size = params.get("dnac_page_size")
+        self.max_items = params.get("dnac_max_items")
+        self.rate_limiter = self.create_rate_limiter(params)
+        self.rate_limit_retries = params.get("dnac_rate_limit_retries")
+        if self.rate_limit_retries is None:
+            self.rate_limit_retries = DNAC_RATE_LIMIT_RETRIES
         if DNAC_SDK_IS_INSTALLED:
-            self.api = api.DNACenterAPI(
-                username=params.get("dnac_username"),
-                password=params.get("dnac_password"),
-                base_url="https://{dnac_host}:{dnac_port}".format(
-                    dnac_host=params.get("dnac_host"), dnac_port=params.get("dnac_port")
-                ),
-                version=params.get("dnac_version"),
-                verify=params.get("dnac_verify"),
-                debug=params.get("dnac_debug"),
-            )
+            if params.get("dnac_session_cache"):
+                self.api = self.get_cached_api(params)
+            else:
+                self.api = self.create_api(params)
             if params.get("dnac_debug") and LOGGING_IN_STANDARD:
                 logging.getLogger("dnacentersdk").addHandler(logging.StreamHandler())
         else:
@@ -210,6 +302,50 @@ class DNACSDK(object):
                 msg="DNA Center Python SDK is not installed. Execute 'pip install dnacentersdk'"
             )
 
+    def create_rate_limiter(self, params):
+        """Return the shared token bucket of the controller, or None when no rate is set."""
+        return create_rate_limiter(
+            params.get("dnac_host"),
+            params.get("dnac_port"),
+            params.get("dnac_rate_limit"),
+            params.get("dnac_rate_limit_burst"),
+        )
+
+    def create_api(self, params):
+        return create_dnac_api(params)
+
+    def call_with_rate_limit(self, func, *args, **kwargs):
+        """Call an SDK function through the controller rate limiter, retrying HTTP 429 and 503 responses."""
+
+        def log_retry(status_code, retry_after, attempt, max_retries):
+            display.vvv(
+                "HTTP {0} received, retrying in {1} seconds (attempt {2} of {3})".format(
+                    status_code, retry_after, attempt, max_retries
+                )
+            )
+
+        return call_with_rate_limit(
+            func,
+            args,
+            kwargs,
+            rate_limiter=self.rate_limiter,
+            max_retries=self.rate_limit_retries,
+            log_retry=log_retry,
+        )
+
+    def rate_limited(self, func):
+        """Wrap an SDK function so every call goes through call_with_rate_limit."""
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            return self.call_with_rate_limit(func, *args, **kwargs)
+
+        return call
+
+    def get_cached_api(self, params):
+        """Return a DNACenterAPI that reuses the session and token of earlier tasks."""
+        return get_cached_dnac_api(params, params.get("dnac_session_cache_dir"))
+
     def changed(self):
         self.result["changed"] = True
 
@@ -251,31 +387,43 @@ class DNACSDK(object):
     def exec(self, family, function, params=None, op_modifies=False, **kwargs):
         try:
             family = getattr(self.api, family)
-            func = getattr(family, function)
+            sdk_func = getattr(family, function)
+            func = self.rate_limited(sdk_func)
         except Exception as e:
             self.fail_json(msg=e)
 
         try:
             if params:
                 file_paths_params = kwargs.get("file_paths", [])
-                # This substitution is for the import file operation
-                if file_paths_params and isinstance(file_paths_params, list):
-                    multipart_fields = {}
-                    for key, value in file_paths_params:
-                        if isinstance(params.get(key), str) and self.is_file(
-                            params[key]
-                        ):
-                            file_name = self.extract_file_name(params[key])
-                            file_path = params[key]
-                            multipart_fields[value] = (file_name, open(file_path, "rb"))
-
-                    params.setdefault("multipart_fields", multipart_fields)
-                    params.setdefault("multipart_monitor_callback", None)
-
-                if not self.validate_response_schema and op_modifies:
-                    params["active_validation"] = False
-
-                response = func(**params)
+                # This substitution is for the import file operation, the files are
+                # streamed by the SDK multipart encoder and closed once the call returns
+                with MultipartUpload(kwargs.get("checksums"), display.vvv) as upload:
+                    if file_paths_params and isinstance(file_paths_params, list):
+                        multipart_fields = {}
+                        for key, value in file_paths_params:
+                            if isinstance(params.get(key), str) and self.is_file(
+                                params[key]
+                            ):
+                                multipart_fields[value] = upload.open(value, params[key])
+
+                        params.setdefault("multipart_fields", multipart_fields)
+                        params.setdefault(
+                            "multipart_monitor_callback", upload.monitor_callback
+                        )
+
+                    if upload.files:
+                        func = self.rate_limited(upload.rewinding(sdk_func))
+
+                    if not self.validate_response_schema and op_modifies:
+                        params["active_validation"] = False
+
+                    if self.paginate and not op_modifies:
+                        response = self.exec_all_pages(func, params)
+                    else:
+                        response = func(**params)
+
+                if upload.files:
+                    self.result["uploaded_files"] = upload.summary()
 
                 self.result.update(
                     {
@@ -297,6 +445,161 @@ class DNACSDK(object):
             response = None
         return response
 
+    def get_pagination_style(self, arguments):
+        """Return 'offset' or 'cursor' when an SDK function with these arguments can be paged."""
+        if "cursor" in arguments:
+            return "cursor"
+        if "offset" in arguments:
+            return "offset"
+        return None
+
+    def exec_all_pages(self, func, params):
+        """
+        Call a paged GET API until every page (or max_items items) was read.
+
+        The offset or cursor style is detected from the SDK function arguments, and
+        'offset' and 'limit' are only sent to functions that accept them. Without
+        dnac_page_size or limit, no limit is sent and the API uses its own page size.
+        Pages are requested until one comes back empty, so an API capping the limit
+        below the requested page size is still read completely; a page identical to
+        the previous one also stops the loop, for APIs that ignore the offset.
+        The items of each page are appended to the list of the first response,
+        so the result has the same shape as a single page with all the items.
+        """
+        try:
+            arguments = inspect.signature(func).parameters
+        except (TypeError, ValueError):
+            arguments = {}
+        style = self.get_pagination_style(arguments)
+        if style is None:
+            return func(**params)
+
+        params = dict(params)
+        page_size = self.page_size or params.get("limit")
+        if page_size and self.max_items:
+            page_size = min(page_size, self.max_items)
+        if page_size and "limit" in arguments:
+            params["limit"] = page_size
+        if style == "offset":
+            params["offset"] = params.get("offset") or 1
+
+        first_response = response = func(**params)
+        page = self.get_page_items(first_response)
+        if page is None:
+            return first_response
+
+        items = list(page)
+        while page and not (self.max_items and len(items) >= self.max_items):
+            if style == "offset":
+                params["offset"] += len(page)
+            else:
+                cursor = (response.get("page") or {}).get("cursor") if isinstance(response, dict) else None
+                if not cursor:
+                    break
+                params["cursor"] = cursor
+            response = func(**params)
+            next_page = self.get_page_items(response) or []
+            if next_page == page:
+                break
+            page = next_page
+            items.extend(page)
+
+        if self.max_items:
+            del items[self.max_items:]
+        if isinstance(first_response, dict):
+            first_response = dict(first_response, response=items)
+            first_response.pop("page", None)
+            return first_response
+        return items
+
+    def get_page_items(self, response):
+        """Return the item list of one page, None when the response is not a list of items."""
+        if isinstance(response, list):
+            return response
+        if isinstance(response, dict) and isinstance(response.get("response"), list):
+            return response.get("response")
+        return None
+
+    def download_file(self, resource_path, dest, filename=None, checksum=None, headers=None):
+        """
+        Stream the body of a GET download to a local file instead of loading it in memory.
+
+        The body is written in DOWNLOAD_CHUNK_SIZE chunks to a temporary file that is
+        renamed once complete, and the optional checksum ('md5', 'sha1' or 'sha256')
+        is computed on the same chunks. When dest is a directory, the file is named
+        after filename or the Content-Disposition header of the response.
+        Returns the metadata of the file: filename, dirpath, path, size and checksum.
+        """
+        session = getattr(self.api, "_session", None)
+        try:
+            response = self.call_with_rate_limit(
+                session.request,
+                "GET",
+                resource_path,
+                ANSIBLE_SUCCESS_STATUS,
+                0,
+                stream=True,
+                headers=headers,
+            )
+        except exceptions.dnacentersdkException as e:
+            self.fail_json(
+                msg=(
+                    "An error occured when downloading the file."
+                    " The error was: {error}"
+                ).format(error=to_native(e)),
+                status=getattr(e, "status_code", None),
+            )
+            return None
+
+        with response:
+            dest = os.path.expanduser(dest)
+            if os.path.isdir(dest):
+                content_disposition = response.headers.get("Content-Disposition")
+                if not filename and content_disposition:
+                    filename = session.get_filename(content_disposition)
+                dest = os.path.join(dest, filename or os.path.basename(resource_path))
+            file_hash = hashlib.new(checksum) if checksum else None
+            size = 0
+            tmp_path = "{0}.{1}.part".format(dest, os.getpid())
+            try:
+                with open(tmp_path, "wb") as dest_file:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if not chunk:
+                            continue
+                        dest_file.write(chunk)
+                        size += len(chunk)
+                        if file_hash is not None:
+                            file_hash.update(chunk)
+                os.replace(tmp_path, dest)
+            except (IOError, OSError) as e:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                self.fail_json(
+                    msg="Unable to write the downloaded file to {0}: {1}".format(
+                        dest, to_native(e)
+                    )
+                )
+                return None
+
+        self.result.update(
+            {
+                "status": ANSIBLE_SUCCESS_STATUS,
+                "failed": False,
+                "msg": None,
+            }
+        )
+        downloaded_file = dict(
+            filename=os.path.basename(dest),
+            dirpath=os.path.dirname(os.path.abspath(dest)),
+            path=dest,
+            size=size,
+            content_type=response.headers.get("Content-Type"),
+        )
+        if file_hash is not None:
+            downloaded_file["checksum"] = file_hash.hexdigest()
+            downloaded_file["checksum_algorithm"] = checksum
+        return downloaded_file
+
     def fail_json(self, msg, **kwargs):
         self.result.update(
             {
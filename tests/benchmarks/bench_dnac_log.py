@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2026, Cisco Systems
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Micro-benchmark of DnacBase.log.
+
+Compares the current DnacBase.log, with the API response passed as a '%' argument, against
+the previous implementation, where the caller formatted the response up front and the
+caller's frame was found through inspect.stack().
+
+Run it from the directory holding 'ansible_collections', for example:
+
+    PYTHONPATH=/path/to/collections python ansible_collections/cisco/dnac/tests/benchmarks/bench_dnac_log.py
+
+The timings depend on the machine; the ratios between the two columns are what matters.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import inspect
+import json
+import logging
+import timeit
+
+from ansible_collections.cisco.dnac.plugins.module_utils.dnac import DnacBase
+
+
+class BenchmarkBase(DnacBase):
+    """DnacBase with only the attributes used by log(), no SDK connection is made."""
+
+    def __init__(self, dnac_log, logger):
+        self.dnac_log = dnac_log
+        self.logger = logger
+
+    def legacy_log(self, message, level="WARNING", frameIncrement=0):
+        """The DnacBase.log implementation before lazy formatting, kept for comparison."""
+        if self.dnac_log:
+            class_name = self.__class__.__name__
+            callerframerecord = inspect.stack()[1 + frameIncrement]
+            frame = callerframerecord[0]
+            info = inspect.getframeinfo(frame)
+            log_message = " %s: %s: %s: %s \n" % (class_name, info.function, info.lineno, message)
+            log_method = getattr(self.logger, level.lower())
+            log_method(log_message)
+
+
+def build_payload(size):
+    """A device list response with 'size' entries."""
+    return {
+        "response": [
+            {
+                "id": "device-{0}".format(index),
+                "hostname": "switch-{0}.example.com".format(index),
+                "managementIpAddress": "10.{0}.{1}.{2}".format(index // 65536, (index // 256) % 256, index % 256),
+                "platformId": "C9300-48U",
+                "softwareVersion": "17.9.4",
+                "reachabilityStatus": "Reachable",
+            }
+            for index in range(size)
+        ],
+        "version": "1.0",
+    }
+
+
+def get_logger(name, level):
+    logger = logging.getLogger("bench_dnac_log." + name)
+    logger.handlers = [logging.NullHandler()]
+    logger.propagate = False
+    logger.setLevel(level)
+    return logger
+
+
+def time_per_call(func, number):
+    """Best of three runs, in microseconds per call."""
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payload-size", type=int, default=2000, help="Number of devices in the logged response.")
+    parser.add_argument("--number", type=int, default=20, help="Calls timed per run.")
+    args = parser.parse_args()
+
+    payload = build_payload(args.payload_size)
+
+    scenarios = [
+        (
+            "dnac_log false",
+            BenchmarkBase(False, get_logger("disabled", logging.DEBUG)),
+            "DEBUG",
+            True,
+        ),
+        (
+            "DEBUG below WARNING level",
+            BenchmarkBase(True, get_logger("warning", logging.WARNING)),
+            "DEBUG",
+            True,
+        ),
+        (
+            "short message emitted",
+            BenchmarkBase(True, get_logger("debug", logging.DEBUG)),
+            "INFO",
+            False,
+        ),
+    ]
+
+    print("DnacBase.log, {0}-item response payload, microseconds per call".format(args.payload_size))
+    print("{0:<28}{1:>14}{2:>14}".format("scenario", "previous", "current"))
+    for name, base, level, with_payload in scenarios:
+        if with_payload:
+            def previous():
+                base.legacy_log("Received API response: {0}".format(json.dumps(payload, indent=4)), level)
+
+            def current():
+                base.log("Received API response: %s", level, payload)
+        else:
+            def previous():
+                base.legacy_log("Task completed successfully.", level)
+
+            def current():
+                base.log("Task completed successfully.", level)
+
+        print("{0:<28}{1:>14.1f}{2:>14.1f}".format(
+            name, time_per_call(previous, args.number), time_per_call(current, args.number)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Copyright (c) 2026 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.cisco.dnac.plugins.modules import discovery_workflow_manager
+from .dnac_module import TestDnacModule, loadPlaybookData
+
+
+class TestDnacDiscoveryWorkflowManager(TestDnacModule):
+
+    module = discovery_workflow_manager
+
+    test_data = loadPlaybookData("discovery_workflow_manager")
+
+    def _build_discovery(self, responses):
+        discovery = self.module.Discovery.__new__(self.module.Discovery)
+        discovery.validated_config = [{"poll_discovery_by_id": True}]
+        discovery.discovered_devices = []
+        discovery.result = {}
+        discovery.log = lambda *args, **kwargs: None
+        discovery.dnac_apply = {"exec": MagicMock(side_effect=responses)}
+        return discovery
+
+    def test_discovery_workflow_manager_poll_refreshes_device_status(self):
+        """
+        Test case for the devices of a discovery tracked with 'poll_discovery_by_id'.
+
+        A device retrieved while the discovery is running is reported again with its
+        reachability once the discovery is complete, together with the devices of the
+        following pages.
+        """
+        discovery = self._build_discovery([
+            self.test_data.get("discovered_devices_running_page"),
+            self.test_data.get("discovered_devices_empty_page"),
+            self.test_data.get("discovered_devices_completed_first_page"),
+            self.test_data.get("discovered_devices_completed_second_page"),
+            self.test_data.get("discovered_devices_empty_page"),
+        ])
+        with patch.object(self.module, "DISCOVERED_DEVICES_PAGE_SIZE", 1):
+            streamed = list(discovery.stream_discovered_devices("discovery-1"))
+            result = discovery.get_discovery_device_info(discovery_id="discovery-1")
+
+        self.assertEqual([device.get("reachabilityStatus") for device in streamed], ["In Progress"])
+        self.assertTrue(result)
+        devices = discovery.result.get("discovery_device_info")
+        self.assertEqual(
+            [(device.get("managementIpAddress"), device.get("reachabilityStatus"),
+              device.get("inventoryReachabilityStatus")) for device in devices],
+            [("204.1.2.1", "Success", "Reachable"), ("204.1.2.2", "Unreachable", "Unreachable")]
+        )
+        self.assertEqual(discovery.discovered_devices, devices)
+        start_indexes = [
+            call.kwargs["params"]["start_index"]
+            for call in discovery.dnac_apply["exec"].call_args_list
+        ]
+        self.assertEqual(start_indexes, [1, 2, 1, 2, 3])
@@ -16,7 +16,7 @@
 from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from ansible_collections.cisco.dnac.plugins.modules import network_compliance_workflow_manager
 from .dnac_module import TestDnacModule, set_module_args, loadPlaybookData
 
@@ -173,6 +173,33 @@ class TestNetworkCompliance(TestDnacModule):
             result.get('msg')
         )
 
+# Run full compliance using an IP Address list in pipelined batches
+    def test_run_compliance_with_iplist_pipelined(self):
+        config = [
+            dict(item, run_compliance_max_in_flight=2, run_compliance_adaptive_batch_size=True)
+            for item in self.test_data.get("playbook_config_run_compliance_iplist")
+        ]
+
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_log=False,
+                dnac_log_level="DEBUG",
+                dnac_version="2.3.7.9",
+                config_verify=True,
+                dnac_log_append=False,
+                state="merged",
+                config=config
+            )
+        )
+        result = self.execute_module(changed=True, failed=False)
+        self.assertIn(
+            "Run Compliance Check Succeeded for following device(s)",
+            result.get('msg')
+        )
+
 # Run full compliance using site name
     def test_run_compliance_with_site(self):
         print("Test Data: {test_data}".format(test_data=self.test_data.get("playbook_config_run_compliance_site")))
@@ -268,3 +295,56 @@ class TestNetworkCompliance(TestDnacModule):
             "Sync Device Configuration Succeeded for following device(s)",
             result.get('msg')
         )
+
+# Run compliance in adaptive pipelined batches, the batch size shrinks on slow batches and grows back
+    def test_run_compliance_pipelined_adaptive_batch_size_recovers(self):
+        compliance = self.module.NetworkCompliance.__new__(self.module.NetworkCompliance)
+        compliance.want = {
+            "run_compliance_max_in_flight": 2,
+            "run_compliance_adaptive_batch_size": True,
+            "run_compliance_params": {},
+            "mgmt_ip_to_instance_id_map": {},
+        }
+        compliance.dnac_version = 2
+        compliance.version_2_3_5_3 = 1
+        compliance.log = lambda *args, **kwargs: None
+        compliance.get_max_workers = lambda: 1
+        compliance.get_task_poller = lambda task_name: MagicMock(timeout=3600)
+        compliance.collect_compliance_details = lambda params, ip_map: (
+            dict((device_id, []) for device_id in params["deviceUuids"]), params["deviceUuids"]
+        )
+
+        clock = {"now": 0.0, "rounds": 0}
+        running = {}
+        submitted_sizes = []
+        in_flight = []
+
+        def submit(family, function, params):
+            task_id = "task-{0}".format(len(submitted_sizes))
+            running[task_id] = params["deviceUuids"]
+            submitted_sizes.append(len(params["deviceUuids"]))
+            in_flight.append(len(running))
+            return task_id
+
+        def poll(task_ids):
+            # The first three rounds take four times the target latency, the next ones a thirtieth of it
+            clock["rounds"] += 1
+            clock["now"] += 1200 if clock["rounds"] <= 3 else 10
+            for task_id in task_ids:
+                running.pop(task_id)
+            return [(task_id, {"status": "SUCCESS"}) for task_id in task_ids]
+
+        watcher = MagicMock()
+        watcher.poll.side_effect = poll
+        watcher.get_completion_status.side_effect = lambda task_details: task_details["status"]
+        compliance.watch_tasks = lambda *args, **kwargs: watcher
+        compliance.get_taskid_post_api_call = submit
+
+        device_uuids = ["device-{0}".format(index) for index in range(40)]
+        with patch.object(self.module, "time", MagicMock(time=lambda: clock["now"])):
+            result = compliance.run_compliance_pipelined({"deviceUuids": device_uuids}, 8)
+
+        self.assertEqual(submitted_sizes, [8, 8, 4, 4, 2, 2, 1, 1, 2, 2, 4, 2])
+        self.assertLessEqual(max(in_flight), 2)
+        self.assertEqual(sorted(result["successful_devices"]), sorted(device_uuids))
+        self.assertEqual(sorted(result["compliance_report"]), sorted(device_uuids))
@@ -18,6 +18,11 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import copy
+import json
+import os
+import shutil
+import tempfile
 from unittest.mock import patch
 
 from ansible_collections.cisco.dnac.plugins.modules import network_devices_info_workflow_manager
@@ -345,6 +350,40 @@ class TestDnacNetworkDevicesInfoWorkflowManager(TestDnacModule):
             ],
         )
 
+    def test_network_devices_info_workflow_manager_playbook_device_info_jsonl_append(self):
+        """
+        Test appending device information to a JSON Lines file.
+        Validates that the new records are added after the existing ones, one JSON document per line.
+        """
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
+        file_path = os.path.join(output_dir, "device_info")
+        with open(file_path + ".jsonl", "w") as existing_file:
+            existing_file.write(json.dumps({"previous": "run"}) + "\n")
+
+        config = copy.deepcopy(self.playbook_device_info)
+        config[0]["network_devices"][0]["output_file_info"] = {
+            "file_path": file_path,
+            "file_format": "jsonl",
+            "file_mode": "a",
+        }
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_log=True,
+                state="gathered",
+                dnac_version="2.3.7.9",
+                config=config
+            )
+        )
+        result = self.execute_module(changed=False, failed=False)
+        with open(file_path + ".jsonl") as jsonl_file:
+            records = [json.loads(line) for line in jsonl_file]
+        self.assertEqual(records[0], {"previous": "run"})
+        self.assertEqual(records[1:], result.get("response"))
+
     def test_network_devices_info_workflow_manager_playbook_linecard_info(self):
         """
         Test retrieving line card information for network devices.
@@ -11518,7 +11557,7 @@ class TestDnacNetworkDevicesInfoWorkflowManager(TestDnacModule):
         print(result)
         self.assertEqual(
             result.get("response"),
-            "'file_format' must be one of: json, yaml"
+            "'file_format' must be one of: json, jsonl, yaml"
         )
 
     def test_network_devices_info_workflow_manager_playbook_negative_scenario8(self):
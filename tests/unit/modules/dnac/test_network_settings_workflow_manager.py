@@ -425,6 +425,12 @@ class TestDnacNetworkSettings(TestDnacModule):
                 self.test_data.get("Global_Pool_2")
             ]
 
+        if "ip_pool_snapshot" in self._testMethodName:
+            self.run_dnac_exec.side_effect = [
+                self.test_data.get("Global_Pool1"),
+                self.test_data.get("Global_Pool_1")
+            ]
+
         if "device_controlability_updation" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
                 self.test_data.get("get_device_controlability"),
@@ -1052,6 +1058,32 @@ class TestDnacNetworkSettings(TestDnacModule):
 
         )
 
+    def test_Network_settings_workflow_manager_global_pool_lookup_ip_pool_snapshot(self):
+        """
+        Test case for network settings workflow manager when the global pools are looked up from the IP pool snapshot.
+
+        This test case checks that all the global pools of the playbook are resolved from a single retrieval.
+        """
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_log=True,
+                state="merged",
+                config_verify=True,
+                dnac_version="2.3.5.3",
+                ip_pool_snapshot=True,
+                config=self.playbook_global_pool_updation
+            )
+        )
+        result = self.execute_module(changed=False, failed=True)
+        self.assertEqual(
+            result["response"][0].get("globalPool").get("msg"),
+            {'Global_Pool2': "Global pool doesn't require an update", 'Global_Pool3': "Global pool doesn't require an update"}
+        )
+        self.assertEqual(self.run_dnac_exec.call_count, 2)
+
     def test_Network_settings_workflow_manager_global_pool_deletion(self):
         """
         Test case for site workflow manager when creating a site.
@@ -79,6 +79,27 @@ class TestDnacSiteWorkflow(TestDnacModule):
             self.run_dnac_exec.side_effect = [
             ]
 
+        elif "playbook_config_bulk_site_pipeline_failed_chunk" in self._testMethodName:
+            self.run_dnac_exec.side_effect = [
+                self.test_data.get("get_sites"),
+                self.test_data.get("create_bulk_site_response"),
+                self.test_data.get("create_bulk_site_response_details2"),
+                self.test_data.get("create_bulk_site_response"),
+                self.test_data.get("create_bulk_site_response_failed_details"),
+                self.test_data.get("create_bulk_site_task_details_failed"),
+                self.test_data.get("create_bulk_site_task_tree_failed"),
+            ]
+
+        elif "playbook_config_bulk_site_pipeline" in self._testMethodName:
+            self.run_dnac_exec.side_effect = [
+                self.test_data.get("get_sites"),
+                self.test_data.get("create_bulk_site_response"),
+                self.test_data.get("create_bulk_site_response_details1"),
+                self.test_data.get("create_bulk_site_response_details2"),
+                self.test_data.get("get_sites3"),
+                self.test_data.get("upload_floor_image"),
+            ]
+
         elif "playbook_config_bulk_site_2376" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
                 self.test_data.get("get_sites"),
@@ -300,6 +321,62 @@ class TestDnacSiteWorkflow(TestDnacModule):
             result.get('msg')
         )
 
+    def test_Site_workflow_manager_playbook_config_bulk_site_pipeline(self):
+        """
+        Test case for verifying bulk site creation with 'bulk_site_pipeline' in Cisco Catalyst Center (version 2.3.7.6).
+
+        This test ensures that the existing sites are looked up from a single site snapshot and that the area,
+        building and floor are created in one bulk request.
+        """
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_version="2.3.7.6",
+                dnac_log=True,
+                state="merged",
+                config_verify=True,
+                bulk_site_pipeline=True,
+                config=self.playbook_config_bulk_site_2376
+            )
+        )
+        result = self.execute_module(changed=True, failed=False)
+        self.assertEqual(self.run_dnac_exec.call_count, 5)
+        self.assertIn(
+            "created successfully in Cisco Catalyst Center.",
+            result.get('msg')
+        )
+
+    def test_Site_workflow_manager_playbook_config_bulk_site_pipeline_failed_chunk(self):
+        """
+        Test case for a failed 'create_sites' task in the middle of a 'bulk_site_pipeline' run.
+
+        With one site per bulk request, the area is created, the task of the building fails and the module
+        must stop there: the floor is not sent, no floor map is uploaded and only the area is reported as created.
+        """
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_version="2.3.7.6",
+                dnac_log=True,
+                state="merged",
+                config_verify=True,
+                bulk_site_pipeline=True,
+                config=self.playbook_config_bulk_site_2376
+            )
+        )
+        with patch.object(site_workflow_manager, "BULK_SITE_CHUNK_SIZE", 1):
+            result = self.execute_module(changed=False, failed=True)
+        self.assertEqual(self.run_dnac_exec.call_count, 7)
+        self.assertEqual(
+            result.get('msg'),
+            "Failed to create the sites of bulk request 2/3: Parent site Global/bangalore1 of building s1 is locked. "
+            "Sites created: ['bangalore1']"
+        )
+
     def test_Site_workflow_manager_non_create_bulk_site(self):
         """
         Test case for site workflow manager when site creation fails.
@@ -36,6 +36,7 @@ class TestswimWorkflowManager(TestDnacModule):
     playbook_multiple_image_distribution_1 = test_data.get("playbook_multiple_image_distribution_1")
     playbook_sub_package_images = test_data.get("playbook_sub_package_images")
     playbook_sub_package_images_with_api_task_timeout = test_data.get("playbook_sub_package_images_with_api_task_timeout")
+    playbook_invalid_rollout = test_data.get("playbook_invalid_rollout")
 
     def setUp(self):
         super(TestswimWorkflowManager, self).setUp()
@@ -576,3 +577,30 @@ class TestswimWorkflowManager(TestDnacModule):
             result.get('msg'),
             "All eligible images activated successfully on the devices 204.1.2.1."
         )
+
+    def test_swim_workflow_manager_playbook_invalid_rollout(self):
+        """
+        Test SWIM workflow manager's validation of the rollout options.
+
+        This test verifies that rollout options of the wrong type or out of range are
+        reported as invalid playbook parameters before any image is activated.
+        """
+
+        set_module_args(
+            dict(
+                dnac_version='2.3.7.9',
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_log=True,
+                state="merged",
+                config=self.playbook_invalid_rollout
+            )
+        )
+        result = self.execute_module(changed=False, failed=True)
+        self.assertIn("image_activation_details.rollout.failure_budget: value: ten", result.get('msg'))
+        self.assertIn(
+            "image_activation_details.rollout.device_timeout: 0 : The item exceeds the allowed range of min: 1",
+            result.get('msg')
+        )
+        self.assertNotIn("max_concurrent", result.get('msg'))
@@ -612,3 +612,109 @@ class TestDnacTagsWorkflow(TestDnacModule):
         self.assertFalse(
             result, f"Serial number '{invalid_short}' should be invalid (too short)"
         )
+
+    def _update_tag_membership_batches(self, outcome, member_count, batch_size):
+        """Run the concurrent tag membership update with the batch outcomes decided by 'outcome'."""
+        from unittest.mock import Mock
+        from ansible_collections.cisco.dnac.plugins.modules.tags_workflow_manager import (
+            Tags,
+        )
+
+        mock_module = Mock()
+        mock_module.params = {
+            "dnac_host": "1.1.1.1",
+            "dnac_username": "dummy",
+            "dnac_password": "dummy",
+            "dnac_version": "2.3.7.9",
+            "dnac_log": False,
+            "state": "merged",
+            "config": [],
+        }
+        mock_module.fail_json.side_effect = Exception("fail_json")
+        tags_obj = Tags(mock_module)
+        tags_obj.TAG_MEMBERSHIP_BATCH_CONCURRENCY = 2
+
+        submitted = {}
+
+        def submit(family, function, parameters):
+            task_id = "task-{0}".format(len(submitted))
+            submitted[task_id] = [member["id"] for member in parameters["payload"]]
+            return task_id
+
+        def watch_tasks(task_ids, task_name, **kwargs):
+            watcher = Mock()
+            watcher.wait_all.return_value = dict(
+                (task_id, outcome(submitted[task_id])) for task_id in task_ids
+            )
+            return watcher
+
+        tags_obj.get_taskid_post_api_call = submit
+        tags_obj.watch_tasks = watch_tasks
+        payload = [{"id": "member-{0}".format(index), "tags": [{"id": "tag-1"}]} for index in range(member_count)]
+        try:
+            tags_obj.update_tag_membership_batches_concurrently(
+                "update_tags_associated_with_the_network_devices", payload, batch_size
+            )
+        except Exception as e:
+            self.assertEqual(str(e), "fail_json")
+
+        return tags_obj, list(submitted.values())
+
+    def test_tag_membership_batches_split_to_isolate_a_failing_member_case_17(self):
+        """A failed batch is split in halves until the failing member is isolated."""
+
+        def outcome(batch):
+            if "member-3" in batch:
+                return ("FAILURE", {"failureReason": "Member member-3 does not exist"})
+            return ("SUCCESS", {})
+
+        tags_obj, submitted = self._update_tag_membership_batches(outcome, 4, 4)
+        self.assertEqual(submitted, [
+            ["member-0", "member-1", "member-2", "member-3"],
+            ["member-0", "member-1"], ["member-2", "member-3"],
+            ["member-2"], ["member-3"],
+        ])
+        self.assertEqual(tags_obj.status, "failed")
+        self.assertIn("Unable to update the tags of 1 member(s)", tags_obj.msg)
+        self.assertIn("'id': 'member-3', 'failure_reason': 'Member member-3 does not exist'", tags_obj.msg)
+
+    def test_tag_membership_batches_split_rounds_capped_case_18(self):
+        """Failed batches are no longer split once TAG_MEMBERSHIP_MAX_SPLIT_ROUNDS is reached."""
+
+        def outcome(batch):
+            if "member-7" in batch:
+                return ("FAILURE", {"failureReason": "Member member-7 does not exist"})
+            return ("SUCCESS", {})
+
+        with patch.object(tags_workflow_manager, "TAG_MEMBERSHIP_MAX_SPLIT_ROUNDS", 1):
+            tags_obj, submitted = self._update_tag_membership_batches(outcome, 8, 8)
+
+        self.assertEqual(len(submitted), 3)
+        self.assertEqual(tags_obj.status, "failed")
+        self.assertIn("Unable to update the tags of 4 member(s)", tags_obj.msg)
+        self.assertNotIn("member-3", tags_obj.msg)
+
+    def test_tag_membership_batches_fail_fast_when_a_round_fails_case_19(self):
+        """Batches are not split when every batch of a round fails."""
+
+        def outcome(batch):
+            return ("FAILURE", {"failureReason": "Tag tag-1 does not exist"})
+
+        tags_obj, submitted = self._update_tag_membership_batches(outcome, 8, 4)
+        self.assertEqual(len(submitted), 2)
+        self.assertEqual(tags_obj.status, "failed")
+        self.assertIn("Unable to update the tags of 8 member(s)", tags_obj.msg)
+
+    def test_tag_membership_batches_timeout_not_resubmitted_case_20(self):
+        """A batch whose task timed out is reported without being split or submitted again."""
+
+        def outcome(batch):
+            if "member-0" in batch:
+                return ("TIMEOUT", None)
+            return ("SUCCESS", {})
+
+        tags_obj, submitted = self._update_tag_membership_batches(outcome, 8, 4)
+        self.assertEqual(len(submitted), 2)
+        self.assertEqual(tags_obj.status, "failed")
+        self.assertIn("Unable to update the tags of 4 member(s)", tags_obj.msg)
+        self.assertIn("may still be running", tags_obj.msg)